@@ -0,0 +1,114 @@
+"""
+Backend Cache Module
+Two-tier data cache for the dashboard: public backend data (backend list, status,
+calibrations) is identical for every user and is fetched once and shared across all
+sessions, while job data stays private to each credential's quantum manager.
+"""
+
+import hashlib
+import threading
+import time
+
+
+def credential_key(token, crn=None):
+    """
+    Derive a stable, non-reversible key for a set of IBM Quantum credentials.
+
+    Args:
+        token (str): IBM Quantum API token
+        crn (str): Optional IBM Cloud instance CRN
+
+    Returns:
+        str: Hex digest used to partition private per-user data
+    """
+    material = f"{(token or '').strip()}|{(crn or '').strip()}"
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()[:16]
+
+
+class PublicBackendCache:
+    """Process-wide cache of public backend data shared by every session"""
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # Serializes fetches so concurrent sessions wait for one fetch instead of each calling IBM
+        self._fetch_lock = threading.Lock()
+        self._backends = []
+        self._calibrations = {}
+        self._fetched_at = 0.0
+        self.fetch_count = 0
+        self._listeners = []  # callables notified with (backends, calibrations) after each refresh
+
+    def add_listener(self, callback):
+        """Register callback(backends, calibrations) to run after every refresh"""
+        self._listeners.append(callback)
+
+    def is_fresh(self):
+        """Check whether the cached backend data is younger than the TTL"""
+        return self._fetched_at > 0 and (time.time() - self._fetched_at) < self.ttl
+
+    def get(self, fetch, force=False):
+        """
+        Get cached backend data, refreshing it through fetch() when stale.
+
+        Args:
+            fetch (callable): Returns (backend_list, calibrations_by_name) from IBM Quantum
+            force (bool): Refresh even if the cached data is still fresh
+
+        Returns:
+            tuple: (list of backend dicts, dict of calibration dicts keyed by backend name)
+        """
+        if not force and self.is_fresh():
+            return self._snapshot()
+
+        with self._fetch_lock:
+            # Another session may have refreshed the data while we were waiting
+            if not force and self.is_fresh():
+                return self._snapshot()
+
+            backends, calibrations = fetch()
+            with self._lock:
+                self._backends = list(backends)
+                self._calibrations = dict(calibrations)
+                self._fetched_at = time.time()
+                self.fetch_count += 1
+            print(f"✅ Public backend cache refreshed: {len(self._backends)} backends")
+            self._notify(backends, calibrations)
+
+        return self._snapshot()
+
+    def get_backends(self, fetch, force=False):
+        """Get the shared backend list, fetching it at most once per TTL"""
+        return self.get(fetch, force)[0]
+
+    def get_calibration(self, backend_name, fetch):
+        """Get the shared calibration data for a single backend"""
+        return self.get(fetch)[1].get(backend_name)
+
+    def invalidate(self):
+        """Force the next read to refetch public backend data"""
+        with self._lock:
+            self._fetched_at = 0.0
+
+    def stats(self):
+        """Get cache bookkeeping for diagnostics"""
+        with self._lock:
+            return {
+                "backends": len(self._backends),
+                "calibrations": len(self._calibrations),
+                "fetched_at": self._fetched_at,
+                "age": time.time() - self._fetched_at if self._fetched_at else None,
+                "ttl": self.ttl,
+                "fetch_count": self.fetch_count
+            }
+
+    def _notify(self, backends, calibrations):
+        for callback in self._listeners:
+            try:
+                callback(backends, calibrations)
+            except Exception as e:
+                print(f"⚠️ Backend cache listener failed: {e}")
+
+    def _snapshot(self):
+        with self._lock:
+            return list(self._backends), dict(self._calibrations)
@@ -0,0 +1,174 @@
+"""
+Backend History Module
+Fixed-memory time series of backend pending_jobs and operational status. Every
+sample is written to a raw ring and rolled up in place into 1 minute, 1 hour and
+1 day aggregate rings, so trend charts over weeks read a few hundred
+pre-aggregated buckets instead of scanning raw samples.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+# (resolution name, bucket width in seconds, ring capacity)
+TIERS = (
+    ('raw', 0, 720),
+    ('1m', 60, 1440),        # 1 day of minutes
+    ('1h', 3600, 24 * 90),   # 90 days of hours
+    ('1d', 86400, 365 * 2),  # 2 years of days
+)
+
+# Columns of every ring row
+TS, COUNT, PENDING_SUM, PENDING_MIN, PENDING_MAX, PENDING_LAST, OPERATIONAL_SUM = range(7)
+
+
+class _RollupRing:
+    """Ring buffer of aggregate buckets of one width (width 0 keeps every sample)"""
+
+    def __init__(self, width, capacity):
+        self.width = width
+        self.capacity = capacity
+        self.data = np.zeros((capacity, 7), dtype=np.float64)
+        self.size = 0
+        self.head = -1  # row of the newest bucket
+
+    def add(self, ts, pending, operational):
+        bucket = ts - ts % self.width if self.width else ts
+        if self.size and self.width and self.data[self.head, TS] >= bucket:
+            # Same (or late) bucket: update the open aggregate in place
+            row = self.data[self.head]
+            row[COUNT] += 1
+            row[PENDING_SUM] += pending
+            row[PENDING_MIN] = min(row[PENDING_MIN], pending)
+            row[PENDING_MAX] = max(row[PENDING_MAX], pending)
+            row[PENDING_LAST] = pending
+            row[OPERATIONAL_SUM] += operational
+        else:
+            self.head = (self.head + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+            self.data[self.head] = (bucket, 1, pending, pending, pending, pending, operational)
+
+    def oldest(self):
+        if not self.size:
+            return None
+        return self.data[(self.head + 1) % self.capacity if self.size == self.capacity else 0, TS]
+
+    def window(self, start, end):
+        """Get rows with bucket start in [start, end], oldest first"""
+        if not self.size:
+            return self.data[:0]
+        if self.size < self.capacity:
+            rows = self.data[:self.size]
+        else:
+            rows = np.concatenate((self.data[self.head + 1:], self.data[:self.head + 1]))
+        # Rows are time ordered, so the window is found by bisection
+        lo = np.searchsorted(rows[:, TS], start - self.width, side='right') if self.width else \
+            np.searchsorted(rows[:, TS], start, side='left')
+        hi = np.searchsorted(rows[:, TS], end, side='right')
+        return rows[lo:hi]
+
+
+class BackendTimeSeries:
+    """Raw samples plus 1m / 1h / 1d rollups for a single backend"""
+
+    def __init__(self):
+        self.rings = {name: _RollupRing(width, capacity) for name, width, capacity in TIERS}
+
+    def add(self, ts, pending, operational):
+        for ring in self.rings.values():
+            ring.add(ts, pending, operational)
+
+
+class BackendHistory:
+    """History of pending_jobs and operational status for every backend"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}  # backend name -> BackendTimeSeries
+
+    def backends(self):
+        with self._lock:
+            return sorted(self._series)
+
+    def record(self, backends, ts=None):
+        """
+        Record one refresh worth of backend status.
+
+        Args:
+            backends (list): Backend dicts with name, pending_jobs and operational
+            ts (float): Sample time (defaults to now)
+        """
+        ts = ts or time.time()
+        with self._lock:
+            for backend in backends:
+                name = backend.get('name')
+                if not name:
+                    continue
+                series = self._series.get(name)
+                if series is None:
+                    series = self._series[name] = BackendTimeSeries()
+                series.add(ts, float(backend.get('pending_jobs') or 0),
+                           1.0 if backend.get('operational') else 0.0)
+
+    def query(self, backend, start=None, end=None, resolution='auto', max_points=500):
+        """
+        Get the pending_jobs / operational trend of a backend.
+
+        Args:
+            backend (str): Backend name
+            start (float): Window start (epoch seconds, defaults to 24 hours before end)
+            end (float): Window end (epoch seconds, defaults to now)
+            resolution (str): 'raw', '1m', '1h', '1d' or 'auto' to pick the finest
+                resolution that covers the window within max_points
+            max_points (int): Point budget for automatic resolution
+
+        Returns:
+            dict: Columnar series, or None if the backend has no history
+        """
+        end = end or time.time()
+        start = start if start is not None else end - 24 * 3600
+        with self._lock:
+            series = self._series.get(backend)
+            if series is None:
+                return None
+
+            if resolution == 'auto':
+                # Finest tier that reaches back to start within the point budget; if no
+                # tier reaches that far (young history), the finest one within budget
+                fitting = []
+                for name, _, _ in TIERS:
+                    ring = series.rings[name]
+                    candidate = ring.window(start, end)
+                    if len(candidate) <= max_points:
+                        fitting.append((name, candidate))
+                        if ring.oldest() <= start:
+                            break
+                if fitting:
+                    covering = [item for item in fitting if series.rings[item[0]].oldest() <= start]
+                    resolution, rows = (covering or fitting)[0]
+                else:
+                    resolution = TIERS[-1][0]
+                    rows = series.rings[resolution].window(start, end)
+            else:
+                if resolution not in series.rings:
+                    raise ValueError(f"Unknown resolution: {resolution}")
+                rows = series.rings[resolution].window(start, end)
+
+            rows = rows.copy()
+
+        counts = rows[:, COUNT]
+        return {
+            "backend": backend,
+            "resolution": resolution,
+            "start": start,
+            "end": end,
+            "points": len(rows),
+            "t": rows[:, TS].tolist(),
+            "pending_jobs_avg": np.round(rows[:, PENDING_SUM] / counts, 2).tolist() if len(rows) else [],
+            "pending_jobs_min": rows[:, PENDING_MIN].tolist(),
+            "pending_jobs_max": rows[:, PENDING_MAX].tolist(),
+            "pending_jobs_last": rows[:, PENDING_LAST].tolist(),
+            "operational_ratio": np.round(rows[:, OPERATIONAL_SUM] / counts, 3).tolist() if len(rows) else [],
+            "samples": counts.astype(int).tolist()
+        }
@@ -0,0 +1,279 @@
+"""
+Calibration Archive Module
+Append-only, memory-mapped archive of every calibration snapshot. Each backend gets
+fixed-width columnar files of quantized values: T1/T2 as 0.1 us steps and error rates
+on a log scale, two bytes each instead of an 8-byte float or a JSON dict entry.
+Readers map the files with np.memmap, so analysis endpoints slice months of
+snapshots without parsing or copying them.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+try:
+    from .calibration_monitor import parse_calibration
+    from .data_paths import user_data_dir
+except ImportError:
+    from calibration_monitor import parse_calibration
+    from data_paths import user_data_dir
+
+DEFAULT_ARCHIVE_PATH = os.environ.get('QUANTUM_CALIBRATION_ARCHIVE', user_data_dir('calibration_archive'))
+
+QUBIT_COLUMNS = ('t1', 't2', 'readout_error')
+
+MISSING = 65535  # uint16 code for a value the snapshot did not report
+_TIME_STEP = 0.1  # T1/T2 quantum in microseconds
+_LOG_MIN, _LOG_MAX = -6.0, 0.0  # error rates are stored between 1e-6 and 1
+_LOG_CODES = 65533  # codes 1..65534 for error rates, 0 for an exact zero
+
+
+def encode_times(values):
+    """Quantize T1/T2 (us) to uint16 steps of 0.1 us"""
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.clip(np.round(values / _TIME_STEP), 0, MISSING - 1)
+    return np.where(np.isnan(values), MISSING, codes).astype(np.uint16)
+
+
+def decode_times(codes):
+    values = codes.astype(np.float64) * _TIME_STEP
+    values[codes == MISSING] = np.nan
+    return values
+
+
+def encode_errors(values):
+    """Quantize error rates to uint16 on a log10 scale (~2e-4 relative precision)"""
+    values = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        scaled = (np.log10(np.clip(values, 10 ** _LOG_MIN, 1.0)) - _LOG_MIN) / (_LOG_MAX - _LOG_MIN)
+    codes = np.round(scaled * _LOG_CODES) + 1
+    codes = np.where(values <= 0, 0, codes)
+    return np.where(np.isnan(values), MISSING, codes).astype(np.uint16)
+
+
+def decode_errors(codes):
+    with np.errstate(invalid='ignore'):
+        values = 10 ** ((codes.astype(np.float64) - 1) / _LOG_CODES * (_LOG_MAX - _LOG_MIN) + _LOG_MIN)
+    values[codes == 0] = 0.0
+    values[codes == MISSING] = np.nan
+    return values
+
+
+def _parse_updated(value):
+    """Epoch seconds of a calibration timestamp; ones without an offset are UTC, not local time"""
+    try:
+        parsed = datetime.datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+class _Segment:
+    """Files of one backend layout (qubit count and coupling edges)"""
+
+    def __init__(self, path, num_qubits, edges):
+        self.path = path
+        self.num_qubits = num_qubits
+        self.edges = [tuple(edge) for edge in edges]
+        self.edge_columns = {edge: column for column, edge in enumerate(self.edges)}
+
+    @classmethod
+    def open(cls, path):
+        with open(os.path.join(path, 'layout.json')) as f:
+            layout = json.load(f)
+        return cls(path, layout['num_qubits'], layout['edges'])
+
+    @classmethod
+    def create(cls, path, num_qubits, edges):
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'layout.json'), 'w') as f:
+            json.dump({"num_qubits": num_qubits, "edges": [list(edge) for edge in edges]}, f)
+        return cls(path, num_qubits, edges)
+
+    def fits(self, num_qubits, edges):
+        return num_qubits == self.num_qubits and all(edge in self.edge_columns for edge in edges)
+
+    def append(self, timestamp, snapshot):
+        qubit_row = np.stack([
+            encode_times(snapshot['qubits']['t1']),
+            encode_times(snapshot['qubits']['t2']),
+            encode_errors(snapshot['qubits']['readout_error'])
+        ])
+        edge_values = np.full(len(self.edges), np.nan)
+        for edge, value in snapshot['edges'].items():
+            edge_values[self.edge_columns[edge]] = value
+        # Data rows first, timestamp last: a reader never sees a time without its row
+        self._truncate()
+        self._write('qubits.u2', qubit_row.tobytes())
+        self._write('edges.u2', encode_errors(edge_values).tobytes())
+        self._write('times.f8', np.array([timestamp], dtype=np.float64).tobytes())
+
+    def count(self):
+        path = os.path.join(self.path, 'times.f8')
+        return os.path.getsize(path) // 8 if os.path.exists(path) else 0
+
+    def last_time(self):
+        """Timestamp of the newest row, or None if the segment is empty"""
+        count = self.count()
+        if not count:
+            return None
+        with open(os.path.join(self.path, 'times.f8'), 'rb') as f:
+            f.seek((count - 1) * 8)
+            return float(np.frombuffer(f.read(8), dtype=np.float64)[0])
+
+    def _truncate(self):
+        """Cut every file back to count() whole rows, dropping what a crashed append left behind"""
+        count = self.count()
+        row_bytes = {
+            'times.f8': 8,
+            'qubits.u2': 2 * len(QUBIT_COLUMNS) * self.num_qubits,
+            'edges.u2': 2 * len(self.edges)
+        }
+        for name, size in row_bytes.items():
+            path = os.path.join(self.path, name)
+            if os.path.exists(path) and os.path.getsize(path) > count * size:
+                with open(path, 'r+b') as f:
+                    f.truncate(count * size)
+
+    def arrays(self):
+        """Map (times, qubit codes (n, 3, qubits), edge codes (n, edges)) without copying"""
+        count = self.count()
+        if not count:
+            return None
+        times = np.memmap(os.path.join(self.path, 'times.f8'), dtype=np.float64, mode='r', shape=(count,))
+        qubits = np.memmap(os.path.join(self.path, 'qubits.u2'), dtype=np.uint16, mode='r',
+                           shape=(count, len(QUBIT_COLUMNS), self.num_qubits)) if self.num_qubits else None
+        edges = np.memmap(os.path.join(self.path, 'edges.u2'), dtype=np.uint16, mode='r',
+                          shape=(count, len(self.edges))) if self.edges else None
+        return times, qubits, edges
+
+    def size(self):
+        return sum(os.path.getsize(os.path.join(self.path, name)) for name in os.listdir(self.path))
+
+    def _write(self, name, data):
+        with open(os.path.join(self.path, name), 'ab') as f:
+            f.write(data)
+
+
+class CalibrationArchive:
+    """Per-backend append-only calibration archive backed by memory-mapped files"""
+
+    def __init__(self, root=DEFAULT_ARCHIVE_PATH):
+        self.root = root
+        self._lock = threading.Lock()
+        self._segments = {}  # backend -> list of _Segment, oldest first
+        self._last_time = {}  # backend -> timestamp of the newest archived snapshot
+        self._last_updated = {}  # backend -> last archived last_update_date
+
+    def record(self, calibrations):
+        """
+        Archive the snapshot of every backend whose calibration changed.
+
+        Args:
+            calibrations (dict): Backend name -> backend.properties().to_dict()
+        """
+        with self._lock:
+            for name, properties in (calibrations or {}).items():
+                if not properties:
+                    continue
+                updated = str(properties.get('last_update_date', ''))
+                segments = self._load_segments(name)
+                if updated and updated == self._last_updated.get(name):
+                    continue
+                last = self._last_time.get(name)
+                timestamp = _parse_updated(updated)
+                if timestamp is None:
+                    # Undated snapshot: stamp it now, but never before the newest row (load bisects on time)
+                    timestamp = max(time.time(), last or 0.0)
+                elif last is not None and timestamp <= last:
+                    # Already archived (also across restarts), or older than what is on disk
+                    continue
+                snapshot = parse_calibration(properties)
+                num_qubits = len(snapshot['qubits']['t1'])
+                if not segments or not segments[-1].fits(num_qubits, snapshot['edges']):
+                    path = os.path.join(self.root, self._safe_name(name), f"seg-{len(segments):04d}")
+                    segments.append(_Segment.create(path, num_qubits, sorted(snapshot['edges'])))
+                segments[-1].append(timestamp, snapshot)
+                self._last_time[name] = timestamp
+                self._last_updated[name] = updated
+
+    def load(self, backend, start=None, end=None):
+        """
+        Decode archived snapshots of a backend within [start, end].
+
+        Args:
+            backend (str): Backend name
+            start (float): Window start (epoch seconds)
+            end (float): Window end (epoch seconds)
+
+        Returns:
+            list: One dict per layout segment with "times", per-qubit metric arrays
+                  (snapshots x qubits) and "gate_error" (snapshots x edges)
+        """
+        with self._lock:
+            segments = list(self._load_segments(backend))
+
+        results = []
+        for segment in segments:
+            mapped = segment.arrays()
+            if mapped is None:
+                continue
+            times, qubits, edges = mapped
+            lo = np.searchsorted(times, start, side='left') if start is not None else 0
+            hi = np.searchsorted(times, end, side='right') if end is not None else len(times)
+            if lo >= hi:
+                continue
+            # Only the selected rows are decoded; the rest of the mapping is never read
+            result = {"times": np.asarray(times[lo:hi]), "num_qubits": segment.num_qubits, "edges": segment.edges}
+            if qubits is not None:
+                result["t1"] = decode_times(qubits[lo:hi, 0])
+                result["t2"] = decode_times(qubits[lo:hi, 1])
+                result["readout_error"] = decode_errors(qubits[lo:hi, 2])
+            if edges is not None:
+                result["gate_error"] = decode_errors(edges[lo:hi])
+            results.append(result)
+        return results
+
+    def backends(self):
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if os.path.isdir(os.path.join(self.root, name)))
+
+    def stats(self):
+        """Get snapshot counts and on-disk bytes per backend"""
+        with self._lock:
+            stats = {}
+            for name in self.backends():
+                segments = self._load_segments(name)
+                stats[name] = {
+                    "snapshots": sum(segment.count() for segment in segments),
+                    "segments": len(segments),
+                    "bytes": sum(segment.size() for segment in segments)
+                }
+            return stats
+
+    def _load_segments(self, name):
+        segments = self._segments.get(name)
+        if segments is None:
+            directory = os.path.join(self.root, self._safe_name(name))
+            segments = []
+            if os.path.isdir(directory):
+                for entry in sorted(os.listdir(directory)):
+                    if entry.startswith('seg-'):
+                        segments.append(_Segment.open(os.path.join(directory, entry)))
+            self._segments[name] = segments
+            times = [segment.last_time() for segment in segments]
+            times = [t for t in times if t is not None]
+            if times:
+                self._last_time[name] = times[-1]
+        return segments
+
+    @staticmethod
+    def _safe_name(name):
+        return ''.join(ch if ch.isalnum() or ch in '-_.' else '_' for ch in str(name))
@@ -0,0 +1,255 @@
+"""
+Calibration Monitor Module
+Keeps a short history of calibration snapshots (backend.properties()) per backend and
+scans the whole fleet for qubits and couplers whose T1, T2, readout or gate error
+degraded since the previous snapshot. Snapshots are held in NaN-padded NumPy arrays
+so rolling mean/std and median/MAD robust z-scores for every backend, qubit and edge
+are computed in a handful of vectorized operations.
+"""
+
+import threading
+import time
+import warnings
+
+import numpy as np
+
+# Metric name -> True if larger values are better
+QUBIT_METRICS = {'t1': True, 't2': True, 'readout_error': False}
+EDGE_METRICS = {'gate_error': False}
+
+# Calibration property names as reported by backend.properties().to_dict()
+PROPERTY_NAMES = {'T1': 't1', 'T2': 't2', 'readout_error': 'readout_error'}
+
+
+def parse_calibration(properties):
+    """
+    Extract per-qubit and per-edge calibration values from a properties dict.
+
+    Args:
+        properties (dict): backend.properties().to_dict()
+
+    Returns:
+        dict: {"qubits": {metric: list}, "edges": {(q0, q1): gate_error}, "updated": str}
+    """
+    qubit_entries = properties.get('qubits') or []
+    qubits = {metric: [np.nan] * len(qubit_entries) for metric in QUBIT_METRICS}
+    for index, entries in enumerate(qubit_entries):
+        for entry in entries or []:
+            metric = PROPERTY_NAMES.get(entry.get('name'))
+            if metric is not None and entry.get('value') is not None:
+                qubits[metric][index] = float(entry['value'])
+
+    # Two-qubit gates only; keep the worst error when several gate types share an edge
+    edges = {}
+    for gate in properties.get('gates') or []:
+        gate_qubits = gate.get('qubits') or []
+        if len(gate_qubits) != 2:
+            continue
+        for parameter in gate.get('parameters') or []:
+            if parameter.get('name') == 'gate_error' and parameter.get('value') is not None:
+                edge = tuple(sorted(gate_qubits))
+                edges[edge] = max(edges.get(edge, 0.0), float(parameter['value']))
+
+    return {"qubits": qubits, "edges": edges, "updated": str(properties.get('last_update_date', ''))}
+
+
+class _BackendCalibrations:
+    """Chronological calibration snapshots of one backend, newest last"""
+
+    def __init__(self, depth):
+        self.depth = depth
+        self.count = 0
+        self.updated = None
+        self.recorded_at = None
+        self.qubits = {metric: np.full((depth, 0), np.nan) for metric in QUBIT_METRICS}
+        self.edge_list = []  # column -> (q0, q1)
+        self.edge_columns = {}  # (q0, q1) -> column
+        self.edges = {metric: np.full((depth, 0), np.nan) for metric in EDGE_METRICS}
+
+    def append(self, snapshot):
+        for metric, values in snapshot['qubits'].items():
+            self.qubits[metric] = self._push(self.qubits[metric], np.asarray(values, dtype=np.float64))
+
+        for edge in snapshot['edges']:
+            if edge not in self.edge_columns:
+                self.edge_columns[edge] = len(self.edge_list)
+                self.edge_list.append(edge)
+        row = np.full(len(self.edge_list), np.nan)
+        for edge, value in snapshot['edges'].items():
+            row[self.edge_columns[edge]] = value
+        self.edges['gate_error'] = self._push(self.edges['gate_error'], row)
+
+        self.count = min(self.count + 1, self.depth)
+        self.updated = snapshot['updated']
+        self.recorded_at = time.time()
+
+    def _push(self, history, row):
+        if row.size > history.shape[1]:
+            history = np.pad(history, ((0, 0), (0, row.size - history.shape[1])), constant_values=np.nan)
+        elif row.size < history.shape[1]:
+            row = np.pad(row, (0, history.shape[1] - row.size), constant_values=np.nan)
+        history = np.roll(history, -1, axis=0)
+        history[-1] = row
+        return history
+
+
+class CalibrationMonitor:
+    """Calibration snapshot history and vectorized fleet-wide degradation scan"""
+
+    def __init__(self, depth=32, window=8, change_threshold=0.25, z_threshold=3.0):
+        """
+        Args:
+            depth (int): Snapshots kept per backend
+            window (int): Snapshots used for the rolling baseline
+            change_threshold (float): Relative worsening since the last snapshot that can flag a value
+            z_threshold (float): Standard / robust z-score a change must also exceed once a baseline exists
+        """
+        self.depth = depth
+        self.window = window
+        self.change_threshold = change_threshold
+        self.z_threshold = z_threshold
+        self._lock = threading.Lock()
+        self._backends = {}  # backend name -> _BackendCalibrations
+        self._version = 0
+        self._scan_cache = None  # (version, result)
+
+    def record(self, calibrations):
+        """
+        Store a snapshot for every backend whose calibration changed.
+
+        Args:
+            calibrations (dict): Backend name -> backend.properties().to_dict()
+        """
+        with self._lock:
+            for name, properties in (calibrations or {}).items():
+                if not properties:
+                    continue
+                snapshot = parse_calibration(properties)
+                history = self._backends.get(name)
+                if history is None:
+                    history = self._backends[name] = _BackendCalibrations(self.depth)
+                elif snapshot['updated'] and snapshot['updated'] == history.updated:
+                    # Calibrations are republished far less often than we poll
+                    continue
+                history.append(snapshot)
+                self._version += 1
+
+    def scan(self, backend=None):
+        """
+        Find qubits and edges whose calibration degraded since the previous snapshot.
+
+        Args:
+            backend (str): Restrict the report to one backend
+
+        Returns:
+            dict: Backend name -> {"degraded", "qubits", "edges", "snapshots", "updated"}
+        """
+        with self._lock:
+            if self._scan_cache is None or self._scan_cache[0] != self._version:
+                self._scan_cache = (self._version, self._scan_fleet())
+            result = self._scan_cache[1]
+        if backend is not None:
+            return {backend: result[backend]} if backend in result else {}
+        return result
+
+    def is_degraded(self, backend):
+        """Check whether a backend's latest calibration flagged any qubit or edge"""
+        report = self.scan(backend).get(backend)
+        return bool(report and report['degraded'])
+
+    def backends(self):
+        with self._lock:
+            return sorted(self._backends)
+
+    def _scan_fleet(self):
+        names = sorted(self._backends)
+        report = {}
+        for name in names:
+            history = self._backends[name]
+            report[name] = {
+                "degraded": False,
+                "snapshots": history.count,
+                "updated": history.updated,
+                "qubits": [],
+                "edges": []
+            }
+        if not names:
+            return report
+
+        for metric, higher_is_better in QUBIT_METRICS.items():
+            stacked = self._stack([self._backends[name].qubits[metric] for name in names])
+            for b, column, finding in self._degraded(stacked, higher_is_better):
+                finding.update({"qubit": column, "metric": metric})
+                report[names[b]]["qubits"].append(finding)
+
+        for metric, higher_is_better in EDGE_METRICS.items():
+            stacked = self._stack([self._backends[name].edges[metric] for name in names])
+            for b, column, finding in self._degraded(stacked, higher_is_better):
+                finding.update({"edge": list(self._backends[names[b]].edge_list[column]), "metric": metric})
+                report[names[b]]["edges"].append(finding)
+
+        for entry in report.values():
+            entry["degraded"] = bool(entry["qubits"] or entry["edges"])
+        return report
+
+    def _stack(self, histories):
+        """Stack per-backend (depth, columns) arrays into one NaN-padded (backends, depth, columns) array"""
+        width = max(history.shape[1] for history in histories)
+        stacked = np.full((len(histories), self.depth, width), np.nan)
+        for b, history in enumerate(histories):
+            stacked[b, :, :history.shape[1]] = history
+        return stacked
+
+    def _degraded(self, stacked, higher_is_better):
+        """Vectorized degradation test over (backends, snapshots, columns)"""
+        latest = stacked[:, -1, :]
+        previous = stacked[:, -2, :]
+        baseline = stacked[:, -1 - self.window:-1, :]
+
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
+            samples = np.sum(~np.isnan(baseline), axis=1)
+            mean = np.nanmean(baseline, axis=1)
+            std = np.nanstd(baseline, axis=1)
+            median = self._nanmedian(baseline)
+            mad = self._nanmedian(np.abs(baseline - median[:, None, :]))
+
+            # Orient every score so that positive means "got worse"
+            sign = -1.0 if higher_is_better else 1.0
+            change = sign * (latest - previous) / np.abs(previous)
+            z = sign * (latest - mean) / std
+            robust_z = sign * 0.6745 * (latest - median) / mad
+
+            significant = (z > self.z_threshold) | (robust_z > self.z_threshold)
+            # With too short a baseline, the relative change alone decides
+            flagged = (change > self.change_threshold) & ((samples < 3) | significant)
+
+        findings = []
+        for b, column in zip(*np.nonzero(flagged)):
+            findings.append((int(b), int(column), {
+                "value": float(latest[b, column]),
+                "previous": float(previous[b, column]),
+                "baseline_mean": self._finite(mean[b, column]),
+                "change_pct": round(float(change[b, column]) * 100, 1),
+                "z": self._finite(z[b, column]),
+                "robust_z": self._finite(robust_z[b, column])
+            }))
+        return findings
+
+    @staticmethod
+    def _nanmedian(values):
+        """Median over axis 1 ignoring NaN (sorts NaN last instead of masking like np.nanmedian)"""
+        ordered = np.sort(values, axis=1)
+        valid = np.sum(~np.isnan(values), axis=1)
+        low = np.maximum(valid - 1, 0) // 2
+        high = np.where(valid > 0, valid // 2, 0)
+        low_values = np.take_along_axis(ordered, low[:, None, :], axis=1)[:, 0, :]
+        high_values = np.take_along_axis(ordered, high[:, None, :], axis=1)[:, 0, :]
+        median = (low_values + high_values) / 2
+        median[valid == 0] = np.nan
+        return median
+
+    @staticmethod
+    def _finite(value):
+        value = float(value)
+        return round(value, 3) if np.isfinite(value) else None
@@ -0,0 +1,24 @@
+"""
+Data Paths Module
+Default locations of the files the tracker writes (history and snapshot databases,
+calibration archive, precompressed assets). They live in the per-user data directory
+rather than the package tree, which may be read-only or replaced on upgrade.
+"""
+
+import os
+
+
+def user_data_dir(*parts):
+    """
+    Path under the per-user data directory of the tracker.
+
+    Uses XDG_DATA_HOME, %LOCALAPPDATA% on Windows, and ~/.local/share otherwise.
+    Nothing is created; callers make directories when they first write.
+
+    Args:
+        *parts (str): Path components below the tracker's data directory
+    """
+    base = os.environ.get('XDG_DATA_HOME') or os.environ.get('LOCALAPPDATA')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base, 'quantum_jobs_tracker', *parts)
@@ -0,0 +1,71 @@
+"""
+Data Version Module
+Monotonic version counters for the data behind the read endpoints. The refresh loop
+bumps a scope's counter only when its content actually changed (the shared backend
+fleet, or one credential's backends and jobs), so an ETag built from the counters
+stays valid across polls that would return the same data.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+FLEET = 'fleet'  # scope of the public backend data shared by every session
+
+
+class DataVersions:
+    """Per-scope change counters and the ETags derived from them"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}  # scope -> counter
+        self._fingerprints = {}  # scope -> digest of the last content seen by bump_if_changed
+        # Distinguishes ETags of this process from those handed out before a restart
+        self._epoch = os.urandom(4).hex()
+
+    def get(self, scope):
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def bump(self, scope):
+        """Record a change in a scope and return its new version"""
+        with self._lock:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+            return self._versions[scope]
+
+    def bump_if_changed(self, scope, content):
+        """
+        Bump a scope only if content differs from what it held at the previous call.
+
+        Args:
+            scope (str): Version scope, e.g. FLEET or a credential key
+            content: JSON-serializable data of the scope
+
+        Returns:
+            bool: Whether the version was bumped
+        """
+        digest = hashlib.blake2b(json.dumps(content, sort_keys=True, default=str).encode('utf-8'),
+                                 digest_size=16).digest()
+        with self._lock:
+            if self._fingerprints.get(scope) == digest:
+                return False
+            self._fingerprints[scope] = digest
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+            return True
+
+    def etag(self, resource, scopes):
+        """
+        Build an ETag for a resource from the current versions of the scopes it reads.
+
+        Args:
+            resource (str): Resource identity (path and query string)
+            scopes (list): Version scopes whose data the resource is built from
+
+        Returns:
+            str: Opaque entity tag (unquoted)
+        """
+        with self._lock:
+            versions = [f"{scope}={self._versions.get(scope, 0)}" for scope in scopes]
+        material = '|'.join([self._epoch, resource] + versions)
+        return hashlib.blake2b(material.encode('utf-8'), digest_size=12).hexdigest()
@@ -0,0 +1,178 @@
+"""
+Error Clusters Module
+Groups failed-job error messages into failure causes. Messages are normalized (ids,
+numbers, paths and quoted values replaced by placeholders), shingled into token
+bigrams and MinHashed; LSH banding finds the candidate clusters of a new message,
+so near-identical failures group together without comparing against every cluster.
+"""
+
+import collections
+import re
+import threading
+import time
+import zlib
+
+import numpy as np
+
+NUM_PERMUTATIONS = 64
+BANDS = 16  # 16 bands x 4 rows: candidates above ~0.5 estimated Jaccard similarity
+SIMILARITY_THRESHOLD = 0.5
+NO_MESSAGE = 'No error message reported'
+
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+# Order matters: specific identifiers before generic numbers
+_NORMALIZE_PATTERNS = (
+    (re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'), ' <uuid> '),
+    (re.compile(r'\b[0-9a-z]{20}\b'), ' <job_id> '),
+    (re.compile(r'\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b'), ' <hex> '),
+    (re.compile(r'(["\']).*?\1'), ' <str> '),
+    (re.compile(r'(?:/[\w.-]+){2,}'), ' <path> '),
+    (re.compile(r'\d+(?:\.\d+)?(?:e[+-]?\d+)?'), ' <num> '),
+)
+_TOKEN_PATTERN = re.compile(r'<\w+>|[a-z_]+')
+
+
+def normalize_message(message):
+    """Reduce an error message to its template tokens"""
+    text = str(message or NO_MESSAGE).lower()
+    for pattern, placeholder in _NORMALIZE_PATTERNS:
+        text = pattern.sub(placeholder, text)
+    return _TOKEN_PATTERN.findall(text)
+
+
+class _MinHasher:
+    """Universal-hash MinHash signatures over token shingles"""
+
+    def __init__(self, num_permutations=NUM_PERMUTATIONS, seed=7):
+        rng = np.random.default_rng(seed)
+        # a, b and shingle hashes below the 2^31 - 1 prime keep a * x + b inside uint64
+        self.a = rng.integers(1, int(_MERSENNE_PRIME), size=num_permutations, dtype=np.uint64)
+        self.b = rng.integers(0, int(_MERSENNE_PRIME), size=num_permutations, dtype=np.uint64)
+
+    def signature(self, tokens):
+        shingles = {' '.join(tokens[i:i + 2]) for i in range(max(len(tokens) - 1, 1))}
+        hashes = np.array([zlib.crc32(shingle.encode('utf-8')) for shingle in shingles], dtype=np.uint64)
+        hashes %= _MERSENNE_PRIME
+        permuted = (hashes[:, None] * self.a + self.b) % _MERSENNE_PRIME
+        return permuted.min(axis=0)
+
+
+class ErrorClusters:
+    """Incremental MinHash/LSH clustering of failed-job error messages"""
+
+    def __init__(self, bands=BANDS, threshold=SIMILARITY_THRESHOLD):
+        self.bands = bands
+        self.threshold = threshold
+        self._hasher = _MinHasher()
+        self._rows = NUM_PERMUTATIONS // bands
+        self._lock = threading.Lock()
+        self._clusters = []  # cluster id -> cluster dict
+        self._signatures = []  # cluster id -> representative MinHash signature
+        self._buckets = {}  # (band, band hash) -> set of cluster ids
+        self._templates = {}  # normalized template -> cluster id (exact-match fast path)
+        self._by_backend = {}  # backend -> Counter of cluster id -> failures
+
+    def __len__(self):
+        return len(self._clusters)
+
+    def add(self, job):
+        """
+        Assign a failed job's error message to a cluster.
+
+        Args:
+            job (dict): Job dict with "id", "backend" and "error_message"
+
+        Returns:
+            int: Cluster id
+        """
+        message = job.get('error_message') or NO_MESSAGE
+        tokens = normalize_message(message)
+        template = ' '.join(tokens)
+        backend = job.get('backend', 'unknown')
+        now = time.time()
+
+        with self._lock:
+            cluster_id = self._templates.get(template)
+            if cluster_id is None:
+                signature = self._hasher.signature(tokens)
+                band_keys = self._band_keys(signature)
+                cluster_id = self._best_candidate(signature, band_keys)
+                if cluster_id is None:
+                    cluster_id = len(self._clusters)
+                    self._clusters.append({
+                        "cluster_id": cluster_id,
+                        "pattern": template,
+                        "example": str(message)[:500],
+                        "count": 0,
+                        "first_seen": now,
+                        "last_seen": now,
+                        "job_ids": collections.deque(maxlen=5)
+                    })
+                    self._signatures.append(signature)
+                # New variants widen the cluster's LSH footprint
+                for key in band_keys:
+                    self._buckets.setdefault(key, set()).add(cluster_id)
+                self._templates[template] = cluster_id
+
+            cluster = self._clusters[cluster_id]
+            cluster["count"] += 1
+            cluster["last_seen"] = now
+            if job.get('id'):
+                cluster["job_ids"].append(str(job['id']))
+            self._by_backend.setdefault(backend, collections.Counter())[cluster_id] += 1
+            return cluster_id
+
+    def top_causes(self, backend=None, limit=5):
+        """
+        Get the most frequent failure causes.
+
+        Args:
+            backend (str): Restrict to one backend (defaults to all backends)
+            limit (int): Number of causes to return
+
+        Returns:
+            list: Cluster dicts with failure counts, most frequent first
+        """
+        with self._lock:
+            if backend is None:
+                counts = collections.Counter()
+                for backend_counts in self._by_backend.values():
+                    counts.update(backend_counts)
+            else:
+                counts = self._by_backend.get(backend, collections.Counter())
+            causes = []
+            for cluster_id, failures in counts.most_common(limit):
+                cluster = self._clusters[cluster_id]
+                causes.append({
+                    "cluster_id": cluster_id,
+                    "pattern": cluster["pattern"],
+                    "example": cluster["example"],
+                    "failures": failures,
+                    "total_failures": cluster["count"],
+                    "first_seen": cluster["first_seen"],
+                    "last_seen": cluster["last_seen"],
+                    "recent_job_ids": list(cluster["job_ids"])
+                })
+            return causes
+
+    def top_causes_by_backend(self, limit=5):
+        """Get the top failure causes of every backend that has failures"""
+        with self._lock:
+            backends = sorted(self._by_backend)
+        return {backend: self.top_causes(backend, limit) for backend in backends}
+
+    def _band_keys(self, signature):
+        return [(band, hash(signature[band * self._rows:(band + 1) * self._rows].tobytes()))
+                for band in range(self.bands)]
+
+    def _best_candidate(self, signature, band_keys):
+        candidates = set()
+        for key in band_keys:
+            candidates.update(self._buckets.get(key, ()))
+        best, best_similarity = None, self.threshold
+        for cluster_id in candidates:
+            similarity = float(np.mean(self._signatures[cluster_id] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = cluster_id, similarity
+        return best
@@ -0,0 +1,178 @@
+"""
+Event Stream Module
+Fan-out of dashboard deltas to Server-Sent Events subscribers. The refresh loop
+publishes each change once; it is serialized into a single SSE frame that every
+matching subscriber's queue shares, so N open dashboards cost N queue appends rather
+than N diffs or N JSON encodes. Frames are kept in a short replay buffer so a
+reconnecting client resumes from its Last-Event-ID instead of refetching everything.
+"""
+
+import collections
+import json
+import os
+import threading
+
+REPLAY_SIZE = 256  # recent frames kept for Last-Event-ID resumption
+QUEUE_SIZE = 64  # frames a slow subscriber may fall behind before it is told to resync
+
+
+def format_event(event_id, event, data):
+    """Encode one SSE frame"""
+    payload = json.dumps(data, separators=(',', ':'), default=str)
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+class Subscription:
+    """One open stream: a bounded queue of pre-encoded frames"""
+
+    def __init__(self, credential, size):
+        self.credential = credential
+        self._frames = collections.deque()
+        self._size = size
+        self._condition = threading.Condition()
+        self.overflowed = False
+
+    def push(self, frame):
+        with self._condition:
+            if len(self._frames) >= self._size:
+                # The client cannot keep up; drop the backlog and make it refetch
+                self._frames.clear()
+                self.overflowed = True
+            else:
+                self._frames.append(frame)
+            self._condition.notify()
+
+    def next(self, timeout):
+        """
+        Wait for queued frames.
+
+        Returns:
+            tuple: (list of frames, bool whether frames were dropped since the last call)
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._frames or self.overflowed, timeout)
+            frames, overflowed = list(self._frames), self.overflowed
+            self._frames.clear()
+            self.overflowed = False
+            return frames, overflowed
+
+
+class EventBroadcaster:
+    """Publishes delta events to every subscriber of a credential (or of everyone)"""
+
+    def __init__(self, replay_size=REPLAY_SIZE, queue_size=QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        # Event ids are "<epoch>-<n>"; the epoch tells ids handed out before a restart apart
+        self._epoch = os.urandom(4).hex()
+        self._last_id = 0
+        self._subscribers = set()
+        self._replay = collections.deque(maxlen=replay_size)  # (event id, credential, frame)
+        self._published = {}  # (event, credential) -> key -> fingerprint of the last published record
+        self.events_published = 0
+
+    def subscribe(self, credential, last_event_id=None):
+        """
+        Open a subscription for a credential's events and the shared ones.
+
+        Args:
+            credential (str): Credential key of the subscriber
+            last_event_id (str): Last-Event-ID the client sent, to replay what it missed
+
+        Returns:
+            tuple: (Subscription, list of replayed frames or None if the missed events
+                   cannot be replayed - gone from the buffer, or from another server
+                   process - and the client must resync)
+        """
+        subscription = Subscription(credential, self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+            if not last_event_id:
+                return subscription, []
+            last = self._parse_id(last_event_id)
+            if last is None or last > self._last_id:
+                return subscription, None
+            if last < self._last_id and (not self._replay or self._replay[0][0] > last + 1):
+                return subscription, None
+            return subscription, [frame for event_id, scope, frame in self._replay
+                                  if event_id > last and scope in (None, credential)]
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def has_subscribers(self, credential=None):
+        """Check whether anyone would receive an event for a credential (None: anyone at all)"""
+        with self._lock:
+            return any(credential is None or s.credential == credential for s in self._subscribers)
+
+    def publish(self, event, data, credential=None):
+        """
+        Send an event to the subscribers of a credential, or to all of them.
+
+        Args:
+            event (str): SSE event name
+            data: JSON-serializable payload
+            credential (str): Restrict delivery to this credential's subscribers
+
+        Returns:
+            int: Number of subscribers the event was queued for
+        """
+        with self._lock:
+            return self._publish(event, data, credential)
+
+    def _publish(self, event, data, credential):
+        # Caller holds _lock: id assignment and queueing happen in one step, so every
+        # subscriber receives events in id order even with concurrent publishers
+        self._last_id += 1
+        event_id = self._last_id
+        frame = format_event(f"{self._epoch}-{event_id}", event, data)
+        self._replay.append((event_id, credential, frame))
+        targets = [s for s in self._subscribers if credential is None or s.credential == credential]
+        self.events_published += 1
+        for subscription in targets:
+            subscription.push(frame)
+        return len(targets)
+
+    def publish_changes(self, event, records, credential=None, replace=True):
+        """
+        Publish only the records that changed since this event was last published.
+
+        Args:
+            event (str): SSE event name
+            records (dict): Key -> record dict of the current state
+            credential (str): Restrict delivery to this credential's subscribers
+            replace (bool): Whether keys missing from records were removed (a full listing)
+
+        Returns:
+            bool: Whether a delta was published
+        """
+        fingerprints = {key: json.dumps(record, sort_keys=True, default=str) for key, record in records.items()}
+        with self._lock:
+            published = self._published.setdefault((event, credential), {})
+            upserts = {key: records[key] for key, fingerprint in fingerprints.items()
+                       if published.get(key) != fingerprint}
+            removed = [key for key in published if key not in records] if replace else []
+            for key in removed:
+                del published[key]
+            published.update((key, fingerprints[key]) for key in upserts)
+            if not upserts and not removed:
+                return False
+            # Published before releasing the lock, so deltas go out in the order they were computed
+            self._publish(event, {"upserts": upserts, "removed": removed}, credential)
+        return True
+
+    def status(self):
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "events_published": self.events_published,
+                "replay_buffer": len(self._replay)
+            }
+
+    def _parse_id(self, event_id):
+        """Sequence number of an event id issued by this process, or None"""
+        epoch, _, number = str(event_id).partition('-')
+        if epoch != self._epoch or not number.isdigit():
+            return None
+        return int(number)
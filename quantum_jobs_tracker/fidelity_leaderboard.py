@@ -0,0 +1,165 @@
+"""
+Fidelity Leaderboard Module
+Running per-backend statistics of the fidelity observed when executing canonical
+circuits (e.g. the Bell state). Mean and variance are updated with Welford's method,
+the trend with an incremental least-squares slope, and the ranking is kept sorted on
+every insert, so the leaderboard is served from memory without recomputation.
+"""
+
+import bisect
+import collections
+import math
+import threading
+import time
+
+DEFAULT_CIRCUIT = 'bell_phi_plus'
+
+# Slope (fidelity per day) beyond which a backend is reported as improving / degrading
+TREND_THRESHOLD = 0.005
+
+
+class _FidelityStats:
+    """Welford mean/variance plus least-squares trend of one backend's fidelities"""
+
+    def __init__(self, recent=20):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.total_shots = 0
+        self.last_run = None
+        self.recent = collections.deque(maxlen=recent)
+        # Sums for the fidelity-vs-time regression, with time in days relative to the first run
+        self._origin = None
+        self._sum_t = self._sum_tt = self._sum_y = self._sum_ty = 0.0
+
+    def add(self, fidelity, shots, timestamp, job_id):
+        self.count += 1
+        delta = fidelity - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (fidelity - self.mean)
+        self.min = min(self.min, fidelity)
+        self.max = max(self.max, fidelity)
+        self.total_shots += shots or 0
+        self.last_run = timestamp
+        self.recent.append({"fidelity": fidelity, "shots": shots, "timestamp": timestamp, "job_id": job_id})
+
+        if self._origin is None:
+            self._origin = timestamp
+        t = (timestamp - self._origin) / 86400.0
+        self._sum_t += t
+        self._sum_tt += t * t
+        self._sum_y += fidelity
+        self._sum_ty += t * fidelity
+
+    def std(self):
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else None
+
+    def slope(self):
+        """Least-squares fidelity change per day, or None without a time spread"""
+        denominator = self.count * self._sum_tt - self._sum_t ** 2
+        if self.count < 3 or denominator <= 1e-12:
+            return None
+        return (self.count * self._sum_ty - self._sum_t * self._sum_y) / denominator
+
+    def summary(self, backend):
+        std = self.std()
+        # Normal-approximation 95% confidence interval of the mean
+        half_width = 1.96 * std / math.sqrt(self.count) if std is not None else None
+        slope = self.slope()
+        if slope is None:
+            trend = 'insufficient_data'
+        elif slope > TREND_THRESHOLD:
+            trend = 'improving'
+        elif slope < -TREND_THRESHOLD:
+            trend = 'degrading'
+        else:
+            trend = 'stable'
+        return {
+            "backend": backend,
+            "runs": self.count,
+            "mean_fidelity": round(self.mean, 4),
+            "std": round(std, 4) if std is not None else None,
+            "ci95": [round(max(self.mean - half_width, 0.0), 4), round(min(self.mean + half_width, 1.0), 4)]
+                    if half_width is not None else None,
+            "min": round(self.min, 4),
+            "max": round(self.max, 4),
+            "trend": trend,
+            "trend_per_day": round(slope, 5) if slope is not None else None,
+            "total_shots": self.total_shots,
+            "last_run": self.last_run
+        }
+
+
+class FidelityLeaderboard:
+    """Per-circuit ranking of backends by mean observed fidelity"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}  # circuit -> backend -> _FidelityStats
+        self._rankings = {}  # circuit -> sorted list of (-mean fidelity, backend)
+
+    def record(self, backend, fidelity, shots=None, circuit=DEFAULT_CIRCUIT, job_id=None, timestamp=None):
+        """
+        Record the fidelity of one canonical-circuit execution.
+
+        Args:
+            backend (str): Backend the circuit ran on
+            fidelity (float): Observed fidelity in [0, 1]
+            shots (int): Number of shots of the run
+            circuit (str): Canonical circuit name
+            job_id (str): IBM Quantum job id of the run
+            timestamp (float): Completion time (defaults to now)
+        """
+        timestamp = timestamp or time.time()
+        fidelity = min(max(float(fidelity), 0.0), 1.0)
+        with self._lock:
+            backends = self._stats.setdefault(circuit, {})
+            ranking = self._rankings.setdefault(circuit, [])
+            stats = backends.get(backend)
+            if stats is None:
+                stats = backends[backend] = _FidelityStats()
+            else:
+                # Re-rank: drop the old key before the mean moves
+                position = bisect.bisect_left(ranking, (-stats.mean, backend))
+                if position < len(ranking) and ranking[position] == (-stats.mean, backend):
+                    del ranking[position]
+            stats.add(fidelity, shots, timestamp, job_id)
+            bisect.insort(ranking, (-stats.mean, backend))
+
+    def leaderboard(self, circuit=DEFAULT_CIRCUIT, limit=None, min_runs=1):
+        """
+        Get backends ranked by mean fidelity, best first.
+
+        Args:
+            circuit (str): Canonical circuit name
+            limit (int): Maximum number of backends to return
+            min_runs (int): Skip backends with fewer recorded runs
+
+        Returns:
+            list: Summary dicts with rank, mean, CI and trend
+        """
+        with self._lock:
+            backends = self._stats.get(circuit, {})
+            entries = []
+            for _, backend in self._rankings.get(circuit, []):
+                stats = backends[backend]
+                if stats.count < min_runs:
+                    continue
+                entry = stats.summary(backend)
+                entry["rank"] = len(entries) + 1
+                entries.append(entry)
+                if limit is not None and len(entries) >= limit:
+                    break
+            return entries
+
+    def history(self, backend, circuit=DEFAULT_CIRCUIT):
+        """Get the most recent runs recorded for a backend"""
+        with self._lock:
+            stats = self._stats.get(circuit, {}).get(backend)
+            return list(stats.recent) if stats else []
+
+    def circuits(self):
+        with self._lock:
+            return sorted(self._stats)
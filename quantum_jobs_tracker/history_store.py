@@ -0,0 +1,458 @@
+"""
+History Store Module
+SQLite persistence for job history. Every job state change is kept as a raw row, and
+completed jobs are folded once into per-day / per-backend / per-instance usage
+rollups (QPU seconds, shots, circuits), so usage reports read a few pre-aggregated
+rows instead of re-walking jobs. Rows are partitioned by credential key.
+
+A background retention pass keeps the database size flat: payloads of finished jobs
+are dropped after a few days, and old raw rows are compacted into per-day /
+per-backend / per-status aggregates in small batches so no lock is held for long.
+The ids of compacted jobs are kept for a while, so a re-fetched old job is not counted
+twice while a job first seen after its day was compacted is still folded in; once the
+ids age out, jobs that old are no longer accepted at all.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+
+try:
+    from .data_paths import user_data_dir
+except ImportError:
+    from data_paths import user_data_dir
+
+DEFAULT_DB_PATH = os.environ.get('QUANTUM_HISTORY_DB', user_data_dir('history.db'))
+
+USAGE_DIMENSIONS = ('day', 'backend', 'instance')
+
+# Retention defaults: job payloads kept for a week, raw job rows for 90 days
+PAYLOAD_RETENTION_DAYS = 7
+RAW_RETENTION_DAYS = 90
+# Days past raw retention that compacted job ids are kept; jobs finished before that are
+# beyond what the provider's job listing returns and are ignored if they show up again
+COMPACTED_ID_RETENTION_DAYS = 30
+
+TERMINAL_STATUSES = ('DONE', 'ERROR', 'CANCELLED')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    credential TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    backend TEXT,
+    instance TEXT,
+    status TEXT,
+    created REAL,
+    start_time REAL,
+    end_time REAL,
+    quantum_seconds REAL,
+    shots INTEGER,
+    circuits INTEGER,
+    counted INTEGER NOT NULL DEFAULT 0,
+    payload TEXT,
+    updated_at REAL,
+    finished_at REAL,
+    PRIMARY KEY (credential, job_id)
+);
+CREATE INDEX IF NOT EXISTS jobs_by_end ON jobs (credential, end_time);
+CREATE TABLE IF NOT EXISTS usage_daily (
+    credential TEXT NOT NULL,
+    day TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    jobs INTEGER NOT NULL DEFAULT 0,
+    quantum_seconds REAL NOT NULL DEFAULT 0,
+    shots INTEGER NOT NULL DEFAULT 0,
+    circuits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (credential, day, backend, instance)
+);
+CREATE TABLE IF NOT EXISTS job_daily (
+    credential TEXT NOT NULL,
+    day TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    status TEXT NOT NULL,
+    jobs INTEGER NOT NULL DEFAULT 0,
+    wait_seconds REAL NOT NULL DEFAULT 0,
+    wait_count INTEGER NOT NULL DEFAULT 0,
+    run_seconds REAL NOT NULL DEFAULT 0,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (credential, day, backend, status)
+);
+CREATE TABLE IF NOT EXISTS compacted_jobs (
+    credential TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    finished_at REAL,
+    PRIMARY KEY (credential, job_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value REAL
+);
+"""
+
+# Raw-row projection shared by compaction and the daily job report
+_DAILY_COLUMNS = """
+    strftime('%Y-%m-%d', finished_at, 'unixepoch') AS day, COALESCE(backend, 'unknown') AS backend, status,
+    1 AS jobs,
+    CASE WHEN start_time IS NOT NULL AND created IS NOT NULL THEN MAX(start_time - created, 0) ELSE 0 END AS wait_seconds,
+    CASE WHEN start_time IS NOT NULL AND created IS NOT NULL THEN 1 ELSE 0 END AS wait_count,
+    CASE WHEN end_time IS NOT NULL AND start_time IS NOT NULL THEN MAX(end_time - start_time, 0) ELSE 0 END AS run_seconds,
+    CASE WHEN end_time IS NOT NULL AND start_time IS NOT NULL THEN 1 ELSE 0 END AS run_count
+"""
+
+
+def day_of(timestamp):
+    """UTC calendar day (YYYY-MM-DD) of an epoch timestamp"""
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).strftime('%Y-%m-%d')
+
+
+def day_start(timestamp):
+    """Epoch seconds of 00:00 UTC on the day of an epoch timestamp"""
+    return timestamp - timestamp % 86400
+
+
+class HistoryStore:
+    """SQLite store of raw job rows and daily usage rollups"""
+
+    def __init__(self, path=DEFAULT_DB_PATH, payload_days=PAYLOAD_RETENTION_DAYS, raw_days=RAW_RETENTION_DAYS,
+                 batch_size=500, maintenance_interval=300, id_days=COMPACTED_ID_RETENTION_DAYS):
+        """
+        Args:
+            path (str): SQLite database file
+            payload_days (int): Days after completion before a job's JSON payload is dropped
+            raw_days (int): Days after completion before a raw job row is compacted into job_daily
+            batch_size (int): Rows handled per retention transaction
+            maintenance_interval (float): Seconds between background retention passes (None disables)
+            id_days (int): Days past raw_days that the ids of compacted jobs are remembered
+        """
+        self.path = path
+        self.payload_days = payload_days
+        self.raw_days = raw_days
+        self.batch_size = batch_size
+        self.maintenance_interval = maintenance_interval
+        self.id_days = id_days
+        self._lock = threading.Lock()
+        self._conn = None  # opened on first use
+        self._compacted_before = 0.0  # raw rows finished at or before this may have been compacted
+        self._untracked_before = 0.0  # finished jobs before this are not accepted (ids aged out or never kept)
+        self._maintenance = None
+
+    def _connection(self):
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            # Must precede table creation; lets retention hand freed pages back to the OS
+            self._conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(jobs)')}
+            if 'finished_at' not in columns:
+                with self._conn:
+                    self._conn.execute('ALTER TABLE jobs ADD COLUMN finished_at REAL')
+                    self._conn.execute(
+                        """UPDATE jobs SET finished_at = COALESCE(end_time, created, updated_at)
+                           WHERE status IN ('DONE', 'ERROR', 'CANCELLED')""")
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_by_finished ON jobs (finished_at)')
+            if 'finished_at' not in {row[1] for row in self._conn.execute('PRAGMA table_info(compacted_jobs)')}:
+                with self._conn:
+                    self._conn.execute('ALTER TABLE compacted_jobs ADD COLUMN finished_at REAL')
+                    # Ids recorded before the column existed age out with the current watermark
+                    self._conn.execute(
+                        """UPDATE compacted_jobs SET finished_at =
+                               (SELECT value FROM meta WHERE key = 'compacted_before')""")
+            self._conn.execute('CREATE INDEX IF NOT EXISTS compacted_jobs_by_finished ON compacted_jobs (finished_at)')
+            # Range scans of one credential's finished jobs (daily_jobs over raw rows)
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_by_credential_finished ON jobs (credential, finished_at)')
+            # Partial index: the payload sweep only ever visits rows that still carry one
+            self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_with_payload ON jobs (finished_at) WHERE payload IS NOT NULL')
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'compacted_before'").fetchone()
+            self._compacted_before = row[0] if row else 0.0
+            # Databases compacted before job ids were remembered cannot tell re-fetched jobs from
+            # late ones below their old watermark, so those keep being skipped
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'untracked_before'").fetchone()
+            if row is None:
+                with self._conn:
+                    self._conn.execute("INSERT INTO meta (key, value) VALUES ('untracked_before', ?)",
+                                       (self._compacted_before,))
+                self._untracked_before = self._compacted_before
+            else:
+                self._untracked_before = row[0]
+            self._start_maintenance()
+        return self._conn
+
+    def record_jobs(self, credential, jobs):
+        """
+        Persist job state changes and fold newly completed jobs into the usage rollups.
+
+        Args:
+            credential (str): Credential key the jobs belong to
+            jobs (list): Job dicts as produced by the quantum manager
+
+        Returns:
+            int: Number of jobs added to the usage rollups
+        """
+        if not jobs:
+            return 0
+        now = time.time()
+        counted = 0
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for job in jobs:
+                    usage = job.get('usage') or {}
+                    status = str(job.get('status', '')).upper()
+                    finished_at = None
+                    if status in TERMINAL_STATUSES:
+                        finished_at = job.get('end_time') or job.get('created') or now
+                        if finished_at < self._untracked_before or (
+                                finished_at <= self._compacted_before and self._was_compacted(conn, credential, job['id'])):
+                            # Already folded into job_daily and usage_daily by retention. Jobs first
+                            # seen this late are stored raw and folded in by the next retention pass.
+                            continue
+                    conn.execute(
+                        """INSERT INTO jobs (credential, job_id, backend, instance, status, created, start_time,
+                                             end_time, quantum_seconds, shots, circuits, payload, updated_at,
+                                             finished_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT (credential, job_id) DO UPDATE SET
+                               backend = excluded.backend, instance = excluded.instance, status = excluded.status,
+                               created = excluded.created, start_time = excluded.start_time,
+                               end_time = excluded.end_time, quantum_seconds = excluded.quantum_seconds,
+                               shots = excluded.shots, circuits = excluded.circuits,
+                               payload = excluded.payload, updated_at = excluded.updated_at,
+                               finished_at = excluded.finished_at""",
+                        (credential, job['id'], job.get('backend'), job.get('instance') or 'default',
+                         status, job.get('created'), job.get('start_time'),
+                         job.get('end_time'), usage.get('quantum_seconds'), usage.get('shots'),
+                         usage.get('circuits'), json.dumps(job, default=str), now, finished_at)
+                    )
+                    if status == 'DONE' and self._mark_counted(conn, credential, job['id']):
+                        self._add_usage(conn, credential, job, usage)
+                        counted += 1
+        return counted
+
+    def usage(self, credential, start=None, end=None, group_by=USAGE_DIMENSIONS):
+        """
+        Sum usage rollups over a day range.
+
+        Args:
+            credential (str): Credential key
+            start (float): Range start (epoch seconds, inclusive day)
+            end (float): Range end (epoch seconds, inclusive day)
+            group_by (tuple): Subset of ('day', 'backend', 'instance')
+
+        Returns:
+            tuple: (list of row dicts, dict of totals)
+        """
+        group_by = [dimension for dimension in USAGE_DIMENSIONS if dimension in group_by]
+        where, params = ['credential = ?'], [credential]
+        if start is not None:
+            where.append('day >= ?')
+            params.append(day_of(start))
+        if end is not None:
+            where.append('day <= ?')
+            params.append(day_of(end))
+        columns = ', '.join(group_by + ['SUM(jobs)', 'SUM(quantum_seconds)', 'SUM(shots)', 'SUM(circuits)'])
+        sql = f"SELECT {columns} FROM usage_daily WHERE {' AND '.join(where)}"
+        if group_by:
+            sql += f" GROUP BY {', '.join(group_by)} ORDER BY {', '.join(group_by)}"
+
+        with self._lock:
+            result = self._connection().execute(sql, params).fetchall()
+
+        rows = []
+        totals = {"jobs": 0, "quantum_seconds": 0.0, "shots": 0, "circuits": 0}
+        for values in result:
+            row = dict(zip(group_by, values))
+            jobs, seconds, shots, circuits = values[len(group_by):]
+            if not jobs:
+                continue
+            row.update({"jobs": jobs, "quantum_seconds": round(seconds or 0.0, 3),
+                        "shots": shots or 0, "circuits": circuits or 0})
+            rows.append(row)
+            totals["jobs"] += jobs
+            totals["quantum_seconds"] += seconds or 0.0
+            totals["shots"] += shots or 0
+            totals["circuits"] += circuits or 0
+        totals["quantum_seconds"] = round(totals["quantum_seconds"], 3)
+        return rows, totals
+
+    def daily_jobs(self, credential, start=None, end=None, backend=None):
+        """
+        Count finished jobs per day, backend and status, over compacted and raw rows alike.
+
+        Args:
+            credential (str): Credential key
+            start (float): Range start (epoch seconds, inclusive day)
+            end (float): Range end (epoch seconds, inclusive day)
+            backend (str): Restrict to one backend
+
+        Returns:
+            list: Row dicts with job counts and average queue wait / run time
+        """
+        start_day = day_of(start) if start is not None else '0000-00-00'
+        end_day = day_of(end) if end is not None else '9999-99-99'
+        # Whole-day bounds on finished_at let the raw side range-scan an index instead of
+        # projecting every finished row of the credential before filtering by day
+        finished_from = day_start(start) if start is not None else float('-inf')
+        finished_to = day_start(end) + 86400 if end is not None else float('inf')
+        backend_filter = ' AND backend = ?' if backend else ''
+        sql = f"""
+            SELECT day, backend, status, SUM(jobs), SUM(wait_seconds), SUM(wait_count), SUM(run_seconds), SUM(run_count)
+            FROM (
+                SELECT day, backend, status, jobs, wait_seconds, wait_count, run_seconds, run_count
+                FROM job_daily WHERE credential = ? AND day BETWEEN ? AND ?{backend_filter}
+                UNION ALL
+                SELECT * FROM (SELECT {_DAILY_COLUMNS} FROM jobs
+                               WHERE finished_at >= ? AND finished_at < ? AND credential = ?)
+                WHERE 1{backend_filter}
+            )
+            GROUP BY day, backend, status ORDER BY day, backend, status"""
+        params = [credential, start_day, end_day] + ([backend] if backend else [])
+        params += [finished_from, finished_to, credential] + ([backend] if backend else [])
+
+        with self._lock:
+            result = self._connection().execute(sql, params).fetchall()
+        return [{
+            "day": day,
+            "backend": backend_name,
+            "status": status,
+            "jobs": jobs,
+            "avg_wait": round(wait / wait_count, 1) if wait_count else None,
+            "avg_runtime": round(run / run_count, 1) if run_count else None
+        } for day, backend_name, status, jobs, wait, wait_count, run, run_count in result]
+
+    def compact_step(self, now=None):
+        """
+        Run one bounded retention batch: drop old payloads, then compact old raw rows, then
+        forget the ids of jobs compacted long ago.
+
+        Returns:
+            int: Number of rows changed (0 when retention is up to date)
+        """
+        now = now or time.time()
+        payload_cutoff = now - self.payload_days * 86400
+        raw_cutoff = now - self.raw_days * 86400
+        id_cutoff = raw_cutoff - self.id_days * 86400
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute(
+                    """UPDATE jobs SET payload = NULL WHERE rowid IN (
+                           SELECT rowid FROM jobs WHERE finished_at < ? AND payload IS NOT NULL LIMIT ?)""",
+                    (payload_cutoff, self.batch_size))
+                if cursor.rowcount:
+                    return cursor.rowcount
+
+                rows = conn.execute(
+                    'SELECT rowid, finished_at FROM jobs WHERE finished_at < ? ORDER BY finished_at LIMIT ?',
+                    (raw_cutoff, self.batch_size)).fetchall()
+                if not rows:
+                    return self._prune_compacted_ids(conn, id_cutoff)
+
+                rowids = [rowid for rowid, _ in rows]
+                marks = ','.join('?' * len(rowids))
+                # Remember compacted jobs (ids only) and move the watermark with every batch, so a
+                # re-fetched old job is skipped rather than stored raw and counted a second time
+                conn.execute(f"""INSERT OR IGNORE INTO compacted_jobs
+                                     SELECT credential, job_id, finished_at FROM jobs WHERE rowid IN ({marks})""",
+                             rowids)
+                watermark = rows[-1][1]
+                if watermark > self._compacted_before:
+                    self._compacted_before = watermark
+                    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('compacted_before', ?)",
+                                 (watermark,))
+                conn.execute(
+                    f"""INSERT INTO job_daily (credential, day, backend, status, jobs, wait_seconds, wait_count,
+                                               run_seconds, run_count)
+                        SELECT credential, day, backend, status, SUM(jobs), SUM(wait_seconds), SUM(wait_count),
+                               SUM(run_seconds), SUM(run_count)
+                        FROM (SELECT credential, {_DAILY_COLUMNS} FROM jobs WHERE rowid IN ({marks}))
+                        GROUP BY credential, day, backend, status
+                        ON CONFLICT (credential, day, backend, status) DO UPDATE SET
+                            jobs = jobs + excluded.jobs,
+                            wait_seconds = wait_seconds + excluded.wait_seconds,
+                            wait_count = wait_count + excluded.wait_count,
+                            run_seconds = run_seconds + excluded.run_seconds,
+                            run_count = run_count + excluded.run_count""",
+                    rowids)
+                conn.execute(f'DELETE FROM jobs WHERE rowid IN ({marks})', rowids)
+                return len(rowids)
+
+    def compact(self, now=None, pause=0.05):
+        """Run retention batches until caught up, releasing the lock between batches"""
+        changed = 0
+        while True:
+            step = self.compact_step(now)
+            if not step:
+                break
+            changed += step
+            time.sleep(pause)
+        if changed:
+            with self._lock:
+                # Run via executescript so the pragma is stepped to completion and frees every page
+                self._connection().executescript('PRAGMA incremental_vacuum;')
+            print(f"✅ History retention: {changed} job rows compacted or trimmed")
+        return changed
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _start_maintenance(self):
+        if self.maintenance_interval and self._maintenance is None:
+            self._maintenance = threading.Thread(target=self._maintenance_loop, name='history-retention', daemon=True)
+            self._maintenance.start()
+
+    def _maintenance_loop(self):
+        while True:
+            time.sleep(self.maintenance_interval)
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"⚠️ History retention failed: {e}")
+
+    def _prune_compacted_ids(self, conn, cutoff):
+        """Forget one batch of compacted job ids finished before cutoff, keeping the id table bounded"""
+        cursor = conn.execute(
+            """DELETE FROM compacted_jobs WHERE (credential, job_id) IN (
+                   SELECT credential, job_id FROM compacted_jobs WHERE finished_at < ? LIMIT ?)""",
+            (cutoff, self.batch_size))
+        if cursor.rowcount and cutoff > self._untracked_before:
+            # Without their ids, re-fetched jobs this old can no longer be told from new ones
+            self._untracked_before = cutoff
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('untracked_before', ?)", (cutoff,))
+        return cursor.rowcount
+
+    @staticmethod
+    def _was_compacted(conn, credential, job_id):
+        return conn.execute('SELECT 1 FROM compacted_jobs WHERE credential = ? AND job_id = ?',
+                            (credential, job_id)).fetchone() is not None
+
+    @staticmethod
+    def _mark_counted(conn, credential, job_id):
+        """Flag a job as rolled up; False if it already was (e.g. seen again after a restart)"""
+        cursor = conn.execute('UPDATE jobs SET counted = 1 WHERE credential = ? AND job_id = ? AND counted = 0',
+                              (credential, job_id))
+        return cursor.rowcount == 1
+
+    @staticmethod
+    def _add_usage(conn, credential, job, usage):
+        finished = job.get('end_time') or job.get('created') or time.time()
+        conn.execute(
+            """INSERT INTO usage_daily (credential, day, backend, instance, jobs, quantum_seconds, shots, circuits)
+               VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+               ON CONFLICT (credential, day, backend, instance) DO UPDATE SET
+                   jobs = jobs + 1,
+                   quantum_seconds = quantum_seconds + excluded.quantum_seconds,
+                   shots = shots + excluded.shots,
+                   circuits = circuits + excluded.circuits""",
+            (credential, day_of(finished), job.get('backend') or 'unknown', job.get('instance') or 'default',
+             usage.get('quantum_seconds') or 0.0, usage.get('shots') or 0, usage.get('circuits') or 0)
+        )
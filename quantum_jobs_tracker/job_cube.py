@@ -0,0 +1,145 @@
+"""
+Job Cube Module
+Dense rollup cube of job activity: backend x status x hour-of-week x instance cells,
+each holding job counts and queue / run duration sums. Ingest moves a job's
+contribution between cells as its status changes, so any slice or marginal is a sum
+over axes of a small NumPy array rather than a scan of job history.
+"""
+
+import datetime
+import threading
+
+import numpy as np
+
+DIMENSIONS = ('backend', 'status', 'hour_of_week', 'instance')
+MEASURES = ('jobs', 'queue_seconds', 'queue_count', 'run_seconds', 'run_count')
+COUNT_MEASURES = ('jobs', 'queue_count', 'run_count')
+HOURS_PER_WEEK = 168
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+
+
+def hour_of_week(timestamp):
+    """UTC hour of the week (0 = Monday 00:00) of an epoch timestamp"""
+    moment = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc)
+    return moment.weekday() * 24 + moment.hour
+
+
+def hour_of_week_label(hour):
+    return f"{WEEKDAYS[hour // 24]} {hour % 24:02d}:00"
+
+
+class JobActivityCube:
+    """Incrementally maintained dense cube of job counts and durations"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Categorical axes grow as new values appear; hour_of_week is fixed
+        self._labels = {'backend': [], 'status': [], 'instance': []}
+        self._codes = {'backend': {}, 'status': {}, 'instance': {}}
+        self._cube = np.zeros((0, 0, HOURS_PER_WEEK, 0, len(MEASURES)))
+        self._contributions = {}  # job id -> (cell index, measure vector) currently in the cube
+
+    def update(self, jobs):
+        """
+        Fold ingested jobs into the cube, replacing each job's previous contribution.
+
+        Args:
+            jobs (list): Job dicts with id, backend, status, instance, created, start_time, end_time
+        """
+        with self._lock:
+            for job in jobs:
+                job_id = str(job.get('id', ''))
+                if not job_id or job.get('created') is None:
+                    continue
+                cell, values = self._contribution(job)
+                previous = self._contributions.get(job_id)
+                if previous is not None:
+                    if previous[0] == cell and np.array_equal(previous[1], values):
+                        continue
+                    self._cube[previous[0]] -= previous[1]
+                self._cube[cell] += values
+                self._contributions[job_id] = (cell, values)
+
+    def query(self, group_by=('backend',), filters=None):
+        """
+        Aggregate the cube over every dimension not in group_by.
+
+        Args:
+            group_by (list): Dimensions to keep (subset of DIMENSIONS)
+            filters (dict): Dimension -> list of allowed values
+
+        Returns:
+            list: Cell dicts with dimension values, measures and mean durations
+        """
+        unknown = [dimension for dimension in group_by if dimension not in DIMENSIONS]
+        unknown += [dimension for dimension in (filters or {}) if dimension not in DIMENSIONS]
+        if unknown:
+            raise ValueError(f"Unknown dimension: {', '.join(unknown)}")
+
+        with self._lock:
+            cube = self._cube
+            labels = {dimension: list(values) for dimension, values in self._labels.items()}
+            labels['hour_of_week'] = list(range(HOURS_PER_WEEK))
+            # Slicing by filters is fancy indexing on the selected axes only
+            for axis, dimension in enumerate(DIMENSIONS):
+                allowed = (filters or {}).get(dimension)
+                if allowed is None:
+                    continue
+                positions = [labels[dimension].index(value) for value in allowed if value in labels[dimension]]
+                cube = np.take(cube, positions, axis=axis)
+                labels[dimension] = [labels[dimension][p] for p in positions]
+            marginal = cube.sum(axis=tuple(axis for axis, dimension in enumerate(DIMENSIONS)
+                                           if dimension not in group_by))
+
+        kept = [dimension for dimension in DIMENSIONS if dimension in group_by]
+        cells = []
+        # With no dimension kept the marginal is the grand total
+        indexes = zip(*np.nonzero(marginal[..., 0])) if kept else ([()] if marginal[0] else [])
+        for index in indexes:
+            values = marginal[index]
+            cell = {}
+            for dimension, position in zip(kept, index):
+                value = labels[dimension][position]
+                cell[dimension] = int(value) if dimension == 'hour_of_week' else value
+                if dimension == 'hour_of_week':
+                    cell['hour_of_week_label'] = hour_of_week_label(int(value))
+            cell.update({measure: int(round(v)) if measure in COUNT_MEASURES else round(float(v), 3)
+                         for measure, v in zip(MEASURES, values)})
+            cell['mean_queue_seconds'] = round(float(values[1] / values[2]), 3) if values[2] else None
+            cell['mean_run_seconds'] = round(float(values[3] / values[4]), 3) if values[4] else None
+            cells.append(cell)
+        cells.sort(key=lambda cell: cell['jobs'], reverse=True)
+        return cells
+
+    def dimensions(self):
+        with self._lock:
+            return {dimension: list(values) for dimension, values in self._labels.items()}
+
+    def _contribution(self, job):
+        cell = (
+            self._code('backend', str(job.get('backend') or 'unknown')),
+            self._code('status', str(job.get('status') or 'unknown').upper()),
+            hour_of_week(job['created']),
+            self._code('instance', str(job.get('instance') or 'default'))
+        )
+        values = np.zeros(len(MEASURES))
+        values[0] = 1
+        created, started, finished = job.get('created'), job.get('start_time'), job.get('end_time')
+        if started is not None:
+            values[1], values[2] = max(started - created, 0.0), 1
+            if finished is not None:
+                values[3], values[4] = max(finished - started, 0.0), 1
+        return cell, values
+
+    def _code(self, dimension, value):
+        code = self._codes[dimension].get(value)
+        if code is None:
+            code = self._codes[dimension][value] = len(self._labels[dimension])
+            self._labels[dimension].append(value)
+            # Grow the axis with a zero slab (amortized by doubling)
+            axis = DIMENSIONS.index(dimension)
+            if code >= self._cube.shape[axis]:
+                padding = [(0, 0)] * self._cube.ndim
+                padding[axis] = (0, max(code + 1, 2 * self._cube.shape[axis]) - self._cube.shape[axis])
+                self._cube = np.pad(self._cube, padding)
+        return code
@@ -0,0 +1,192 @@
+"""
+Job Durations Module
+Columnar store of job timestamps for duration analytics. Created / start / end times
+are kept as datetime64[ms] columns (NaT when unknown) next to integer backend and
+status codes, so queue time, run time and throughput statistics for every backend
+come from a handful of vectorized passes over the whole job history.
+"""
+
+import threading
+
+import numpy as np
+
+PERCENTILES = (50, 90, 99)
+NAT = np.datetime64('NaT', 'ms')
+
+
+def _datetime64(timestamp):
+    """Epoch seconds -> datetime64[ms] (NaT for None)"""
+    if timestamp is None:
+        return NAT
+    return np.datetime64(int(round(float(timestamp) * 1000)), 'ms')
+
+
+class JobDurationStore:
+    """Growable datetime64 columns of every job's lifecycle timestamps"""
+
+    def __init__(self, capacity=1024):
+        self._lock = threading.Lock()
+        self._rows = {}  # job id -> row
+        self._backends = []  # backend code -> name
+        self._backend_codes = {}  # backend name -> code
+        self._statuses = []  # status code -> name
+        self._status_codes = {}
+        self._size = 0
+        self._backend = np.zeros(capacity, dtype=np.int32)
+        self._status = np.zeros(capacity, dtype=np.int32)
+        self._created = np.full(capacity, NAT)
+        self._started = np.full(capacity, NAT)
+        self._finished = np.full(capacity, NAT)
+
+    def __len__(self):
+        return self._size
+
+    def update(self, jobs):
+        """
+        Insert or refresh the timestamps of ingested jobs.
+
+        Args:
+            jobs (list): Job dicts with id, backend, status, created, start_time, end_time
+        """
+        with self._lock:
+            for job in jobs:
+                job_id = str(job.get('id', ''))
+                if not job_id:
+                    continue
+                row = self._rows.get(job_id)
+                if row is None:
+                    row = self._append_row()
+                    self._rows[job_id] = row
+                self._backend[row] = self._code(self._backends, self._backend_codes, str(job.get('backend', 'unknown')))
+                self._status[row] = self._code(self._statuses, self._status_codes, str(job.get('status', 'unknown')).upper())
+                self._created[row] = _datetime64(job.get('created'))
+                self._started[row] = _datetime64(job.get('start_time'))
+                self._finished[row] = _datetime64(job.get('end_time'))
+
+    def statistics(self, backend=None, start=None, end=None, bins=20):
+        """
+        Queue time, run time and throughput per backend for jobs created in [start, end].
+
+        Args:
+            backend (str): Restrict to one backend (defaults to all)
+            start (float): Window start (epoch seconds, defaults to the oldest job)
+            end (float): Window end (epoch seconds, defaults to the newest job)
+            bins (int): Number of log-spaced histogram bins
+
+        Returns:
+            dict: Backend name -> {"jobs", "completed", "queue_time", "run_time",
+                  "throughput_per_hour"}; duration entries hold count, mean, min/max,
+                  percentiles and a histogram in seconds
+        """
+        with self._lock:
+            size = self._size
+            codes = self._backend[:size].copy()
+            statuses = self._status[:size].copy()
+            created = self._created[:size].copy()
+            started = self._started[:size].copy()
+            finished = self._finished[:size].copy()
+            backends = list(self._backends)
+            done_code = self._status_codes.get('DONE', -1)
+
+        mask = ~np.isnat(created)
+        if start is not None:
+            mask &= created >= _datetime64(start)
+        if end is not None:
+            mask &= created <= _datetime64(end)
+        if backend is not None:
+            mask &= codes == (backends.index(backend) if backend in backends else -1)
+
+        queue_time = (started - created) / np.timedelta64(1, 's')
+        run_time = (finished - started) / np.timedelta64(1, 's')
+
+        # Throughput over the span the selected jobs actually cover
+        selected = created[mask]
+        if selected.size:
+            selected_finished = finished[mask][~np.isnat(finished[mask])]
+            latest = max(selected.max(), selected_finished.max()) if selected_finished.size else selected.max()
+            span_start = _datetime64(start) if start is not None else selected.min()
+            span_end = _datetime64(end) if end is not None else latest
+            hours = max((span_end - span_start) / np.timedelta64(1, 'h'), 1.0 / 60)
+        else:
+            hours = None
+
+        num_backends = len(backends)
+        job_counts = np.bincount(codes[mask], minlength=num_backends)
+        completed = np.bincount(codes[mask & (statuses == done_code)], minlength=num_backends)
+        queue_stats = self._duration_stats(queue_time, codes, mask, num_backends, bins)
+        run_stats = self._duration_stats(run_time, codes, mask, num_backends, bins)
+
+        result = {}
+        for code, name in enumerate(backends):
+            if not job_counts[code]:
+                continue
+            result[name] = {
+                "jobs": int(job_counts[code]),
+                "completed": int(completed[code]),
+                "queue_time": queue_stats[code],
+                "run_time": run_stats[code],
+                "throughput_per_hour": round(float(completed[code]) / hours, 4) if hours else None
+            }
+        return result
+
+    @staticmethod
+    def _duration_stats(durations, codes, mask, num_backends, bins):
+        """Per-backend count / mean / percentiles / histogram of a duration column in one sort"""
+        valid = mask & ~np.isnan(durations) & (durations >= 0)
+        values = durations[valid]
+        value_codes = codes[valid]
+        stats = [{"count": 0} for _ in range(num_backends)]
+        if not values.size:
+            return stats
+
+        # Sorting by (backend, value) puts each backend's values in one contiguous ordered run
+        order = np.lexsort((values, value_codes))
+        values, value_codes = values[order], value_codes[order]
+        counts = np.bincount(value_codes, minlength=num_backends)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        sums = np.bincount(value_codes, weights=values, minlength=num_backends)
+
+        # Shared log-spaced bins so histograms of different backends line up
+        low = max(values.min(), 1.0)
+        high = max(values.max(), low * 10)
+        edges = np.concatenate(([0.0], np.logspace(np.log10(low), np.log10(high), bins)))
+        bin_index = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, len(edges) - 2)
+        histograms = np.bincount(value_codes * (len(edges) - 1) + bin_index,
+                                 minlength=num_backends * (len(edges) - 1)).reshape(num_backends, -1)
+
+        for code in np.nonzero(counts)[0]:
+            count, offset = int(counts[code]), int(offsets[code])
+            run = values[offset:offset + count]
+            stats[code] = {
+                "count": count,
+                "mean": round(float(sums[code] / count), 3),
+                "min": round(float(run[0]), 3),
+                "max": round(float(run[-1]), 3),
+                **{f"p{q}": round(float(run[min(int(np.ceil(q / 100 * count)) - 1, count - 1)]), 3) for q in PERCENTILES},
+                "histogram": {
+                    "edges": [round(float(edge), 3) for edge in edges],
+                    "counts": histograms[code].tolist()
+                }
+            }
+        return stats
+
+    def _append_row(self):
+        if self._size == len(self._backend):
+            capacity = len(self._backend) * 2
+            self._backend = np.resize(self._backend, capacity)
+            self._status = np.resize(self._status, capacity)
+            for name in ('_created', '_started', '_finished'):
+                column = np.full(capacity, NAT)
+                column[:self._size] = getattr(self, name)[:self._size]
+                setattr(self, name, column)
+        row = self._size
+        self._size += 1
+        return row
+
+    @staticmethod
+    def _code(names, codes, value):
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(names)
+            names.append(value)
+        return code
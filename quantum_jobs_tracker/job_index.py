@@ -0,0 +1,161 @@
+"""
+Job Index Module
+In-memory inverted index over tracked quantum jobs. Job ids are kept in a sorted
+list for prefix lookups by bisection, and backend, status, tag and program id each
+map to a posting set of job ids, so searches touch only the matching jobs.
+"""
+
+import bisect
+import threading
+
+
+class JobIndex:
+    """Inverted index over job id prefixes, backend, status, tags and program id"""
+
+    FIELDS = ('backend', 'status', 'tag', 'program_id')
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._jobs = {}  # job id -> job dict
+        self._sorted_ids = []  # sorted job ids for prefix search
+        self._postings = {field: {} for field in self.FIELDS}  # field -> term -> set of job ids
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, job_id):
+        return str(job_id).lower() in self._jobs
+
+    def get(self, job_id):
+        """Get a tracked job by id"""
+        with self._lock:
+            return self._jobs.get(str(job_id).lower())
+
+    def update(self, jobs):
+        """
+        Add or refresh jobs in the index.
+
+        Args:
+            jobs (list): Job dicts with at least an "id" key
+        """
+        with self._lock:
+            new_ids = [job_id for job_id in map(self._add, jobs) if job_id]
+            if len(new_ids) > 32:
+                # Bulk loads re-sort once instead of shifting the list per insert
+                self._sorted_ids.extend(new_ids)
+                self._sorted_ids.sort()
+            else:
+                for job_id in new_ids:
+                    bisect.insort(self._sorted_ids, job_id)
+
+    def add(self, job):
+        """Add a job to the index, replacing any previous version of it"""
+        self.update([job])
+
+    def remove(self, job_id):
+        """Remove a job from the index"""
+        job_id = str(job_id).lower()
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return False
+            self._remove_postings(job_id, job)
+            position = bisect.bisect_left(self._sorted_ids, job_id)
+            if position < len(self._sorted_ids) and self._sorted_ids[position] == job_id:
+                del self._sorted_ids[position]
+            return True
+
+    def search(self, prefix=None, backend=None, status=None, tags=None, program_id=None, limit=50):
+        """
+        Find jobs matching every given criterion.
+
+        Args:
+            prefix (str): Job id prefix
+            backend (str): Backend name
+            status (str): Job status (e.g. QUEUED, RUNNING, DONE)
+            tags (list): Tags the job must all carry
+            program_id (str): Runtime program id (e.g. sampler, estimator)
+            limit (int): Maximum number of jobs to return
+
+        Returns:
+            tuple: (list of matching job dicts, bool whether more matches were cut off)
+        """
+        with self._lock:
+            candidate_sets = []
+            for field, value in (('backend', backend), ('status', status), ('program_id', program_id)):
+                if value:
+                    candidate_sets.append(self._postings[field].get(self._normalize(value), set()))
+            for tag in tags or []:
+                candidate_sets.append(self._postings['tag'].get(self._normalize(tag), set()))
+
+            if prefix:
+                prefix_ids = self._prefix_range(self._normalize(prefix))
+            else:
+                prefix_ids = None
+
+            if prefix_ids is None and not candidate_sets:
+                return [], False
+
+            # Drive the intersection from the smallest candidate set
+            candidate_sets.sort(key=len)
+            if prefix_ids is not None and (not candidate_sets or len(prefix_ids) <= len(candidate_sets[0])):
+                driver, others = prefix_ids, candidate_sets
+            else:
+                driver, others = candidate_sets[0], candidate_sets[1:]
+                if prefix_ids is not None:
+                    prefix = self._normalize(prefix)
+                    driver = [job_id for job_id in driver if job_id.startswith(prefix)]
+
+            matches = []
+            for job_id in driver:
+                if all(job_id in other for other in others):
+                    if len(matches) >= limit:
+                        return matches, True
+                    matches.append(self._jobs[job_id])
+            return matches, False
+
+    def _add(self, job):
+        """Index a job's terms, returning its id if it was not tracked before"""
+        job_id = str(job.get('id', '')).lower()
+        if not job_id:
+            return None
+        is_new = job_id not in self._jobs
+        if not is_new:
+            self._remove_postings(job_id, self._jobs[job_id])
+        self._jobs[job_id] = job
+        for field, term in self._terms(job):
+            self._postings[field].setdefault(term, set()).add(job_id)
+        return job_id if is_new else None
+
+    def terms(self, field):
+        """Get the indexed terms of a field with their job counts"""
+        with self._lock:
+            return {term: len(ids) for term, ids in self._postings[field].items()}
+
+    def _prefix_range(self, prefix):
+        start = bisect.bisect_left(self._sorted_ids, prefix)
+        end = bisect.bisect_left(self._sorted_ids, prefix + '\uffff')
+        return self._sorted_ids[start:end]
+
+    def _remove_postings(self, job_id, job):
+        for field, term in self._terms(job):
+            ids = self._postings[field].get(term)
+            if ids is not None:
+                ids.discard(job_id)
+                if not ids:
+                    del self._postings[field][term]
+
+    def _terms(self, job):
+        terms = []
+        for field in ('backend', 'status', 'program_id'):
+            value = job.get(field)
+            if value:
+                terms.append((field, self._normalize(value)))
+        for tag in job.get('tags') or []:
+            if tag:
+                terms.append(('tag', self._normalize(tag)))
+        return terms
+
+    @staticmethod
+    def _normalize(value):
+        return str(value).strip().lower()
@@ -0,0 +1,163 @@
+"""
+Job Stats Module
+Sliding-window outcome counters for finished jobs. Each window is a ring of time
+slots with running totals, updated when a job reaches a terminal state, so success
+rate, error rate and average runtime for the last hour, day or week are read in
+constant time instead of by filtering the job list.
+"""
+
+import threading
+import time
+
+try:
+    from .job_timeline import TERMINAL_STATUSES
+except ImportError:
+    from job_timeline import TERMINAL_STATUSES
+
+# Window name -> (length in seconds, number of slots)
+WINDOWS = {
+    '1h': (3600, 60),
+    '24h': (24 * 3600, 96),
+    '7d': (7 * 24 * 3600, 168),
+}
+
+FIELDS = ('done', 'error', 'cancelled', 'runtime_sum', 'runtime_count')
+
+
+class SlidingWindowCounter:
+    """Ring of time slots holding outcome counts, with running totals over the window"""
+
+    def __init__(self, window, slots):
+        self.window = window
+        self.slots = slots
+        self.width = window / slots
+        self._counts = [[0.0] * len(FIELDS) for _ in range(slots)]
+        self._totals = [0.0] * len(FIELDS)
+        self._head = None  # absolute index of the newest slot
+
+    def add(self, ts, values, now):
+        """Add per-field values at time ts; returns False if ts is already outside the window"""
+        self._advance(now)
+        index = min(int(ts // self.width), self._head)
+        if index <= self._head - self.slots:
+            return False
+        slot = self._counts[index % self.slots]
+        for i, value in enumerate(values):
+            slot[i] += value
+            self._totals[i] += value
+        return True
+
+    def totals(self, now):
+        """Get the per-field totals over the window ending at now"""
+        self._advance(now)
+        return dict(zip(FIELDS, self._totals))
+
+    def _advance(self, now):
+        index = int(now // self.width)
+        if self._head is None:
+            self._head = index
+            return
+        if index <= self._head:
+            return
+        if index - self._head >= self.slots:
+            self._counts = [[0.0] * len(FIELDS) for _ in range(self.slots)]
+            self._totals = [0.0] * len(FIELDS)
+        else:
+            # Expire the slots the window has moved past
+            for expired in range(self._head + 1, index + 1):
+                slot = self._counts[expired % self.slots]
+                for i, value in enumerate(slot):
+                    self._totals[i] -= value
+                    slot[i] = 0.0
+        self._head = index
+
+
+class JobOutcomeStats:
+    """Windowed success/error counts and runtimes, global and per backend"""
+
+    def __init__(self, windows=None):
+        self.windows = windows or WINDOWS
+        self._lock = threading.Lock()
+        self._global = self._new_counters()
+        self._backends = {}  # backend -> window name -> SlidingWindowCounter
+
+    def observe(self, previous, job, now=None):
+        """
+        Count a job that has just reached DONE, ERROR or CANCELLED.
+
+        Args:
+            previous (dict): The job as last seen, or None for a newly seen job
+            job (dict): The job as just fetched, with real timestamps
+            now (float): Current time (defaults to time.time())
+        """
+        status = str(job.get('status', '')).upper()
+        if status not in TERMINAL_STATUSES:
+            return
+        if previous is not None and str(previous.get('status', '')).upper() == status:
+            return
+
+        now = now or time.time()
+        finished = job.get('end_time')
+        if finished is None:
+            # A transition seen live happened just now; a job first seen finished is dated by creation
+            finished = now if previous is not None else (job.get('created') or now)
+
+        runtime_sum = runtime_count = 0.0
+        if status == 'DONE' and job.get('start_time') is not None and job.get('end_time') is not None:
+            runtime_sum, runtime_count = max(job['end_time'] - job['start_time'], 0.0), 1.0
+        values = (
+            1.0 if status == 'DONE' else 0.0,
+            1.0 if status == 'ERROR' else 0.0,
+            1.0 if status == 'CANCELLED' else 0.0,
+            runtime_sum,
+            runtime_count
+        )
+
+        backend = job.get('backend', 'unknown')
+        with self._lock:
+            counters = self._backends.get(backend)
+            if counters is None:
+                counters = self._backends[backend] = self._new_counters()
+            for name in self.windows:
+                self._global[name].add(finished, values, now)
+                counters[name].add(finished, values, now)
+
+    def rates(self, backend=None, now=None):
+        """
+        Get success rate, error rate and average runtime for every window.
+
+        Args:
+            backend (str): Restrict to one backend (defaults to all backends)
+            now (float): Window end (defaults to time.time())
+
+        Returns:
+            dict: Window name -> rates and counts
+        """
+        now = now or time.time()
+        with self._lock:
+            counters = self._global if backend is None else self._backends.get(backend)
+            if counters is None:
+                counters = self._new_counters()
+            totals = {name: counter.totals(now) for name, counter in counters.items()}
+
+        rates = {}
+        for name, total in totals.items():
+            done, errors, cancelled = round(total['done']), round(total['error']), round(total['cancelled'])
+            finished = done + errors + cancelled
+            rates[name] = {
+                "finished": finished,
+                "done": done,
+                "errors": errors,
+                "cancelled": cancelled,
+                "success_rate": round(done / finished * 100, 1) if finished else 0,
+                "error_rate": round((errors + cancelled) / finished * 100, 1) if finished else 0,
+                "avg_runtime": round(total['runtime_sum'] / total['runtime_count'], 1) if total['runtime_count'] >= 1 else 0
+            }
+        return rates
+
+    def backends(self):
+        with self._lock:
+            return sorted(self._backends)
+
+    def _new_counters(self):
+        return {name: SlidingWindowCounter(window, slots) for name, (window, slots) in self.windows.items()}
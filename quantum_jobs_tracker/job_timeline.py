@@ -0,0 +1,159 @@
+"""
+Job Timeline Module
+Time-window index over job lifetimes for Gantt-style views. Finished jobs are stored
+per backend in sorted NumPy arrays, bucketed by duration class so that a bisection on
+start time bounds the candidates of every window query; unfinished jobs are kept in a
+small open set that is checked directly.
+"""
+
+import math
+import threading
+import time
+
+import numpy as np
+
+TERMINAL_STATUSES = {'DONE', 'ERROR', 'CANCELLED'}
+
+
+class _IntervalBucket:
+    """Finished job intervals of one duration class, sorted by start time"""
+
+    def __init__(self):
+        self.starts = np.empty(0, dtype=np.float64)
+        self.ends = np.empty(0, dtype=np.float64)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.max_duration = 0.0
+        self._pending = []  # (start, end, row) waiting to be merged into the arrays
+
+    def __len__(self):
+        return len(self.rows) + len(self._pending)
+
+    def add(self, start, end, row):
+        self._pending.append((start, end, row))
+        self.max_duration = max(self.max_duration, end - start)
+
+    def overlapping(self, t1, t2):
+        """Get the rows of intervals that overlap [t1, t2]"""
+        self._merge()
+        # Every overlapping interval starts in [t1 - max_duration, t2]
+        lo = np.searchsorted(self.starts, t1 - self.max_duration, side='left')
+        hi = np.searchsorted(self.starts, t2, side='right')
+        return self.rows[lo:hi][self.ends[lo:hi] >= t1]
+
+    def _merge(self):
+        if not self._pending:
+            return
+        pending = np.array(self._pending, dtype=np.float64)
+        pending = pending[np.argsort(pending[:, 0], kind='stable')]
+        positions = np.searchsorted(self.starts, pending[:, 0], side='right')
+        self.starts = np.insert(self.starts, positions, pending[:, 0])
+        self.ends = np.insert(self.ends, positions, pending[:, 1])
+        self.rows = np.insert(self.rows, positions, pending[:, 2].astype(np.int64))
+        self._pending = []
+
+
+class JobTimeline:
+    """Interval index of job lifetimes (created -> finished) per backend"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = []  # row -> timeline record dict
+        self._rows = {}  # job id -> row
+        self._open = set()  # rows of jobs that have not finished yet
+        self._closed = {}  # backend -> duration class -> _IntervalBucket
+
+    def __len__(self):
+        return len(self._records)
+
+    def update(self, jobs):
+        """
+        Ingest job dicts carrying real "created", "start_time" and "end_time" timestamps.
+
+        Args:
+            jobs (list): Job dicts as produced by the quantum manager
+        """
+        with self._lock:
+            for job in jobs:
+                self._ingest(job)
+
+    def query(self, t1, t2, backend=None, limit=None):
+        """
+        Find jobs that were queued or running at any point in [t1, t2].
+
+        Args:
+            t1 (float): Window start (epoch seconds)
+            t2 (float): Window end (epoch seconds)
+            backend (str): Restrict to one backend
+            limit (int): Maximum number of jobs to return
+
+        Returns:
+            list: Timeline records sorted by creation time
+        """
+        with self._lock:
+            rows = []
+            backends = [backend] if backend else list(self._closed)
+            for name in backends:
+                for bucket in self._closed.get(name, {}).values():
+                    rows.extend(bucket.overlapping(t1, t2).tolist())
+
+            # Unfinished jobs extend up to now
+            for row in self._open:
+                record = self._records[row]
+                if backend and record['backend'] != backend:
+                    continue
+                if record['created'] <= t2:
+                    rows.append(row)
+
+            records = sorted((self._records[row] for row in rows), key=lambda r: r['created'])
+            if limit is not None:
+                records = records[:limit]
+            return [dict(record) for record in records]
+
+    def bounds(self):
+        """Get the earliest creation and latest end time covered by the timeline"""
+        with self._lock:
+            if not self._records:
+                return None, None
+            earliest = min(record['created'] for record in self._records)
+            latest = max(record['end_time'] or time.time() for record in self._records)
+            return earliest, latest
+
+    def _ingest(self, job):
+        job_id = job.get('id')
+        created = job.get('created')
+        if not job_id or created is None:
+            return
+
+        status = str(job.get('status', 'unknown')).upper()
+        record = {
+            "id": job_id,
+            "backend": job.get('backend', 'unknown'),
+            "status": status,
+            "created": created,
+            "start_time": job.get('start_time'),
+            "end_time": job.get('end_time')
+        }
+
+        row = self._rows.get(job_id)
+        if row is None:
+            row = len(self._records)
+            self._records.append(record)
+            self._rows[job_id] = row
+            self._open.add(row)
+        elif row not in self._open:
+            # Finished intervals are immutable once indexed
+            return
+        else:
+            self._records[row] = record
+
+        if status in TERMINAL_STATUSES:
+            if record['end_time'] is None:
+                record['end_time'] = max(time.time(), created)
+            self._open.discard(row)
+            self._close(row, record)
+
+    def _close(self, row, record):
+        start, end = record['created'], max(record['end_time'], record['created'])
+        duration_class = int(math.log2(max(end - start, 1.0)))
+        buckets = self._closed.setdefault(record['backend'], {})
+        buckets.setdefault(duration_class, _IntervalBucket()).add(start, end, row)
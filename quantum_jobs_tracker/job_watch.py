@@ -0,0 +1,86 @@
+"""
+Job Watch Module
+Lets request threads block until the background poller sees a job change state.
+Waiters sleep on a per-job condition variable that the job sync notifies, so any
+number of long-polling clients costs no extra provider traffic and wakes as soon as
+the change is ingested.
+"""
+
+import threading
+
+try:
+    from .job_timeline import TERMINAL_STATUSES
+except ImportError:
+    from job_timeline import TERMINAL_STATUSES
+
+
+class JobWatch:
+    """Per-job condition variables notified on job state transitions"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = {}  # job id -> latest job dict
+        self._conditions = {}  # job id -> (Condition, number of waiters)
+
+    def publish(self, jobs):
+        """
+        Record the latest version of jobs and wake the clients waiting on them.
+
+        Args:
+            jobs (list): Job dicts that were just ingested
+        """
+        with self._lock:
+            for job in jobs:
+                job_id = str(job.get('id', ''))
+                if not job_id:
+                    continue
+                self._jobs[job_id] = job
+                entry = self._conditions.get(job_id)
+                if entry is not None:
+                    entry[0].notify_all()
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(str(job_id))
+
+    def wait(self, job_id, known_status=None, timeout=30.0):
+        """
+        Block until a job's status differs from known_status or the timeout expires.
+
+        Args:
+            job_id (str): Job to watch
+            known_status (str): Status the client already has (defaults to the current one)
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            tuple: (latest job dict or None, bool whether the status changed)
+        """
+        job_id = str(job_id)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None, False
+            current = str(job.get('status', '')).upper()
+            known = str(known_status).upper() if known_status else current
+            if current != known or (known_status is None and current in TERMINAL_STATUSES):
+                return job, current != known
+
+            condition, waiters = self._conditions.get(job_id, (None, 0))
+            if condition is None:
+                condition = threading.Condition(self._lock)
+            self._conditions[job_id] = (condition, waiters + 1)
+            try:
+                changed = condition.wait_for(
+                    lambda: str(self._jobs[job_id].get('status', '')).upper() != known, timeout)
+            finally:
+                condition, waiters = self._conditions[job_id]
+                if waiters <= 1:
+                    del self._conditions[job_id]
+                else:
+                    self._conditions[job_id] = (condition, waiters - 1)
+            return self._jobs[job_id], bool(changed)
+
+    def waiting(self):
+        """Get the number of clients currently blocked in wait()"""
+        with self._lock:
+            return sum(waiters for _, waiters in self._conditions.values())
@@ -0,0 +1,227 @@
+"""
+Qubit Layout Module
+Per-backend coupling-map graph built from calibration data: two-qubit gate edges
+weighted by gate error, qubits weighted by readout error. Error-weighted shortest
+paths (and hop counts) between all qubit pairs are computed once per calibration and
+cached, and a greedy best-first search over them finds the lowest-error connected
+k-qubit subgraph to use as initial_layout.
+"""
+
+import threading
+
+import numpy as np
+
+try:
+    from .calibration_monitor import parse_calibration
+except ImportError:
+    from calibration_monitor import parse_calibration
+
+# Cost of an error probability p is -log(1 - p); unknown values count as this error
+MISSING_ERROR = 0.5
+
+
+def _cost(errors):
+    errors = np.where(np.isnan(errors), MISSING_ERROR, np.clip(errors, 0.0, 0.999999))
+    return -np.log1p(-errors)
+
+
+class CouplingGraph:
+    """Coupling map of one backend with calibration error weights"""
+
+    def __init__(self, num_qubits, edges, readout_errors, updated=None):
+        """
+        Args:
+            num_qubits (int): Number of physical qubits
+            edges (dict): (q0, q1) -> two-qubit gate error
+            readout_errors (list): Readout error per qubit (NaN if unknown)
+            updated (str): Calibration last_update_date the graph was built from
+        """
+        self.num_qubits = num_qubits
+        self.updated = updated
+        self.edges = sorted(edges)
+        self.node_cost = _cost(np.asarray(readout_errors, dtype=np.float64))
+        self._node_costs = self.node_cost.tolist()
+        self.edge_cost = np.full((num_qubits, num_qubits), np.inf)
+        self.neighbors = [[] for _ in range(num_qubits)]
+        for (q0, q1), error in edges.items():
+            cost = float(_cost(np.array([error]))[0])
+            self.edge_cost[q0, q1] = self.edge_cost[q1, q0] = cost
+            self.neighbors[q0].append(q1)
+            self.neighbors[q1].append(q0)
+        self._distances = None
+        self._hops = None
+        self._layouts = {}  # k -> layout result
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_properties(cls, properties):
+        snapshot = parse_calibration(properties)
+        readout = snapshot['qubits']['readout_error']
+        num_qubits = max([len(readout)] + [max(edge) + 1 for edge in snapshot['edges']])
+        readout = list(readout) + [np.nan] * (num_qubits - len(readout))
+        return cls(num_qubits, snapshot['edges'], readout, snapshot['updated'])
+
+    def distances(self):
+        """
+        All-pairs error-weighted shortest paths (inf where unreachable), computed once per graph.
+
+        The distance between two qubits is the cheapest sum of gate costs along a
+        coupling path, i.e. -log of the best achievable chain fidelity between them.
+        Floyd-Warshall with one vectorized relaxation per intermediate qubit (n^3 / n steps).
+        """
+        with self._lock:
+            if self._distances is None:
+                distances = self.edge_cost.copy()
+                np.fill_diagonal(distances, 0.0)
+                for via in range(self.num_qubits):
+                    np.minimum(distances, distances[:, via, None] + distances[None, via, :], out=distances)
+                self._distances = distances
+            return self._distances
+
+    def hops(self):
+        """
+        All-pairs hop distances (-1 where unreachable), computed once per graph.
+
+        Level-synchronous BFS from every qubit at once: each level is one boolean
+        frontier x adjacency product, so the cost is diameter x n^2 x degree.
+        """
+        with self._lock:
+            if self._hops is None:
+                n = self.num_qubits
+                adjacency = np.isfinite(self.edge_cost).astype(np.float32)
+                distances = np.full((n, n), -1, dtype=np.int16)
+                np.fill_diagonal(distances, 0)
+                frontier = np.eye(n, dtype=np.float32)
+                visited = np.eye(n, dtype=bool)
+                level = 0
+                while frontier.any():
+                    level += 1
+                    reached = (frontier @ adjacency > 0) & ~visited
+                    distances[reached] = level
+                    visited |= reached
+                    frontier = reached.astype(np.float32)
+                self._hops = distances
+            return self._hops
+
+    def best_layout(self, k):
+        """
+        Find a low-error connected set of k qubits.
+
+        Every qubit seeds a best-first growth that repeatedly adds the coupled neighbour
+        with the cheapest readout cost plus error-weighted shortest-path distance to the
+        qubits chosen so far (a neighbour behind a poor direct coupler is scored by its
+        best route instead); the cheapest result wins. The returned order lists each
+        qubit after one it is coupled to, so adjacent circuit qubits land on coupled
+        physical qubits.
+
+        Args:
+            k (int): Number of qubits
+
+        Returns:
+            dict or None: {"layout", "edges", "cost", "estimated_fidelity"} or None if
+                          no connected subgraph of k qubits exists
+        """
+        with self._lock:
+            if k in self._layouts:
+                return self._layouts[k]
+
+        best = None
+        if 0 < k <= self.num_qubits:
+            distances = self.distances().tolist()  # list rows: the growth reads single entries
+            for seed in np.argsort(self.node_cost):
+                if best is not None and self.node_cost[seed] >= best[0]:
+                    break  # every later seed already costs more than the best subgraph
+                grown = self._grow(int(seed), k, best[0] if best else np.inf, distances)
+                if grown is not None and (best is None or grown[0] < best[0]):
+                    best = grown
+
+        result = None
+        if best is not None:
+            cost, layout, edges = best
+            result = {
+                "layout": layout,
+                "edges": edges,
+                "cost": float(cost),
+                "estimated_fidelity": float(np.exp(-cost))
+            }
+        with self._lock:
+            self._layouts[k] = result
+        return result
+
+    def _grow(self, seed, k, bound, distances):
+        node_cost = self._node_costs
+        layout = [seed]
+        chosen = {seed}
+        edges = []
+        cost = node_cost[seed]
+        # Coupled candidates: qubit -> [shortest-path distance to the chosen set, cheapest coupler cost, via]
+        frontier = {}
+        self._extend_frontier(seed, layout, chosen, frontier, distances)
+        while len(layout) < k:
+            if not frontier:
+                return None
+            qubit, (route, _, via) = min(frontier.items(), key=lambda item: node_cost[item[0]] + item[1][0])
+            cost += node_cost[qubit] + route
+            if cost >= bound:
+                return None
+            del frontier[qubit]
+            layout.append(qubit)
+            chosen.add(qubit)
+            edges.append([via, qubit])
+            row = distances[qubit]
+            for candidate, entry in frontier.items():
+                if row[candidate] < entry[0]:
+                    entry[0] = row[candidate]
+            self._extend_frontier(qubit, layout, chosen, frontier, distances)
+        return cost, [int(q) for q in layout], [[int(a), int(b)] for a, b in edges]
+
+    def _extend_frontier(self, qubit, layout, chosen, frontier, distances):
+        for neighbor in self.neighbors[qubit]:
+            if neighbor in chosen:
+                continue
+            coupler = self.edge_cost[qubit, neighbor]
+            entry = frontier.get(neighbor)
+            if entry is None:
+                row = distances[neighbor]
+                frontier[neighbor] = [min(row[c] for c in layout), coupler, qubit]
+            elif coupler < entry[1]:
+                entry[1], entry[2] = coupler, qubit
+
+
+class LayoutIndex:
+    """Coupling graphs of every backend, rebuilt when its calibration changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._graphs = {}  # backend name -> CouplingGraph
+
+    def record(self, calibrations):
+        """
+        Rebuild the graphs of backends whose calibration changed.
+
+        Args:
+            calibrations (dict): Backend name -> backend.properties().to_dict()
+        """
+        for name, properties in (calibrations or {}).items():
+            if not properties:
+                continue
+            with self._lock:
+                current = self._graphs.get(name)
+            if current is not None and current.updated == str(properties.get('last_update_date', '')):
+                continue
+            graph = CouplingGraph.from_properties(properties)
+            with self._lock:
+                self._graphs[name] = graph
+
+    def graph(self, backend):
+        with self._lock:
+            return self._graphs.get(backend)
+
+    def backends(self):
+        with self._lock:
+            return sorted(self._graphs)
+
+    def best_layout(self, backend, k):
+        """Get the lowest-error connected k-qubit layout of a backend (None if unknown)"""
+        graph = self.graph(backend)
+        return graph.best_layout(k) if graph is not None else None
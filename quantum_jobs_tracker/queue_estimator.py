@@ -0,0 +1,134 @@
+"""
+Queue Estimator Module
+Learns queue wait and execution time per backend from observed job transitions and
+turns them into p50/p90 completion estimates for queued and running jobs.
+"""
+
+import threading
+import time
+
+try:
+    from .sketches import TDigest
+except ImportError:
+    from sketches import TDigest
+
+# Below this many samples a backend borrows the fleet-wide distribution
+MIN_BACKEND_SAMPLES = 5
+
+
+class QueueWaitEstimator:
+    """Per-backend t-digests of queue wait and execution time"""
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._digests = {'wait': {}, 'run': {}}  # kind -> backend -> TDigest
+        self._fleet = {'wait': TDigest(compression), 'run': TDigest(compression)}
+        self._quantile_cache = {}  # (kind, backend) -> ((backend count, fleet count), (p50, p90, samples, source))
+
+    def observe(self, previous, job):
+        """
+        Record the queue wait and execution time revealed by a job's state change.
+
+        Args:
+            previous (dict): The job as last seen, or None for a newly seen job
+            job (dict): The job as just fetched, with real timestamps
+        """
+        if previous is not None and previous.get('status') == job.get('status'):
+            return
+
+        backend = job.get('backend', 'unknown')
+        created, started, finished = job.get('created'), job.get('start_time'), job.get('end_time')
+
+        with self._lock:
+            if created is not None and started is not None and (previous is None or previous.get('start_time') is None):
+                self._add('wait', backend, max(started - created, 0.0))
+            if (started is not None and finished is not None and str(job.get('status', '')).upper() == 'DONE'
+                    and (previous is None or previous.get('end_time') is None)):
+                self._add('run', backend, max(finished - started, 0.0))
+
+    def quantiles(self, kind, backend):
+        """
+        Get (p50, p90, samples, source) for 'wait' or 'run' on a backend.
+
+        Falls back to the fleet-wide distribution while the backend has too few samples.
+        """
+        with self._lock:
+            backend_digest = self._digests[kind].get(backend)
+            backend_count = backend_digest.count if backend_digest else 0
+            fleet_count = self._fleet[kind].count
+
+            # Cached quantiles stay valid until the digest they were read from grows
+            cached = self._quantile_cache.get((kind, backend))
+            if cached is not None:
+                (cached_backend, cached_fleet), result = cached
+                if cached_backend == backend_count and (result[3] == 'backend' or cached_fleet == fleet_count):
+                    return result
+
+            if backend_count >= MIN_BACKEND_SAMPLES:
+                digest, source = backend_digest, 'backend'
+            else:
+                digest, source = self._fleet[kind], 'fleet'
+            if digest.count:
+                result = (digest.quantile(0.5), digest.quantile(0.9), digest.count, source)
+            else:
+                result = (None, None, 0, source)
+            self._quantile_cache[(kind, backend)] = ((backend_count, fleet_count), result)
+            return result
+
+    def eta(self, job, now=None):
+        """
+        Estimate when a queued or running job will complete.
+
+        Returns:
+            dict: {"p50", "p90"} completion timestamps plus sample counts, or None
+        """
+        status = str(job.get('status', '')).upper()
+        if status in ('DONE', 'ERROR', 'CANCELLED'):
+            return None
+        now = now or time.time()
+        backend = job.get('backend', 'unknown')
+        run_p50, run_p90, run_samples, run_source = self.quantiles('run', backend)
+        if run_p50 is None:
+            return None
+
+        started = job.get('start_time')
+        if started is not None:
+            # Running: only execution time remains
+            p50 = max(started + run_p50, now)
+            p90 = max(started + run_p90, now)
+            wait_samples, wait_source = 0, None
+        else:
+            wait_p50, wait_p90, wait_samples, wait_source = self.quantiles('wait', backend)
+            if wait_p50 is None:
+                return None
+            queued_for = now - job['created'] if job.get('created') is not None else 0.0
+            p50 = now + max(wait_p50 - queued_for, 0.0) + run_p50
+            p90 = now + max(wait_p90 - queued_for, 0.0) + run_p90
+
+        return {
+            "p50": p50,
+            "p90": p90,
+            "wait_samples": wait_samples,
+            "run_samples": run_samples,
+            "source": wait_source if wait_source == 'fleet' else run_source
+        }
+
+    def summary(self):
+        """Get learned queue wait and execution quantiles for every backend"""
+        with self._lock:
+            backends = set(self._digests['wait']) | set(self._digests['run'])
+        summary = {}
+        for backend in sorted(backends):
+            summary[backend] = {}
+            for kind in ('wait', 'run'):
+                p50, p90, samples, source = self.quantiles(kind, backend)
+                summary[backend][kind] = {"p50": p50, "p90": p90, "samples": samples, "source": source}
+        return summary
+
+    def _add(self, kind, backend, value):
+        digest = self._digests[kind].get(backend)
+        if digest is None:
+            digest = self._digests[kind][backend] = TDigest(self.compression)
+        digest.add(value)
+        self._fleet[kind].add(value)
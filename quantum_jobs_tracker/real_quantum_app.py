@@ -1,4 +1,4 @@
-from flask import Flask, render_template, jsonify, request, redirect
+from flask import Flask, Response, render_template, jsonify, request, redirect, has_request_context, g, send_file, url_for
 import numpy as np
 import time
 import json
@@ -7,17 +7,80 @@ import os
 import base64
 import io
 import requests
+import datetime
+import inspect
+import math
 
 # Configure matplotlib to use non-interactive Agg backend to avoid threading issues
 import matplotlib
 matplotlib.use('Agg')  # Must be before importing pyplot
 import matplotlib.pyplot as plt
 
+try:
+    from .backend_cache import PublicBackendCache, credential_key
+    from .backend_history import BackendHistory
+    from .calibration_archive import CalibrationArchive
+    from .calibration_monitor import CalibrationMonitor
+    from .data_version import DataVersions, FLEET
+    from .error_clusters import ErrorClusters
+    from .event_stream import EventBroadcaster
+    from .fidelity_leaderboard import FidelityLeaderboard
+    from .history_store import HistoryStore
+    from .job_cube import DIMENSIONS as CUBE_DIMENSIONS, JobActivityCube
+    from .job_durations import JobDurationStore
+    from .job_index import JobIndex
+    from .job_stats import JobOutcomeStats
+    from .job_timeline import JobTimeline, TERMINAL_STATUSES
+    from .job_watch import JobWatch
+    from .queue_estimator import QueueWaitEstimator
+    from .refresh_scheduler import RefreshScheduler
+    from .qubit_layout import LayoutIndex
+    from .sketches import JobSketches
+    from .snapshot_store import SnapshotStore
+    from .static_assets import IMMUTABLE_CACHE_CONTROL, StaticAssets
+    from .webhooks import WebhookDispatcher
+except ImportError:
+    from backend_cache import PublicBackendCache, credential_key
+    from backend_history import BackendHistory
+    from calibration_archive import CalibrationArchive
+    from calibration_monitor import CalibrationMonitor
+    from data_version import DataVersions, FLEET
+    from error_clusters import ErrorClusters
+    from event_stream import EventBroadcaster
+    from fidelity_leaderboard import FidelityLeaderboard
+    from history_store import HistoryStore
+    from job_cube import DIMENSIONS as CUBE_DIMENSIONS, JobActivityCube
+    from job_durations import JobDurationStore
+    from job_index import JobIndex
+    from job_stats import JobOutcomeStats
+    from job_timeline import JobTimeline, TERMINAL_STATUSES
+    from job_watch import JobWatch
+    from queue_estimator import QueueWaitEstimator
+    from refresh_scheduler import RefreshScheduler
+    from qubit_layout import LayoutIndex
+    from sketches import JobSketches
+    from snapshot_store import SnapshotStore
+    from static_assets import IMMUTABLE_CACHE_CONTROL, StaticAssets
+    from webhooks import WebhookDispatcher
+
+# Statuses the runtime API's pending=True job filter selects
+PENDING_STATUSES = {'INITIALIZING', 'VALIDATING', 'QUEUED', 'RUNNING'}
+# Pages of provider.jobs() read at most for one filtered listing
+MAX_JOB_PAGES = 10
+
 # Set up path for templates and static files
 app = Flask(__name__, 
             template_folder=os.path.join('templates'),
             static_folder=os.path.join('static'))
 
+# Fingerprinted, precompressed static assets (templates link them through asset_url)
+static_assets = StaticAssets(app.static_folder)
+
+@app.template_global()
+def asset_url(filename):
+    """Immutable URL of a static file, changing whenever its content does"""
+    return url_for('serve_asset', filename=static_assets.url_name(filename))
+
 # SECURITY: No credentials are loaded from config files
 # Users must enter their IBM Quantum API token through the web interface
 print("SECURITY: API credentials must be entered by users through the web interface")
@@ -27,22 +90,109 @@ print("No hardcoded credentials are stored in this configuration")
 IBM_TOKEN = ""
 IBM_CRN = ""
 
-# Global quantum manager instance
+# Global quantum manager instance (used when no credentials are provided)
 quantum_manager = None
 
-def get_quantum_manager():
-    """Get or create quantum manager instance"""
+# Public backend data (backend list, status, calibrations) is shared by every session
+public_backend_cache = PublicBackendCache(ttl=60)
+
+# Change counters behind the read endpoints' ETags - bumped by the refresh loop when data changes
+data_versions = DataVersions()
+public_backend_cache.add_listener(
+    lambda backends, calibrations: data_versions.bump_if_changed(FLEET, [backends, calibrations]))
+
+# Server-Sent Events fan-out of backend, job and metrics deltas to open dashboards
+event_broadcaster = EventBroadcaster()
+STREAM_BACKEND_FIELDS = ('name', 'status', 'operational', 'pending_jobs', 'num_qubits', 'real_data')
+public_backend_cache.add_listener(lambda backends, calibrations: event_broadcaster.publish_changes(
+    'backends', {b.get('name'): {key: b.get(key) for key in STREAM_BACKEND_FIELDS} for b in backends}))
+
+# Downsampled pending_jobs / status history, sampled on every public backend refresh
+backend_history = BackendHistory()
+public_backend_cache.add_listener(lambda backends, calibrations: backend_history.record(backends))
+
+# Calibration snapshots for drift / degradation detection
+calibration_monitor = CalibrationMonitor()
+public_backend_cache.add_listener(lambda backends, calibrations: calibration_monitor.record(calibrations))
+
+# Every calibration snapshot, quantized into append-only memory-mapped files
+calibration_archive = CalibrationArchive()
+public_backend_cache.add_listener(lambda backends, calibrations: calibration_archive.record(calibrations))
+
+# Error-weighted coupling-map graphs for layout selection
+layout_index = LayoutIndex()
+public_backend_cache.add_listener(lambda backends, calibrations: layout_index.record(calibrations))
+
+# Observed Bell-state fidelity per backend - device behaviour, so shared by every session
+fidelity_leaderboard = FidelityLeaderboard()
+
+# Fixed-memory top programs / tags and distinct users per backend across every account
+job_sketches = JobSketches()
+
+# Persistent job history and usage rollups (rows partitioned by credential key)
+history_store = HistoryStore()
+
+# Checkpoint + delta log of fleet and job state for point-in-time views
+snapshot_store = SnapshotStore()
+public_backend_cache.add_listener(
+    lambda backends, calibrations: snapshot_store.record('fleet', {b.get('name'): b for b in backends}))
+
+# Outbound webhooks for job state transitions (subscriptions are owned by a credential)
+webhook_dispatcher = WebhookDispatcher()
+
+# Private job data is partitioned by credential - one quantum manager per credential key
+quantum_managers = {}
+quantum_managers_lock = threading.Lock()
+
+# Per-credential cache of /api/dashboard_bundle sections:
+# (credential, section) -> (expires, data_updated_at when built, payload, status)
+dashboard_section_cache = {}
+dashboard_section_cache_lock = threading.Lock()
+
+# Background refresh cadence follows demand: fast while a credential is watched, slow heartbeat otherwise
+refresh_scheduler = RefreshScheduler()
+
+# Store user tokens in session (in production, use proper session management)
+user_tokens = {}
+
+def get_session_credential_key(session_id=None):
+    """Get the credential key for a session's stored token and CRN"""
+    if session_id is None:
+        session_id = request.remote_addr
+    token = user_tokens.get(session_id)
+    if not token:
+        return None
+    return credential_key(token, user_tokens.get(f"{session_id}_crn", ""))
+
+def get_quantum_manager(cred_key=None):
+    """Get the quantum manager for a credential (defaults to the current session's)"""
     global quantum_manager
+    if cred_key is None and has_request_context():
+        cred_key = get_session_credential_key()
+    if cred_key:
+        with quantum_managers_lock:
+            qm = quantum_managers.get(cred_key)
+            if qm is None:
+                qm = QuantumBackendManager(credential=cred_key)
+                quantum_managers[cred_key] = qm
+            return qm
     if quantum_manager is None:
         quantum_manager = QuantumBackendManager()
     return quantum_manager
 
+def get_all_quantum_managers():
+    """Get every per-credential quantum manager"""
+    with quantum_managers_lock:
+        return list(quantum_managers.values())
+
 class QuantumBackendManager:
     """Manager for IBM Quantum backends with graceful fallback to simulation"""
     
-    def __init__(self, token=None, crn=None):
+    def __init__(self, token=None, crn=None, backend_cache=None, credential=None):
         self.token = token
         self.crn = crn
+        self.credential = credential or 'default'  # Partition key for persisted job history
+        self.backend_cache = backend_cache if backend_cache is not None else public_backend_cache
         self.backend_data = []
         self.job_data = []
         self.is_connected = False
@@ -50,6 +200,15 @@ class QuantumBackendManager:
         self.simulation_mode = False  # Force simulation mode off
         self.quantum_states = []  # Store quantum state vectors
         self.current_state = None  # Current quantum state
+        self.job_index = JobIndex()  # Searchable index of every job this credential has seen
+        self.job_timeline = JobTimeline()  # Interval index of job lifetimes for time-window queries
+        self.queue_estimator = QueueWaitEstimator()  # Learned queue wait / execution time per backend
+        self.job_stats = JobOutcomeStats()  # Sliding-window success/error counts and runtimes
+        self.error_clusters = ErrorClusters()  # Failed-job error messages grouped into causes
+        self.job_watch = JobWatch()  # Wakes long-polling clients when a job changes state
+        self.data_updated_at = None  # When update_data last refreshed backend_data / job_data
+        self.job_durations = JobDurationStore()  # datetime64 columns of job timestamps for duration analytics
+        self.job_cube = JobActivityCube()  # backend x status x hour-of-week x instance rollup cube
         
         # Only try to connect if we have a token
         if self.token and self.token.strip():
@@ -173,40 +332,55 @@ class QuantumBackendManager:
         raise RuntimeError("SIMULATORS ARE NOT ALLOWED - REAL QUANTUM DATA REQUIRED")
         
     def get_backends(self):
-        """Get available quantum backends - REAL ONLY MODE"""
+        """Get available quantum backends from the shared public cache - REAL ONLY MODE"""
         if not self.is_connected:
             raise RuntimeError("ERROR: Not connected to IBM Quantum. Cannot get real backends.")
-            
+        
+        # Backend data is public - every session shares one fetch per cache TTL
+        backend_list = self.backend_cache.get_backends(self._fetch_public_backend_data)
+        if not backend_list:
+            raise RuntimeError("ERROR: No real backends found. Check your IBM Quantum connection.")
+        
+        return backend_list
+    
+    def get_backend_calibration(self, backend_name):
+        """Get calibration data (backend.properties()) for a backend from the shared public cache"""
+        if not self.is_connected:
+            return None
+        return self.backend_cache.get_calibration(backend_name, self._fetch_public_backend_data)
+    
+    def _fetch_public_backend_data(self):
+        """Fetch backend status and calibrations from IBM Quantum for the shared public cache"""
         # Only get real backends
         real_backends = self.get_real_backends()
         if not real_backends:
             raise RuntimeError("ERROR: No real backends found. Check your IBM Quantum connection.")
-            
-        # Convert backends to a format that can be processed
+        
         backend_list = []
+        calibrations = {}
         for backend in real_backends:
             try:
-                # Extract the proper backend name
-                backend_name = self._extract_backend_name(backend)
-                # Get qubit count
-                num_qubits = self._extract_backend_properties(backend)[0]
+                # Fetch calibrations once and reuse them for the qubit count
+                properties = self._extract_backend_calibration(backend)
+                backend_info = self.get_backend_status(backend, properties)
+                if not backend_info:
+                    continue
                 
-                backend_info = {
-                    "name": backend_name,
-                    "operational": True,  # Assume operational if we can access it
-                    "pending_jobs": 0,  # Will be updated later
-                    "num_qubits": num_qubits if num_qubits > 0 else 5,  # Use real qubit count or default
-                    "real_data": True  # Mark as real data
-                }
+                if backend_info["num_qubits"] <= 0:
+                    backend_info["num_qubits"] = 5  # Use real qubit count or default
+                backend_info["real_data"] = True  # Mark as real data
                 backend_list.append(backend_info)
+                
+                if properties:
+                    calibrations[backend_info["name"]] = properties
             except Exception as e:
                 print(f"Error processing backend {backend}: {e}")
                 continue
         
         print(f"✅ Processed {len(backend_list)} real backends")
-        return backend_list
+        return backend_list, calibrations
     
-    def get_backend_status(self, backend):
+    def get_backend_status(self, backend, properties=None):
         """Get status of a backend with robust error handling - REAL DATA ONLY"""
         if not self.is_connected:
             print("ERROR: Not connected to IBM Quantum. Cannot get backend status.")
@@ -221,7 +395,7 @@ class QuantumBackendManager:
             operational, pending_jobs = self._extract_backend_status(backend)
             
             # Robust properties information extraction
-            num_qubits, backend_version, last_update_date = self._extract_backend_properties(backend)
+            num_qubits, backend_version, last_update_date = self._extract_backend_properties(backend, properties)
                         
             return {
                 "name": backend_name,
@@ -315,15 +489,31 @@ class QuantumBackendManager:
         
         return operational, pending_jobs
     
-    def _extract_backend_properties(self, backend):
+    def _extract_backend_calibration(self, backend):
+        """Fetch the calibration data (backend.properties()) of a backend as a dict"""
+        try:
+            if hasattr(backend, 'properties') and callable(getattr(backend, 'properties', None)):
+                properties_obj = backend.properties()
+                if hasattr(properties_obj, 'to_dict'):
+                    return properties_obj.to_dict()
+        except Exception as prop_err:
+            print(f"Error extracting calibration data: {prop_err}")
+        return None
+    
+    def _extract_backend_properties(self, backend, properties=None):
         """Robustly extract backend properties information"""
         num_qubits = 0
         backend_version = 'unknown'
         last_update_date = 'unknown'
         
         try:
+            # Use already-fetched calibration data when available
+            if properties:
+                num_qubits = len(properties.get('qubits', []))
+                backend_version = properties.get('backend_version', 'unknown')
+                last_update_date = properties.get('last_update_date', 'unknown')
             # For IBM Cloud Quantum Runtime backends, try to get real qubit count
-            if hasattr(backend, 'properties') and callable(getattr(backend, 'properties', None)):
+            elif hasattr(backend, 'properties') and callable(getattr(backend, 'properties', None)):
                 try:
                     properties_obj = backend.properties()
                     if hasattr(properties_obj, 'to_dict'):
@@ -373,8 +563,21 @@ class QuantumBackendManager:
         
         return num_qubits, backend_version, last_update_date
     
-    def get_real_jobs(self):
-        """Get real quantum jobs from IBM Quantum"""
+    def get_real_jobs(self, backend=None, statuses=None, created_after=None, created_before=None, limit=20):
+        """
+        Get real quantum jobs from IBM Quantum.
+
+        Filters are pushed down into provider.jobs() where the provider supports them and
+        applied locally otherwise (see fetch_provider_jobs); if the provider call fails,
+        matching jobs are served from the local job index.
+
+        Args:
+            backend (str): Backend name
+            statuses (list): Job statuses to keep (e.g. ["RUNNING", "QUEUED"])
+            created_after (float): Only jobs created at or after this time (epoch seconds)
+            created_before (float): Only jobs created at or before this time (epoch seconds)
+            limit (int): Maximum number of jobs to return
+        """
         if not self.is_connected or not self.provider:
             return []
             
@@ -384,35 +587,24 @@ class QuantumBackendManager:
             # Use the working method we discovered in testing
             if hasattr(self.provider, 'jobs'):
                 try:
-                    # Get jobs using the working API (limit=20 to get more jobs)
-                    jobs = self.provider.jobs(limit=20)
-                    print(f"✅ Retrieved {len(jobs)} real jobs from IBM Quantum")
-                    
-                    for job in jobs:
-                        try:
-                            # Handle modern job format - extract real data
-                            job_id = getattr(job, 'job_id', str(job))
-                            backend_name = getattr(job, 'backend_name', 'unknown')
-                            status = str(getattr(job, 'status', 'unknown'))
-                            
-                            # Create real job data
-                            job_data = {
-                                "id": str(job_id),
-                                "backend": str(backend_name),
-                                "status": str(status),
-                                "qubits": 5,  # Default for IBM quantum computers
-                                "start_time": time.time() - 600,  # Approximate
-                                "estimated_completion": time.time() + 600,
-                                "real_data": True  # Mark as real data
-                            }
-                            processed_jobs.append(job_data)
-                            
-                        except Exception as job_err:
-                            print(f"Error processing job: {job_err}")
-                            continue
+                    fetched, pushed_down, truncated = self.fetch_provider_jobs(backend, statuses, created_after,
+                                                                               created_before, limit)
+                    print(f"✅ Retrieved {len(fetched)} real jobs from IBM Quantum (filters pushed down: {sorted(pushed_down) or 'none'})")
+                    if truncated:
+                        print(f"⚠️ Stopped after {MAX_JOB_PAGES} pages - fewer than {limit} matching jobs may be returned")
+                    processed_jobs = [job_data for _, job_data in fetched if job_data is not None]
                             
                 except Exception as e:
                     print(f"Error with jobs API: {e}")
+                    indexed = self.search_indexed_jobs(backend, statuses, created_after, created_before, limit)
+                    if indexed is not None:
+                        print(f"✅ Returning {len(indexed)} jobs from the local job index")
+                        return indexed
+            
+            # Keep the job indexes in sync with every fetch
+            self._sync_jobs(processed_jobs)
+            processed_jobs = [job for job in processed_jobs
+                              if self.job_matches(job, backend, statuses, created_after, created_before)][:limit]
             
             # If we got real jobs, return them
             if processed_jobs:
@@ -427,6 +619,291 @@ class QuantumBackendManager:
             print(f"Error fetching real jobs: {e}")
             return []
     
+    def _provider_jobs_accepts(self, name):
+        """Check whether provider.jobs() takes a keyword argument"""
+        try:
+            parameters = inspect.signature(self.provider.jobs).parameters
+        except (TypeError, ValueError):
+            return False
+        return name in parameters or any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+    
+    def provider_job_query(self, backend=None, statuses=None, created_after=None, created_before=None, limit=20):
+        """
+        Build provider.jobs() keyword arguments for a filtered job listing.
+
+        Returns:
+            tuple: (kwargs dict, set of filters the provider applies itself)
+        """
+        supported = self._provider_jobs_accepts
+        
+        query, pushed_down, wanted = {}, set(), set()
+        if backend:
+            wanted.add('backend')
+            if supported('backend_name'):
+                query['backend_name'] = backend
+                pushed_down.add('backend')
+        if statuses:
+            wanted.add('status')
+            # The runtime API only filters pending vs finished; exact statuses are re-checked locally
+            statuses = {str(status).upper() for status in statuses}
+            if supported('pending') and (statuses <= TERMINAL_STATUSES or not statuses & TERMINAL_STATUSES):
+                query['pending'] = not statuses & TERMINAL_STATUSES
+                if statuses in (TERMINAL_STATUSES, PENDING_STATUSES):
+                    pushed_down.add('status')
+        for name, value in (('created_after', created_after), ('created_before', created_before)):
+            if value is not None:
+                wanted.add(name)
+                if supported(name):
+                    query[name] = datetime.datetime.fromtimestamp(value, datetime.timezone.utc)
+                    pushed_down.add(name)
+        
+        # Over-fetch when some filter can only be applied after the fact
+        query['limit'] = limit if wanted <= pushed_down else min(limit * 5, 200)
+        return query, pushed_down
+    
+    def fetch_provider_jobs(self, backend=None, statuses=None, created_after=None, created_before=None, limit=20):
+        """
+        Page through provider.jobs() until `limit` jobs pass the listing filters.
+
+        Filters the provider cannot apply are checked locally, so a page may hold fewer
+        matches than jobs; further pages are requested with `skip` until the limit is met,
+        the provider runs out of jobs or MAX_JOB_PAGES pages were read. Providers without
+        `skip` get a single over-fetched page.
+
+        Returns:
+            tuple: (list of (provider job, job dict or None if it could not be read) pairs,
+                    set of filters the provider applied itself,
+                    bool whether matching jobs may have been left unread)
+        """
+        query, pushed_down = self.provider_job_query(backend, statuses, created_after, created_before, limit)
+        page_size = query['limit']
+        pages = MAX_JOB_PAGES if self._provider_jobs_accepts('skip') else 1
+        fetched, matched = [], 0
+        for page_number in range(pages):
+            if page_number:
+                query['skip'] = page_number * page_size
+            page = list(self.provider.jobs(**query) or [])
+            for job in page:
+                try:
+                    job_data = self._extract_job_info(job)
+                except Exception as job_err:
+                    print(f"Error processing job: {job_err}")
+                    job_data = None
+                fetched.append((job, job_data))
+                if job_data is not None and self.job_matches(job_data, backend, statuses, created_after, created_before):
+                    matched += 1
+            if matched >= limit or len(page) < page_size:
+                return fetched, pushed_down, False
+        return fetched, pushed_down, True
+    
+    @staticmethod
+    def job_matches(job, backend=None, statuses=None, created_after=None, created_before=None):
+        """Check a job dict against job listing filters"""
+        if backend and str(job.get('backend', '')).lower() != str(backend).lower():
+            return False
+        if statuses and str(job.get('status', '')).upper() not in {str(s).upper() for s in statuses}:
+            return False
+        created = job.get('created')
+        if created_after is not None and (created is None or created < created_after):
+            return False
+        if created_before is not None and (created is None or created > created_before):
+            return False
+        return True
+    
+    def search_indexed_jobs(self, backend=None, statuses=None, created_after=None, created_before=None, limit=20):
+        """
+        Serve a filtered job listing from the local job index (None without a backend or status filter).
+
+        Only a fallback for when provider.jobs() fails: the index holds just the jobs this
+        process has synced, with statuses as of the last refresh.
+        """
+        if not backend and not statuses:
+            return None
+        candidates = []
+        for status in statuses or [None]:
+            matches, _ = self.job_index.search(backend=backend, status=status, limit=max(len(self.job_index), 1))
+            candidates.extend(matches)
+        jobs = [job for job in candidates if self.job_matches(job, backend, statuses, created_after, created_before)]
+        jobs.sort(key=lambda job: job.get('created') or 0, reverse=True)
+        return jobs[:limit]
+    
+    def _extract_job_attribute(self, job, name, default=None):
+        """Read a job attribute that may be a property or a legacy method"""
+        try:
+            value = getattr(job, name, default)
+            if callable(value):
+                value = value()
+            return default if value is None else value
+        except Exception:
+            return default
+    
+    def _extract_job_info(self, job):
+        """Convert a provider job object into the dashboard's job dict"""
+        job_id = self._extract_job_attribute(job, 'job_id', str(job))
+        
+        backend_name = self._extract_job_attribute(job, 'backend_name')
+        if backend_name is None:
+            backend_obj = self._extract_job_attribute(job, 'backend')
+            backend_name = self._extract_backend_name(backend_obj) if backend_obj is not None else 'unknown'
+        
+        status = self._extract_job_attribute(job, 'status', 'unknown')
+        status = str(getattr(status, 'name', status))
+        
+        tags = self._extract_job_attribute(job, 'tags', [])
+        program_id = self._extract_job_attribute(job, 'program_id')
+        
+        # Only ask IBM for run timestamps when the job is new or changed state
+        known = self.job_index.get(job_id)
+        if known and known.get('status') == status:
+            created, started, finished = known.get('created'), known.get('start_time'), known.get('end_time')
+            error_message = known.get('error_message')
+            usage = known.get('usage')
+        else:
+            fetch_metrics = status.upper() not in ('QUEUED', 'INITIALIZING', 'VALIDATING')
+            metrics = self._extract_job_attribute(job, 'metrics', {}) if fetch_metrics else {}
+            metrics = metrics if isinstance(metrics, dict) else {}
+            created, started, finished = self._extract_job_times(job, metrics, fetch_metrics)
+            error_message = self._extract_job_attribute(job, 'error_message') if status.upper() == 'ERROR' else None
+            usage = self._extract_job_usage(metrics) if status.upper() == 'DONE' else None
+        
+        instance = self._extract_job_attribute(job, 'instance') or self.crn or 'default'
+        
+        # Create real job data
+        return {
+            "id": str(job_id),
+            "backend": str(backend_name),
+            "status": status,
+            "qubits": 5,  # Default for IBM quantum computers
+            "created": created,
+            "start_time": started,
+            "end_time": finished,
+            "estimated_completion": None,  # Filled in from learned queue statistics on sync
+            "tags": [str(tag) for tag in tags],
+            "program_id": str(program_id) if program_id else None,
+            "error_message": str(error_message) if error_message else None,
+            "instance": str(instance),
+            "usage": usage,
+            "real_data": True  # Mark as real data
+        }
+    
+    def _extract_job_times(self, job, metrics=None, fetch_metrics=True):
+        """Get the real (created, started, finished) epoch timestamps of a job"""
+        created = self._to_timestamp(self._extract_job_attribute(job, 'creation_date'))
+        started = None
+        finished = None
+        
+        if fetch_metrics:
+            # Runtime jobs report run timestamps in metrics(); legacy jobs in time_per_step()
+            timestamps = (metrics or {}).get('timestamps', {})
+            if timestamps:
+                created = created or self._to_timestamp(timestamps.get('created'))
+                started = self._to_timestamp(timestamps.get('running'))
+                finished = self._to_timestamp(timestamps.get('finished'))
+            else:
+                steps = self._extract_job_attribute(job, 'time_per_step', {})
+                if isinstance(steps, dict):
+                    created = created or self._to_timestamp(steps.get('CREATING'))
+                    started = self._to_timestamp(steps.get('RUNNING'))
+                    finished = self._to_timestamp(steps.get('COMPLETED'))
+        
+        return created, started, finished
+    
+    def _extract_job_usage(self, metrics):
+        """Get QPU seconds, shots and circuits of a completed job from its metrics()"""
+        usage = metrics.get('usage') or {}
+        quantum_seconds = usage.get('quantum_seconds', usage.get('seconds'))
+        if quantum_seconds is None:
+            quantum_seconds = (metrics.get('bss') or {}).get('seconds')
+        circuits = metrics.get('num_circuits') or metrics.get('executions') or 0
+        shots = metrics.get('num_shots') or metrics.get('shots') or 0
+        try:
+            return {
+                "quantum_seconds": float(quantum_seconds or 0.0),
+                "shots": int(shots),
+                "circuits": int(circuits)
+            }
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def _to_timestamp(value):
+        """Convert a datetime, ISO string or number to epoch seconds"""
+        if value is None or value == '':
+            return None
+        try:
+            if isinstance(value, (int, float)):
+                return float(value)
+            if isinstance(value, str):
+                value = datetime.datetime.fromisoformat(value.replace('Z', '+00:00'))
+            if isinstance(value, datetime.datetime):
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=datetime.timezone.utc)
+                return value.timestamp()
+        except (ValueError, TypeError, OverflowError):
+            pass
+        return None
+    
+    def _sync_jobs(self, jobs):
+        """Feed freshly fetched jobs into the job indexes and learned statistics"""
+        if not jobs:
+            return
+        
+        # Detect state transitions against the last known version of each job
+        transitions = []
+        for job in jobs:
+            previous = self.job_index.get(job['id'])
+            if previous is None or previous.get('status') != job.get('status'):
+                transitions.append((previous, job))
+        
+        for previous, job in transitions:
+            self.queue_estimator.observe(previous, job)
+            self.job_stats.observe(previous, job)
+            if str(job.get('status', '')).upper() == 'ERROR':
+                self.error_clusters.add(job)
+        job_sketches.observe(self.credential, transitions)
+        
+        self.job_index.update(jobs)
+        self.job_timeline.update(jobs)
+        self.job_durations.update(jobs)
+        self.job_cube.update(jobs)
+        
+        # Persist state changes; completed jobs are folded into the usage rollups once
+        if transitions:
+            try:
+                history_store.record_jobs(self.credential, [job for _, job in transitions])
+            except Exception as e:
+                print(f"⚠️ Could not persist job history: {e}")
+            webhook_dispatcher.publish(self.credential, transitions)
+            data_versions.bump(self.credential)
+        
+        # Jobs absent from this fetch are older, not gone, so the snapshot is a partial update;
+        # finished jobs leave the state once they are older than the snapshot retention
+        retention_cutoff = time.time() - snapshot_store.retention_days * 86400
+        expired = lambda job: (str(job.get('status', '')).upper() in TERMINAL_STATUSES and
+                               (job.get('end_time') or job.get('created') or retention_cutoff) < retention_cutoff)
+        try:
+            snapshot_store.record(f"jobs:{self.credential}", {job['id']: job for job in jobs},
+                                  replace=False, expired=expired)
+        except Exception as e:
+            print(f"⚠️ Could not record job snapshot: {e}")
+        
+        # Publish p50/p90 completion estimates for queued and running jobs
+        for job in jobs:
+            eta = self.queue_estimator.eta(job)
+            job["eta"] = eta
+            job["estimated_completion"] = eta["p50"] if eta else None
+        
+        # Wake clients long-polling on these jobs and push the transitions to open streams
+        self.job_watch.publish(jobs)
+        if transitions:
+            event_broadcaster.publish('jobs', {"upserts": {job['id']: job for _, job in transitions}, "removed": []},
+                                      self.credential)
+    
+    def search_jobs(self, prefix=None, backend=None, status=None, tags=None, program_id=None, limit=50):
+        """Search every job this credential has seen through the inverted job index"""
+        return self.job_index.search(prefix=prefix, backend=backend, status=status,
+                                     tags=tags, program_id=program_id, limit=limit)
+    
     def simulate_jobs(self):
         """Simulate quantum job data when not connected to real IBM Quantum"""
         print("ERROR: Job simulation is not allowed in real quantum mode")
@@ -438,23 +915,15 @@ class QuantumBackendManager:
             print("ERROR: Not connected to IBM Quantum. Cannot update with real data.")
             self.backend_data = []
             self.job_data = []
+            data_versions.bump_if_changed(self.credential, None)
             print("No data available - IBM Quantum connection required")
             return
         
         # Real data path - only executes if connected
-        # Get all backends
-        backends = self.get_backends()
+        # Public backend data comes from the shared cache - fetched once for all sessions
+        self.backend_data = self.get_backends()
         
-        # Process backend data
-        backend_data = []
-        for backend in backends:
-            backend_status = self.get_backend_status(backend)
-            if backend_status:  # Only add if we got valid data
-                backend_data.append(backend_status)
-        
-        self.backend_data = backend_data
-        
-        # Only get real job data from IBM Quantum
+        # Only get real job data from IBM Quantum (private to this credential)
         real_jobs = self.get_real_jobs()
         if real_jobs:
             self.job_data = real_jobs
@@ -463,11 +932,18 @@ class QuantumBackendManager:
             print("WARNING: No real jobs found. Dashboard will show empty job list.")
             self.job_data = []
         
+        self.data_updated_at = time.time()
+        data_versions.bump_if_changed(self.credential, [self.backend_data, self.job_data])
+        if event_broadcaster.has_subscribers(self.credential):
+            try:
+                event_broadcaster.publish_changes('metrics', {"metrics": self.get_quantum_metrics()}, self.credential)
+            except Exception as e:
+                print(f"⚠️ Could not publish metrics delta: {e}")
         print(f"Data updated: {len(self.backend_data)} backends, {len(self.job_data)} jobs")
         print(f"Using real quantum data: True")
     
-    def get_quantum_metrics(self):
-        """Get comprehensive quantum metrics for dashboard"""
+    def get_quantum_metrics(self, backend=None):
+        """Get comprehensive quantum metrics for dashboard (every field scoped to one backend if given)"""
         if not self.is_connected:
             return {
                 "active_backends": 0,
@@ -482,31 +958,36 @@ class QuantumBackendManager:
         
         try:
             # Calculate metrics from real data
-            active_backends = len([b for b in self.backend_data if b.get('operational', False)])
-            total_jobs = len(self.job_data)
-            running_jobs = len([j for j in self.job_data if j.get('status', '').lower() in ['running', 'queued']])
-            queued_jobs = len([j for j in self.job_data if j.get('status', '').lower() == 'queued'])
-            
-            # Calculate success rate from completed jobs
-            completed_jobs = [j for j in self.job_data if j.get('status', '').lower() == 'done']
-            success_rate = (len(completed_jobs) / total_jobs * 100) if total_jobs > 0 else 0
-            
-            # Calculate average runtime (simplified)
-            avg_runtime = 300  # Default 5 minutes for quantum jobs
-            
-            # Calculate error rate
-            error_jobs = len([j for j in self.job_data if j.get('status', '').lower() in ['error', 'cancelled']])
-            error_rate = (error_jobs / total_jobs * 100) if total_jobs > 0 else 0
+            backends, jobs = self.backend_data, self.job_data
+            if backend:
+                # Backend names match case-insensitively; the rate and failure-cause lookups below
+                # are keyed by the exact name, so resolve the canonical spelling once
+                known = [b.get('name') for b in backends] + self.job_stats.backends()
+                backend = next((name for name in known if str(name).lower() == str(backend).lower()), backend)
+                backends = [b for b in backends if str(b.get('name', '')).lower() == str(backend).lower()]
+                jobs = [j for j in jobs if self.job_matches(j, backend)]
+            active_backends = len([b for b in backends if b.get('operational', False)])
+            total_jobs = len(jobs)
+            running_jobs = len([j for j in jobs if j.get('status', '').lower() in ['running', 'queued']])
+            queued_jobs = len([j for j in jobs if j.get('status', '').lower() == 'queued'])
+            
+            # Success/error rates and runtime come from windowed counters kept up to date at ingest
+            windows = self.job_stats.rates(backend)
+            headline = windows['7d']
             
             return {
                 "active_backends": active_backends,
                 "total_jobs": total_jobs,
                 "running_jobs": running_jobs,
                 "queued_jobs": queued_jobs,
-                "success_rate": round(success_rate, 1),
-                "avg_runtime": avg_runtime,
-                "error_rate": round(error_rate, 1),
-                "total_backends": len(self.backend_data)
+                "completed_jobs": headline["done"],
+                "success_rate": headline["success_rate"],
+                "avg_runtime": headline["avg_runtime"],
+                "error_rate": headline["error_rate"],
+                "windows": windows,
+                "top_failure_causes": self.error_clusters.top_causes(backend, limit=3),
+                "backend": backend,
+                "total_backends": len(backends)
             }
         except Exception as e:
             print(f"Error calculating metrics: {e}")
@@ -1180,7 +1661,12 @@ class QuantumBackendManager:
             execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Found {len(real_backends)} real hardware backends")
             
             if real_backends:
-                backend_name = real_backends[0].get('name', 'ibmq_manila')
+                # Avoid backends whose latest calibration degraded, unless nothing else is available
+                healthy_backends = [b for b in real_backends if not calibration_monitor.is_degraded(b.get('name'))]
+                for degraded in real_backends:
+                    if degraded not in healthy_backends:
+                        execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] WARNING: {degraded.get('name')} calibration degraded since last snapshot")
+                backend_name = (healthy_backends or real_backends)[0].get('name', 'ibmq_manila')
                 execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Selected real hardware backend: {backend_name}")
             else:
                 # No real hardware available - this should not happen in real mode
@@ -1198,9 +1684,14 @@ class QuantumBackendManager:
             backend = self.provider.get_backend(backend_name)
             execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Got backend object: {backend}")
             
-            # Transpile the circuit for the backend
+            # Transpile the circuit for the backend, starting from the lowest-error connected qubits
             from qiskit import transpile
-            transpiled_circuit = transpile(circuit, backend)
+            layout = layout_index.best_layout(backend_name, circuit.num_qubits)
+            if layout:
+                execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Using initial layout {layout['layout']} (estimated fidelity {layout['estimated_fidelity']:.3f})")
+                transpiled_circuit = transpile(circuit, backend, initial_layout=layout['layout'])
+            else:
+                transpiled_circuit = transpile(circuit, backend)
             execution_log.append(f"[{datetime.datetime.now().strftime('%H:%M:%S')}] Circuit transpiled successfully")
             
             # Execute the circuit
@@ -1226,6 +1717,8 @@ class QuantumBackendManager:
                 'real_data': True,
                 'shots': 1024,
                 'execution_log': execution_log,
+                'calibration_degraded': calibration_monitor.is_degraded(backend_name),
+                'initial_layout': layout['layout'] if layout else None,
                 'circuit_info': {
                     'num_qubits': circuit.num_qubits,
                     'depth': circuit.depth(),
@@ -1287,6 +1780,17 @@ class QuantumBackendManager:
                         fidelity = 1.0 - abs((actual_00 - expected_00) + (actual_11 - expected_11)) / (2 * total_shots)
                         fidelity = max(0.0, min(1.0, fidelity))  # Clamp between 0 and 1
                         
+                        # Every canonical Bell run on hardware feeds the per-backend fidelity leaderboard
+                        # (simulators would top it with ideal fidelities). Bookkeeping failures must
+                        # not throw the real result away in favour of the theoretical fallback.
+                        backend_name = self._extract_backend_name(backend)
+                        if 'simulator' not in backend_name.lower():
+                            try:
+                                fidelity_leaderboard.record(backend_name, fidelity,
+                                                            shots=total_shots, job_id=job.job_id())
+                            except Exception as e:
+                                print(f"⚠️ Could not record Bell fidelity for {backend_name}: {e}")
+                        
                         return {
                             'results': counts,
                             'shots': total_shots,
@@ -1530,9 +2034,6 @@ class QuantumBackendManager:
 # Initialize quantum manager without credentials - will be set by user input
 app.quantum_manager = get_quantum_manager()
 
-# Store user tokens in session (in production, use proper session management)
-user_tokens = {}
-
 @app.route('/')
 def index():
     """Render token input page first, then redirect to dashboard if token exists"""
@@ -1563,15 +2064,20 @@ def set_token():
         if crn:
             user_tokens[f"{session_id}_crn"] = crn
             print(f"CRN provided: {crn[:50]}...")
+        else:
+            user_tokens.pop(f"{session_id}_crn", None)
         
         # Initialize quantum manager with user's token and CRN
         try:
             print("🔄 Initializing QuantumBackendManager...")
-            qm = get_quantum_manager()
+            qm = get_quantum_manager(credential_key(token, crn))
             
-            # Connect with the provided credentials
-            qm.connect_with_credentials(token, crn)
-            print(f"Quantum manager connected for user {session_id}")
+            # Sessions sharing a credential share one connected manager (and its job data)
+            if qm.is_connected:
+                print(f"Reusing connected quantum manager for user {session_id}")
+            else:
+                qm.connect_with_credentials(token, crn)
+                print(f"Quantum manager connected for user {session_id}")
             
             # Return immediately - let the frontend handle the connection status
             # The quantum manager will connect in the background
@@ -1628,12 +2134,21 @@ def get_status():
 def logout():
     """Clear user token and redirect to token input"""
     session_id = request.remote_addr
-    if session_id in user_tokens:
-        del user_tokens[session_id]
+    cred_key = get_session_credential_key(session_id)
+    user_tokens.pop(session_id, None)
+    user_tokens.pop(f"{session_id}_crn", None)
     
-    # Reset quantum manager to disconnected state
-    app.quantum_manager = get_quantum_manager()
-    app.quantum_manager.is_connected = False
+    # Drop the credential's private manager once no session uses it any more
+    if cred_key:
+        still_used = any(
+            get_session_credential_key(other) == cred_key
+            for other in list(user_tokens) if not other.endswith("_crn")
+        )
+        if not still_used:
+            with quantum_managers_lock:
+                qm = quantum_managers.pop(cred_key, None)
+            if qm:
+                qm.is_connected = False
     
     return redirect('/')
 
@@ -1655,6 +2170,38 @@ def advanced_dashboard():
 
 # Modern dashboard route removed - using advanced dashboard as main
 
+@app.route('/assets/<path:filename>')
+def serve_asset(filename):
+    """Serve a fingerprinted static asset from its best precompressed variant, cacheable forever"""
+    asset, current = static_assets.resolve(filename)
+    if asset is None:
+        return jsonify({
+            "error": "Asset not found",
+            "message": f"No static asset matches {filename}"
+        }), 404
+    if not current:
+        # Page rendered before the file changed - send it to the current version
+        return redirect(url_for('serve_asset', filename=asset.fingerprinted))
+    
+    try:
+        accepted = {coding for coding, quality in request.accept_encodings if quality > 0}
+        path, encoding = static_assets.variant(asset, accepted)
+        # send_file hands the open file to the server's wsgi.file_wrapper (sendfile where supported)
+        response = send_file(path, mimetype=asset.mimetype, conditional=True,
+                             etag=f"{asset.digest}-{encoding or 'identity'}")
+    except Exception as e:
+        print(f"Error serving asset {filename}: {e}")
+        return jsonify({
+            "error": "Failed to serve asset",
+            "message": str(e)
+        }), 500
+    
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
+
 @app.route('/api/backends')
 def get_backends():
     """API endpoint to get backend data"""
@@ -1724,10 +2271,7 @@ def get_backends():
     for backend in backend_data:
         try:
             # Create visualization of quantum encoding
-            if hasattr(app, 'quantum_manager') and app.quantum_manager:
-                visualization = app.quantum_manager.create_quantum_visualization(backend)
-            else:
-                visualization = None
+            visualization = qm.create_quantum_visualization(backend)
         except Exception as e:
             visualization = None
             print(f"Error creating visualization: {e}")
@@ -1795,76 +2339,51 @@ def get_jobs():
                 "connection_status": "disconnected"
             }), 503
         
+        # Listing filters, pushed down into the provider query where it supports them
+        try:
+            backend_filter = request.args.get('backend')
+            status_filter = [s.strip().upper() for s in request.args.get('status', '').split(',') if s.strip()]
+            created_after = parse_time_param(request.args.get('created_after'))
+            created_before = parse_time_param(request.args.get('created_before'))
+            limit = max(1, min(int(request.args.get('limit', 20)), 200))
+        except ValueError as e:
+            return jsonify({"error": str(e), "jobs": []}), 400
+        filters = (backend_filter, status_filter, created_after, created_before)
+        
         # Try to get real jobs from IBM Quantum using the working method
         if hasattr(qm.provider, 'jobs'):
             try:
-                real_jobs = qm.provider.jobs(limit=20)
-                if real_jobs:
+                fetched, pushed_down, truncated = qm.fetch_provider_jobs(*filters, limit=limit)
+                if fetched:
                     jobs_data = []
-                    for job in real_jobs:
-                        try:
-                            # Properly extract job information by calling methods
-                            if hasattr(job, 'job_id') and callable(getattr(job, 'job_id', None)):
-                                job_id = job.job_id()
-                            else:
-                                job_id = str(job)
-                            
-                            # Get backend name - try different approaches
-                            backend_name = 'unknown'
-                            if hasattr(job, 'backend_name') and callable(getattr(job, 'backend_name', None)):
-                                backend_name = job.backend_name()
-                            elif hasattr(job, 'backend_name'):
-                                backend_name = job.backend_name
-                            elif hasattr(job, 'backend') and callable(getattr(job, 'backend', None)):
-                                backend_obj = job.backend()
-                                if hasattr(backend_obj, 'name') and callable(getattr(backend_obj, 'name', None)):
-                                    backend_name = backend_obj.name()
-                                elif hasattr(backend_obj, 'name'):
-                                    backend_name = backend_obj.name
-                                else:
-                                    backend_name = str(backend_obj)
-                            
-                            # Get status - try different approaches
-                            status = 'unknown'
-                            if hasattr(job, 'status') and callable(getattr(job, 'status', None)):
-                                status_obj = job.status()
-                                if hasattr(status_obj, 'name'):
-                                    status = status_obj.name
-                                else:
-                                    status = str(status_obj)
-                            elif hasattr(job, 'status'):
-                                status = str(job.status)
-                            
-                            # Create job info with real data
-                            job_info = {
-                                "id": str(job_id),
-                                "backend": str(backend_name),
-                                "status": str(status),
-                                "qubits": 5,  # Default for IBM quantum computers
-                                "created": time.time() - 600,  # Approximate creation time
-                                "real_data": True
-                            }
-                            
-                            jobs_data.append(job_info)
-                            
-                        except Exception as job_err:
-                            print(f"Error processing job {job}: {job_err}")
+                    extracted_jobs = []
+                    for job, job_info in fetched:
+                        if job_info is not None:
+                            # Properly extracted job information (real ids, status and timestamps)
+                            extracted_jobs.append(job_info)
+                        else:
                             # Create fallback job info
                             job_info = {
                                 "id": f"job-{len(jobs_data)}",
                                 "backend": "ibm_quantum",
                                 "status": "completed",
                                 "qubits": 5,
-                                "created": time.time() - 600,
+                                "created": None,
                                 "real_data": True
                             }
-                            jobs_data.append(job_info)
-                            continue
+                        jobs_data.append(job_info)
+                    
+                    # Keep the job indexes in sync with what the dashboard sees
+                    qm._sync_jobs(extracted_jobs)
+                    jobs_data = [job for job in jobs_data if qm.job_matches(job, *filters)][:limit]
                     
                     print(f"✅ Retrieved {len(jobs_data)} real jobs from IBM Quantum")
                     return jsonify({
                         "connected": True,
                         "jobs": jobs_data,
+                        "filters_pushed_down": sorted(pushed_down),
+                        # More matching jobs may exist than were read (page cap reached)
+                        "truncated": truncated,
                         "real_data": True,
                         "timestamp": time.time()
                     })
@@ -1879,6 +2398,15 @@ def get_jobs():
                     
             except Exception as e:
                 print(f"Error fetching real jobs: {e}")
+                indexed = qm.search_indexed_jobs(*filters, limit=limit)
+                if indexed is not None:
+                    return jsonify({
+                        "connected": True,
+                        "jobs": indexed,
+                        "source": "local_index",
+                        "real_data": True,
+                        "timestamp": time.time()
+                    })
                 return jsonify({
                     "error": "Failed to fetch real jobs",
                     "message": str(e),
@@ -1887,10 +2415,10 @@ def get_jobs():
                 }), 500
         
         # If no get_jobs method, try alternative approaches
-        elif hasattr(app.quantum_manager.provider, 'backends'):
+        elif hasattr(qm.provider, 'backends'):
             # Try to get jobs from backends
             try:
-                backends = app.quantum_manager.provider.backends()
+                backends = qm.provider.backends()
                 all_jobs = []
                 
                 for backend in backends[:3]:  # Limit to first 3 backends
@@ -1898,14 +2426,7 @@ def get_jobs():
                         if hasattr(backend, 'jobs'):
                             backend_jobs = backend.jobs(limit=5)
                             for job in backend_jobs:
-                                job_info = {
-                                    "id": job.job_id() if hasattr(job, 'job_id') else str(job.id),
-                                    "backend": backend.name(),
-                                    "status": job.status().name if hasattr(job, 'status') and job.status() else 'unknown',
-                                    "created": job.creation_date().isoformat() if hasattr(job, 'creation_date') and job.creation_date() else None,
-                                    "real_data": True
-                                }
-                                all_jobs.append(job_info)
+                                all_jobs.append(qm._extract_job_info(job))
                     except Exception as be:
                         print(f"Error getting jobs from backend {backend.name()}: {be}")
                         continue
@@ -1938,7 +2459,7 @@ def get_jobs():
         
         # If all else fails, try using the working get_real_jobs method
         try:
-            real_jobs = app.quantum_manager.get_real_jobs()
+            real_jobs = qm.get_real_jobs(*filters, limit=limit)
             if real_jobs:
                 print(f"Retrieved {len(real_jobs)} real jobs using get_real_jobs method")
                 return jsonify({
@@ -1973,103 +2494,1082 @@ def get_jobs():
             "real_data": False
         }), 500
 
-@app.route('/api/test_connection', methods=['POST'])
-def test_connection():
-    """Test IBM Quantum API connection with provided credentials"""
-    # Check if user has provided a token
+@app.route('/api/jobs/search')
+def search_jobs():
+    """Search tracked jobs by id prefix, backend, status, tags and program id"""
     session_id = request.remote_addr
     if session_id not in user_tokens:
         return jsonify({
-            "success": False,
-            "message": "Please provide your IBM Quantum API token first"
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "jobs": []
         }), 401
     
     try:
-        # Use the user's stored token for testing
-        token = user_tokens[session_id]
-        crn = user_tokens.get(f"{session_id}_crn", "")  # Get CRN if stored
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+                "jobs": [],
+                "real_data": False
+            }), 503
         
-        # Test the connection by creating a temporary manager with timeout
         try:
-            import signal
-            
-            def timeout_handler(signum, frame):
-                raise TimeoutError("Connection test timed out")
-            
-            # Set timeout for connection test (30 seconds)
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)
-            
-            try:
-                test_manager = QuantumBackendManager()
-                test_manager.connect_with_credentials(token, crn)
-                
-                # Try to get backends to test the connection
-                backends = test_manager.get_backends()
-                
-                signal.alarm(0)  # Cancel timeout
-                
-                if backends:
-                    return jsonify({
-                        "success": True,
-                        "message": f"Connection successful! Found {len(backends)} backends.",
-                        "backend_count": len(backends)
-                    })
-                else:
-                    return jsonify({
-                        "success": False,
-                        "message": "Connection successful but no backends found. Check your account permissions."
-                    })
-                    
-            except TimeoutError:
-                return jsonify({
-                    "success": False,
-                    "message": "Connection test timed out. IBM Quantum servers may be slow to respond."
-                }), 408
-            finally:
-                signal.alarm(0)  # Ensure timeout is cancelled
-                
-        except Exception as e:
+            limit = max(1, min(int(request.args.get('limit', 50)), 1000))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer", "jobs": []}), 400
+        
+        prefix = request.args.get('q') or request.args.get('id')
+        backend = request.args.get('backend')
+        status = request.args.get('status')
+        tags = request.args.getlist('tag')
+        program_id = request.args.get('program_id')
+        if not any([prefix, backend, status, tags, program_id]):
             return jsonify({
-                "success": False,
-                "message": f"Connection failed: {str(e)}"
-            }), 500
-            
+                "error": "No search criteria",
+                "message": "Provide at least one of q, backend, status, tag or program_id",
+                "jobs": []
+            }), 400
+        
+        started = time.perf_counter()
+        jobs, truncated = qm.search_jobs(prefix=prefix, backend=backend, status=status,
+                                         tags=tags, program_id=program_id, limit=limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        return jsonify({
+            "connected": True,
+            "jobs": jobs,
+            "count": len(jobs),
+            "truncated": truncated,
+            "indexed_jobs": len(qm.job_index),
+            "query_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
     except Exception as e:
+        print(f"Error in /api/jobs/search: {e}")
         return jsonify({
-            "success": False,
-            "message": f"Error testing connection: {str(e)}"
+            "error": "Failed to search jobs",
+            "message": str(e),
+            "jobs": []
         }), 500
 
-@app.route('/api/update_credentials', methods=['POST'])
-def update_credentials():
-    """Update the application with new IBM Quantum credentials"""
-    # Check if user has provided a token
+@app.route('/api/jobs/failures')
+def get_job_failures():
+    """Top failure causes per backend, from clustered error messages of failed jobs"""
     session_id = request.remote_addr
     if session_id not in user_tokens:
         return jsonify({
-            "success": False,
-            "message": "Please provide your IBM Quantum API token first"
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "causes": {}
         }), 401
     
     try:
-        # Use the user's stored token
-        token = user_tokens[session_id]
-        crn = ""  # Optional for basic access
-        
-        # Use the user's stored token for updating
-        token = user_tokens[session_id]
-        crn = ""  # Optional for basic access
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+                "causes": {},
+                "real_data": False
+            }), 503
         
-        # Update the quantum manager with new credentials
         try:
-            if not app.quantum_manager:
-                app.quantum_manager = QuantumBackendManager()
-            
-            app.quantum_manager.connect_with_credentials(token, crn)
-            
-            return jsonify({
-                "success": True,
+            limit = max(1, min(int(request.args.get('limit', 5)), 50))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer", "causes": {}}), 400
+        
+        backend = request.args.get('backend')
+        if backend:
+            causes = {backend: qm.error_clusters.top_causes(backend, limit)}
+        else:
+            causes = qm.error_clusters.top_causes_by_backend(limit)
+        
+        return jsonify({
+            "connected": True,
+            "causes": causes,
+            "overall": qm.error_clusters.top_causes(limit=limit),
+            "clusters": len(qm.error_clusters),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/jobs/failures: {e}")
+        return jsonify({
+            "error": "Failed to get failure causes",
+            "message": str(e),
+            "causes": {}
+        }), 500
+
+@app.route('/api/jobs/<job_id>/wait')
+def wait_for_job(job_id):
+    """Long-poll until a job's status changes (fed by the background poller, no provider calls)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+                "real_data": False
+            }), 503
+        
+        try:
+            timeout = float(request.args.get('timeout', 30))
+            if not math.isfinite(timeout):
+                raise ValueError(timeout)
+            timeout = min(max(timeout, 0.0), 120.0)
+        except ValueError:
+            return jsonify({"error": "timeout must be a number of seconds"}), 400
+        
+        started = time.time()
+        with refresh_scheduler.watching(session_id, qm.credential):
+            job, changed = qm.job_watch.wait(job_id, request.args.get('status'), timeout)
+        if job is None:
+            return jsonify({
+                "error": "Job not found",
+                "message": f"Job {job_id} has not been seen by the job poller yet"
+            }), 404
+        
+        return jsonify({
+            "connected": True,
+            "job": job,
+            "changed": changed,
+            "timed_out": not changed and str(job.get('status', '')).upper() not in TERMINAL_STATUSES,
+            "waited": round(time.time() - started, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/jobs/{job_id}/wait: {e}")
+        return jsonify({
+            "error": "Failed to wait for job",
+            "message": str(e)
+        }), 500
+
+def parse_time_param(value, default=None):
+    """Parse an epoch-seconds or ISO 8601 query parameter into epoch seconds"""
+    if value is None or value == '':
+        return default
+    try:
+        parsed = float(value)
+    except ValueError:
+        parsed = QuantumBackendManager._to_timestamp(value)
+        if parsed is None:
+            raise ValueError(f"Invalid time value: {value}")
+        return parsed
+    # nan / inf (and times past what datetime can hold) would slip through every comparison
+    try:
+        datetime.datetime.fromtimestamp(parsed, datetime.timezone.utc)
+    except (OverflowError, OSError, ValueError):
+        raise ValueError(f"Invalid time value: {value}")
+    return parsed
+
+@app.route('/api/jobs/timeline')
+def get_jobs_timeline():
+    """Jobs that were queued or running on a backend between two times (Gantt view)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "jobs": []
+        }), 401
+    
+    try:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+                "jobs": [],
+                "real_data": False
+            }), 503
+        
+        try:
+            end = parse_time_param(request.args.get('end'), time.time())
+            start = parse_time_param(request.args.get('start'), end - 24 * 3600)
+            limit = request.args.get('limit')
+            limit = max(1, int(limit)) if limit else None
+        except ValueError as e:
+            return jsonify({"error": str(e), "jobs": []}), 400
+        if start > end:
+            return jsonify({"error": "start must not be after end", "jobs": []}), 400
+        
+        backend = request.args.get('backend')
+        started = time.perf_counter()
+        jobs = qm.job_timeline.query(start, end, backend=backend, limit=limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        return jsonify({
+            "connected": True,
+            "backend": backend,
+            "start": start,
+            "end": end,
+            "jobs": jobs,
+            "count": len(jobs),
+            "indexed_jobs": len(qm.job_timeline),
+            "query_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/jobs/timeline: {e}")
+        return jsonify({
+            "error": "Failed to query job timeline",
+            "message": str(e),
+            "jobs": []
+        }), 500
+
+@app.route('/api/backends/leaderboard')
+def get_backend_leaderboard():
+    """Backends ranked by observed Bell-state fidelity (mean, 95% CI and trend)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "leaderboard": []
+        }), 401
+    
+    try:
+        try:
+            limit = request.args.get('limit')
+            limit = max(1, int(limit)) if limit else None
+            min_runs = max(1, int(request.args.get('min_runs', 1)))
+        except ValueError:
+            return jsonify({"error": "limit and min_runs must be integers", "leaderboard": []}), 400
+        
+        circuit = request.args.get('circuit', 'bell_phi_plus')
+        leaderboard = fidelity_leaderboard.leaderboard(circuit, limit=limit, min_runs=min_runs)
+        
+        return jsonify({
+            "circuit": circuit,
+            "leaderboard": leaderboard,
+            "count": len(leaderboard),
+            "circuits": fidelity_leaderboard.circuits(),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/backends/leaderboard: {e}")
+        return jsonify({
+            "error": "Failed to get fidelity leaderboard",
+            "message": str(e),
+            "leaderboard": []
+        }), 500
+
+@app.route('/api/backends/<backend_name>/history')
+def get_backend_history(backend_name):
+    """Pending jobs and operational status trend of a backend (raw, 1m, 1h or 1d buckets)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        try:
+            end = parse_time_param(request.args.get('end'), time.time())
+            start = parse_time_param(request.args.get('start'), end - 24 * 3600)
+            max_points = max(1, min(int(request.args.get('max_points', 500)), 5000))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        if start > end:
+            return jsonify({"error": "start must not be after end"}), 400
+        
+        resolution = request.args.get('resolution', 'auto')
+        try:
+            history = backend_history.query(backend_name, start, end, resolution, max_points)
+        except ValueError as e:
+            return jsonify({"error": str(e), "resolutions": ["auto", "raw", "1m", "1h", "1d"]}), 400
+        if history is None:
+            return jsonify({
+                "error": "No history for backend",
+                "message": f"No samples recorded for {backend_name} yet",
+                "backends": backend_history.backends()
+            }), 404
+        
+        history["real_data"] = True
+        history["timestamp"] = time.time()
+        return jsonify(history)
+        
+    except Exception as e:
+        print(f"Error in /api/backends/{backend_name}/history: {e}")
+        return jsonify({
+            "error": "Failed to get backend history",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/backends/<backend_name>/layout')
+def get_backend_layout(backend_name):
+    """Lowest-error connected set of qubits on a backend, usable as transpile initial_layout"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        graph = layout_index.graph(backend_name)
+        if graph is None:
+            return jsonify({
+                "error": "No coupling map for backend",
+                "message": f"No calibration data loaded for {backend_name} yet",
+                "backends": layout_index.backends()
+            }), 404
+        try:
+            k = int(request.args.get('qubits', 2))
+        except ValueError:
+            return jsonify({"error": "qubits must be an integer"}), 400
+        if not 1 <= k <= graph.num_qubits:
+            return jsonify({"error": f"qubits must be between 1 and {graph.num_qubits}"}), 400
+        
+        started = time.perf_counter()
+        layout = graph.best_layout(k)
+        distances = graph.distances()
+        hops = graph.hops()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if layout is None:
+            return jsonify({
+                "error": "No connected layout",
+                "message": f"{backend_name} has no connected set of {k} qubits"
+            }), 404
+        
+        layout = dict(layout)
+        # Error-weighted shortest-path costs between the chosen qubits (all reachable: the layout is connected)
+        layout["distances"] = np.round(distances[np.ix_(layout["layout"], layout["layout"])], 6).tolist()
+        layout["hops"] = hops[np.ix_(layout["layout"], layout["layout"])].tolist()
+        # A coupling map split into several components has no diameter
+        unreachable = int(np.count_nonzero(hops < 0)) // 2
+        layout.update({
+            "backend": backend_name,
+            "qubits": k,
+            "num_qubits": graph.num_qubits,
+            "num_edges": len(graph.edges),
+            "diameter": int(hops.max()) if not unreachable else None,
+            "unreachable_pairs": unreachable,
+            "calibration_updated": graph.updated,
+            "search_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        return jsonify(layout)
+        
+    except Exception as e:
+        print(f"Error in /api/backends/{backend_name}/layout: {e}")
+        return jsonify({
+            "error": "Failed to find qubit layout",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/calibration/anomalies')
+def get_calibration_anomalies():
+    """Qubits and couplers whose calibration degraded since the previous snapshot"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        backend = request.args.get('backend')
+        started = time.perf_counter()
+        report = calibration_monitor.scan(backend)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if backend and not report:
+            return jsonify({
+                "error": "No calibration history for backend",
+                "message": f"No calibration snapshots recorded for {backend} yet",
+                "backends": calibration_monitor.backends()
+            }), 404
+        
+        return jsonify({
+            "backends": report,
+            "degraded_backends": sorted(name for name, entry in report.items() if entry["degraded"]),
+            "scan_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/calibration/anomalies: {e}")
+        return jsonify({
+            "error": "Failed to scan calibrations",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/calibration/history/<backend_name>')
+def get_calibration_history(backend_name):
+    """Archived T1 / T2 / readout / gate error history of a backend, per qubit or summarized"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        metric = request.args.get('metric', 't1')
+        if metric not in ('t1', 't2', 'readout_error', 'gate_error'):
+            return jsonify({
+                "error": f"Unknown metric: {metric}",
+                "metrics": ["t1", "t2", "readout_error", "gate_error"]
+            }), 400
+        try:
+            end = parse_time_param(request.args.get('end'), time.time())
+            start = parse_time_param(request.args.get('start'), end - 30 * 24 * 3600)
+            qubit = request.args.get('qubit')
+            qubit = [int(q) for q in qubit.split('-')] if qubit else None
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        segments = calibration_archive.load(backend_name, start, end)
+        if not segments:
+            return jsonify({
+                "error": "No calibration archive for backend",
+                "message": f"No calibration snapshots archived for {backend_name} in this window",
+                "archive": calibration_archive.stats()
+            }), 404
+        
+        times, series = [], []
+        for segment in segments:
+            values = segment.get(metric)
+            if values is None:
+                continue
+            if qubit is not None:
+                if metric == 'gate_error':
+                    edge = tuple(sorted(qubit))
+                    column = segment["edges"].index(edge) if edge in segment["edges"] else None
+                else:
+                    column = qubit[0] if qubit[0] < segment["num_qubits"] else None
+                if column is None:
+                    continue
+                points = values[:, column]
+                series.extend({"value": None if np.isnan(v) else float(v)} for v in points)
+            else:
+                # Per-snapshot distribution across all qubits / couplers
+                with np.errstate(all='ignore'):
+                    summary = np.nanpercentile(values, [0, 10, 50, 90, 100], axis=1)
+                series.extend({
+                    "min": None if np.isnan(row[0]) else float(row[0]),
+                    "p10": None if np.isnan(row[1]) else float(row[1]),
+                    "median": None if np.isnan(row[2]) else float(row[2]),
+                    "p90": None if np.isnan(row[3]) else float(row[3]),
+                    "max": None if np.isnan(row[4]) else float(row[4])
+                } for row in summary.T)
+            times.extend(segment["times"].tolist())
+        
+        for timestamp, point in zip(times, series):
+            point["timestamp"] = timestamp
+        return jsonify({
+            "backend": backend_name,
+            "metric": metric,
+            "qubit": "-".join(str(q) for q in qubit) if qubit is not None else None,
+            "start": start,
+            "end": end,
+            "points": series,
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/calibration/history/{backend_name}: {e}")
+        return jsonify({
+            "error": "Failed to load calibration history",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/snapshot')
+def get_snapshot():
+    """Fleet and job state as it was at a past time, rebuilt from checkpoints and deltas"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        try:
+            at = parse_time_param(request.args.get('at'), time.time())
+            limit = max(1, min(int(request.args.get('limit', 100)), 1000))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        started = time.perf_counter()
+        backends, fleet_as_of = snapshot_store.state_at('fleet', at)
+        jobs, jobs_as_of = snapshot_store.state_at(f"jobs:{get_session_credential_key(session_id)}", at)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if backends is None and jobs is None:
+            return jsonify({
+                "error": "No snapshot before this time",
+                "message": "Nothing was recorded at or before the requested time",
+                "at": at
+            }), 404
+        
+        jobs = sorted((jobs or {}).values(), key=lambda job: job.get('created') or 0, reverse=True)
+        return jsonify({
+            "at": at,
+            "backends": sorted((backends or {}).values(), key=lambda b: str(b.get('name'))),
+            "backends_as_of": fleet_as_of,
+            "jobs": jobs[:limit],
+            "total_jobs": len(jobs),
+            "jobs_as_of": jobs_as_of,
+            "reconstruct_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/snapshot: {e}")
+        return jsonify({
+            "error": "Failed to reconstruct snapshot",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/analytics/durations')
+def get_duration_analytics():
+    """Queue time, run time and throughput per backend (percentiles and histograms)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token"
+            }), 503
+        try:
+            start = parse_time_param(request.args.get('start'))
+            end = parse_time_param(request.args.get('end'))
+            bins = max(2, min(int(request.args.get('bins', 20)), 100))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        started = time.perf_counter()
+        backends = qm.job_durations.statistics(request.args.get('backend'), start, end, bins)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        return jsonify({
+            "backends": backends,
+            "jobs_tracked": len(qm.job_durations),
+            "start": start,
+            "end": end,
+            "compute_time_ms": round(elapsed_ms, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/analytics/durations: {e}")
+        return jsonify({
+            "error": "Failed to compute duration analytics",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/analytics/cube')
+def get_analytics_cube():
+    """Job counts and durations sliced by backend, status, hour of week and instance"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "cells": []
+        }), 401
+    
+    try:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token",
+                "cells": []
+            }), 503
+        
+        group_by = [dimension.strip() for dimension in request.args.get('group_by', 'backend,status').split(',') if dimension.strip()]
+        filters = {}
+        try:
+            for dimension in CUBE_DIMENSIONS:
+                values = [value.strip() for value in request.args.get(dimension, '').split(',') if value.strip()]
+                if values:
+                    if dimension == 'hour_of_week':
+                        values = [int(value) for value in values]
+                    elif dimension == 'status':
+                        values = [value.upper() for value in values]
+                    filters[dimension] = values
+            cells = qm.job_cube.query(group_by, filters)
+        except ValueError as e:
+            return jsonify({"error": str(e), "dimensions": list(CUBE_DIMENSIONS), "cells": []}), 400
+        
+        return jsonify({
+            "cells": cells,
+            "group_by": [dimension for dimension in CUBE_DIMENSIONS if dimension in group_by],
+            "filters": filters,
+            "dimensions": qm.job_cube.dimensions(),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/analytics/cube: {e}")
+        return jsonify({
+            "error": "Failed to query job cube",
+            "message": str(e),
+            "cells": []
+        }), 500
+
+@app.route('/api/analytics/sketches')
+def get_sketch_analytics():
+    """Top programs / tags by job count and distinct users per backend across all accounts"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        try:
+            limit = max(1, min(int(request.args.get('limit', 10)), job_sketches.capacity))
+        except ValueError:
+            return jsonify({"error": "limit must be an integer"}), 400
+        
+        summary = job_sketches.summary(limit)
+        summary.update({
+            "approximate": True,
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        return jsonify(summary)
+        
+    except Exception as e:
+        print(f"Error in /api/analytics/sketches: {e}")
+        return jsonify({
+            "error": "Failed to read job sketches",
+            "message": str(e)
+        }), 500
+
+def view_json(view):
+    """Call a JSON view function in the current request and unwrap (payload, status code)"""
+    response = view()
+    status = 200
+    if isinstance(response, tuple):
+        response, status = response[0], response[1]
+    return response.get_json(), status
+
+def bundle_backends(qm):
+    """Backends widget section built from the manager's refreshed snapshot"""
+    backends = []
+    for backend in qm.backend_data:
+        try:
+            visualization = qm.create_quantum_visualization(backend)
+        except Exception as e:
+            visualization = None
+            print(f"Error creating visualization: {e}")
+        backends.append({
+            "name": backend.get("name", "Unknown"),
+            "status": "active",
+            "pending_jobs": backend.get("pending_jobs", 0),
+            "operational": backend.get("operational", True),
+            "num_qubits": backend.get("num_qubits", 5),
+            "visualization": visualization,
+            "real_data": backend.get("real_data", True)
+        })
+    return {"connected": True, "backends": backends, "real_data": True, "timestamp": time.time()}, 200
+
+def bundle_jobs(qm):
+    """Jobs widget section built from the manager's refreshed snapshot"""
+    return {"connected": True, "jobs": qm.job_data, "real_data": True, "timestamp": time.time()}, 200
+
+# Section name -> (cache seconds, builder, built from the backends / jobs snapshot). Builders take
+# the quantum manager; sections without provider traffic of their own reuse the standalone
+# endpoint's view function. Snapshot sections are also rebuilt whenever the snapshot is refreshed,
+# the others (circuit runs, visualizations) only once their TTL expires.
+DASHBOARD_SECTIONS = {
+    "backends": (30, bundle_backends, True),
+    "jobs": (10, bundle_jobs, True),
+    "metrics": (10, lambda qm: view_json(api_metrics), True),
+    "measurement_results": (60, lambda qm: view_json(api_measurement_results), False),
+    "entanglement": (60, lambda qm: view_json(api_entanglement_data), False),
+    "quantum_state": (30, lambda qm: view_json(api_quantum_state_data), False),
+    "circuit": (120, lambda qm: view_json(get_circuit_data), False)
+}
+
+@app.route('/api/dashboard_bundle')
+def get_dashboard_bundle():
+    """Every dashboard widget section in one response, computed from one shared data snapshot"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "connected": False
+        }), 401
+    
+    try:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
+            return jsonify({
+                "error": "Not connected to IBM Quantum",
+                "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+                "connected": False
+            }), 503
+        
+        requested = [name.strip() for name in request.args.get('sections', ','.join(DASHBOARD_SECTIONS)).split(',') if name.strip()]
+        unknown = [name for name in requested if name not in DASHBOARD_SECTIONS]
+        if unknown:
+            return jsonify({
+                "error": f"Unknown section: {', '.join(unknown)}",
+                "sections": list(DASHBOARD_SECTIONS)
+            }), 400
+        
+        # Backends + jobs are refreshed by the background updater (woken by this request's
+        # client activity); only a manager that has never been refreshed is loaded inline
+        started = time.perf_counter()
+        if qm.data_updated_at is None:
+            qm.update_data()
+        
+        sections, errors, cached = {}, {}, []
+        now = time.time()
+        for name in requested:
+            ttl, builder, from_snapshot = DASHBOARD_SECTIONS[name]
+            key = (qm.credential, name)
+            with dashboard_section_cache_lock:
+                entry = dashboard_section_cache.get(key)
+            if entry is not None and entry[0] > now and (not from_snapshot or entry[1] >= (qm.data_updated_at or 0)):
+                payload, status = entry[2], entry[3]
+                cached.append(name)
+            else:
+                try:
+                    payload, status = builder(qm)
+                except Exception as e:
+                    print(f"Error building dashboard section {name}: {e}")
+                    payload, status = None, 500
+                if status == 200:
+                    with dashboard_section_cache_lock:
+                        dashboard_section_cache[key] = (now + ttl, qm.data_updated_at or 0, payload, status)
+            if status == 200:
+                sections[name] = payload
+            else:
+                sections[name] = None
+                errors[name] = (payload or {}).get("error") or f"HTTP {status}"
+        
+        return jsonify({
+            "connected": True,
+            "sections": sections,
+            "errors": errors,
+            "cached_sections": cached,
+            "data_updated_at": qm.data_updated_at,
+            "build_time_ms": round((time.perf_counter() - started) * 1000, 3),
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/dashboard_bundle: {e}")
+        return jsonify({
+            "error": "Failed to build dashboard bundle",
+            "message": str(e),
+            "connected": False
+        }), 500
+
+@app.route('/api/stream')
+def stream_events():
+    """Server-Sent Events stream of backend, job and metrics deltas pushed by the refresh loop"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    qm = get_quantum_manager()
+    if not qm or not qm.is_connected:
+        return jsonify({
+            "error": "Not connected to IBM Quantum",
+            "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum",
+            "connected": False
+        }), 503
+    
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    credential = qm.credential
+    
+    def generate():
+        # Subscribe only once the response is iterated, so the finally below always unsubscribes
+        subscription, replayed = event_broadcaster.subscribe(credential, last_event_id)
+        print(f"📡 Event stream opened for {session_id} ({event_broadcaster.status()['subscribers']} subscribers)")
+        try:
+            # An open stream keeps the credential on the fast refresh interval
+            with refresh_scheduler.watching(session_id, credential):
+                yield "retry: 5000\n\n"
+                if replayed is None:
+                    yield "event: resync\ndata: {}\n\n"
+                else:
+                    yield from replayed
+                while True:
+                    frames, overflowed = subscription.next(timeout=15.0)
+                    if overflowed:
+                        yield "event: resync\ndata: {}\n\n"
+                    if frames:
+                        yield ''.join(frames)
+                    elif not overflowed:
+                        yield ": keepalive\n\n"
+        finally:
+            event_broadcaster.unsubscribe(subscription)
+            print(f"📡 Event stream closed for {session_id}")
+    
+    return Response(generate(), mimetype='text/event-stream', headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"
+    })
+
+@app.route('/api/usage')
+def get_usage():
+    """QPU seconds, shots and circuits per day, backend and instance from pre-aggregated rollups"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "usage": []
+        }), 401
+    
+    try:
+        try:
+            end = parse_time_param(request.args.get('end'), time.time())
+            start = parse_time_param(request.args.get('start'), end - 30 * 24 * 3600)
+        except ValueError as e:
+            return jsonify({"error": str(e), "usage": []}), 400
+        
+        group_by = [dimension.strip() for dimension in request.args.get('group_by', 'day,backend,instance').split(',') if dimension.strip()]
+        invalid = [dimension for dimension in group_by if dimension not in ('day', 'backend', 'instance')]
+        if invalid:
+            return jsonify({"error": f"Invalid group_by: {', '.join(invalid)}", "usage": []}), 400
+        
+        credential = get_session_credential_key(session_id)
+        rows, totals = history_store.usage(credential, start, end, group_by)
+        
+        return jsonify({
+            "usage": rows,
+            "totals": totals,
+            "group_by": group_by,
+            "start": start,
+            "end": end,
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/usage: {e}")
+        return jsonify({
+            "error": "Failed to get usage",
+            "message": str(e),
+            "usage": []
+        }), 500
+
+@app.route('/api/jobs/daily')
+def get_daily_jobs():
+    """Finished jobs per day, backend and status from the history store (raw and compacted rows)"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first",
+            "days": []
+        }), 401
+    
+    try:
+        try:
+            end = parse_time_param(request.args.get('end'), time.time())
+            start = parse_time_param(request.args.get('start'), end - 30 * 24 * 3600)
+        except ValueError as e:
+            return jsonify({"error": str(e), "days": []}), 400
+        
+        rows = history_store.daily_jobs(get_session_credential_key(session_id), start, end,
+                                        backend=request.args.get('backend'))
+        return jsonify({
+            "days": rows,
+            "count": len(rows),
+            "start": start,
+            "end": end,
+            "real_data": True,
+            "timestamp": time.time()
+        })
+        
+    except Exception as e:
+        print(f"Error in /api/jobs/daily: {e}")
+        return jsonify({
+            "error": "Failed to get daily job history",
+            "message": str(e),
+            "days": []
+        }), 500
+
+@app.route('/api/webhooks', methods=['GET', 'POST'])
+def manage_webhooks():
+    """List or create webhook subscriptions for the current credential's job transitions"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    credential = get_session_credential_key(session_id)
+    try:
+        if request.method == 'GET':
+            subscriptions = webhook_dispatcher.subscriptions(credential)
+            return jsonify({"webhooks": subscriptions, "count": len(subscriptions)})
+        
+        data = request.get_json(silent=True) or {}
+        backends = data.get('backends') or ([data['backend']] if data.get('backend') else None)
+        statuses = data.get('statuses') or ([data['status']] if data.get('status') else None)
+        try:
+            subscription = webhook_dispatcher.subscribe(credential, data.get('url', ''), backends=backends,
+                                                        statuses=statuses, secret=data.get('secret'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        print(f"✅ Webhook subscription {subscription.id} created for {subscription.url}")
+        return jsonify({"success": True, "webhook": subscription.to_dict()}), 201
+        
+    except Exception as e:
+        print(f"Error in /api/webhooks: {e}")
+        return jsonify({
+            "error": "Failed to manage webhooks",
+            "message": str(e)
+        }), 500
+
+@app.route('/api/webhooks/<subscription_id>', methods=['DELETE'])
+def delete_webhook(subscription_id):
+    """Remove a webhook subscription"""
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "error": "Authentication required",
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    if not webhook_dispatcher.unsubscribe(get_session_credential_key(session_id), subscription_id):
+        return jsonify({"error": "Webhook subscription not found"}), 404
+    return jsonify({"success": True, "id": subscription_id})
+
+@app.route('/api/test_connection', methods=['POST'])
+def test_connection():
+    """Test IBM Quantum API connection with provided credentials"""
+    # Check if user has provided a token
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "success": False,
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        # Use the user's stored token for testing
+        token = user_tokens[session_id]
+        crn = user_tokens.get(f"{session_id}_crn", "")  # Get CRN if stored
+        
+        # Test the connection by creating a temporary manager with timeout
+        try:
+            import signal
+            
+            def timeout_handler(signum, frame):
+                raise TimeoutError("Connection test timed out")
+            
+            # Set timeout for connection test (30 seconds)
+            signal.signal(signal.SIGALRM, timeout_handler)
+            signal.alarm(30)
+            
+            try:
+                test_manager = QuantumBackendManager()
+                test_manager.connect_with_credentials(token, crn)
+                
+                # Try to get backends to test the connection
+                backends = test_manager.get_backends()
+                
+                signal.alarm(0)  # Cancel timeout
+                
+                if backends:
+                    return jsonify({
+                        "success": True,
+                        "message": f"Connection successful! Found {len(backends)} backends.",
+                        "backend_count": len(backends)
+                    })
+                else:
+                    return jsonify({
+                        "success": False,
+                        "message": "Connection successful but no backends found. Check your account permissions."
+                    })
+                    
+            except TimeoutError:
+                return jsonify({
+                    "success": False,
+                    "message": "Connection test timed out. IBM Quantum servers may be slow to respond."
+                }), 408
+            finally:
+                signal.alarm(0)  # Ensure timeout is cancelled
+                
+        except Exception as e:
+            return jsonify({
+                "success": False,
+                "message": f"Connection failed: {str(e)}"
+            }), 500
+            
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "message": f"Error testing connection: {str(e)}"
+        }), 500
+
+@app.route('/api/update_credentials', methods=['POST'])
+def update_credentials():
+    """Update the application with new IBM Quantum credentials"""
+    # Check if user has provided a token
+    session_id = request.remote_addr
+    if session_id not in user_tokens:
+        return jsonify({
+            "success": False,
+            "message": "Please provide your IBM Quantum API token first"
+        }), 401
+    
+    try:
+        # Use the user's stored token
+        token = user_tokens[session_id]
+        crn = ""  # Optional for basic access
+        
+        # Use the user's stored token for updating
+        token = user_tokens[session_id]
+        crn = ""  # Optional for basic access
+        
+        # Update the quantum manager with new credentials
+        try:
+            get_quantum_manager().connect_with_credentials(token, crn)
+            
+            return jsonify({
+                "success": True,
                 "message": "Credentials updated successfully"
             })
             
@@ -2118,15 +3618,11 @@ def get_dashboard_state():
         # Get real metrics from quantum manager
         quantum_manager = qm
         
-        # Get real backend information
+        # Get real backend information from the shared public cache
         try:
-            if hasattr(quantum_manager.provider, 'backends'):
-                backends = quantum_manager.provider.backends()
-                active_backends = len([b for b in backends if hasattr(b, 'status') and b.status().operational])
-                inactive_backends = len(backends) - active_backends
-            else:
-                active_backends = 0
-                inactive_backends = 0
+            backends = quantum_manager.get_backends()
+            active_backends = len([b for b in backends if b.get('operational', False)])
+            inactive_backends = len(backends) - active_backends
         except Exception as e:
             print(f"Error getting backend metrics: {e}")
             active_backends = 0
@@ -2501,14 +3997,15 @@ def apply_quantum_gate():
         qubit = data.get('qubit', 0)
         
         # Check if we have a quantum manager
-        if not hasattr(app, 'quantum_manager') or not app.quantum_manager:
+        qm = get_quantum_manager()
+        if not qm:
             return jsonify({
                 "error": "Quantum manager not initialized",
                 "message": "Please restart the application"
             }), 500
         
         # Apply the quantum gate
-        new_state = app.quantum_manager.apply_quantum_gate(gate_type, qubit, angle)
+        new_state = qm.apply_quantum_gate(gate_type, qubit, angle)
         if not new_state:
             return jsonify({
                 "error": "Failed to apply quantum gate",
@@ -2516,7 +4013,7 @@ def apply_quantum_gate():
             }), 500
         
         # Get updated state information
-        state_info = app.quantum_manager.get_quantum_state_info()
+        state_info = qm.get_quantum_state_info()
         
         return jsonify({
             "success": True,
@@ -2546,14 +4043,15 @@ def get_quantum_visualization_data():
     
     try:
         # Check if we have a quantum manager
-        if not hasattr(app, 'quantum_manager'):
+        quantum_manager = get_quantum_manager()
+        if not quantum_manager:
             return jsonify({
                 "error": "Quantum manager not initialized",
                 "message": "Please restart the application"
             }), 500
         
         # Check connection status
-        if not app.quantum_manager.is_connected:
+        if not quantum_manager.is_connected:
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Network connection issue - cannot reach IBM Quantum servers",
@@ -2561,9 +4059,6 @@ def get_quantum_visualization_data():
                 "network_issue": "DNS resolution failed for api.quantum-computing.ibm.com"
             }), 503
         
-        # Get real quantum data
-        quantum_manager = app.quantum_manager
-        
         # Get real quantum state
         state_info = quantum_manager.get_quantum_state_info()
         if state_info:
@@ -2717,14 +4212,13 @@ def get_real_features_summary():
     
     try:
         # Check if we have a quantum manager with real connection
-        if not hasattr(app, 'quantum_manager') or not app.quantum_manager or not app.quantum_manager.is_connected:
+        quantum_manager = get_quantum_manager()
+        if not quantum_manager or not quantum_manager.is_connected:
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please check your API token and network connection"
             }), 503
         
-        quantum_manager = app.quantum_manager
-        
         # Get real backend information
         backends = quantum_manager.get_backends()
         backend_count = len(backends) if backends else 0
@@ -2844,6 +4338,69 @@ def initialize_quantum_manager():
         app.quantum_manager = get_quantum_manager()  # Initialize with default manager
         print("✅ Quantum manager ready for real IBM Quantum connection")
 
+@app.before_request
+def track_active_client():
+    """Count dashboard requests as demand for fresh data on the client's credential"""
+    if request.path.startswith(('/static', '/assets')):
+        return
+    refresh_scheduler.touch(request.remote_addr, get_session_credential_key(request.remote_addr))
+
+# Read endpoints built only from the fleet and credential snapshots the version counters cover.
+# Endpoint -> seconds its sliding windows take to move (None when it has none); other stores
+# (sketches, webhooks, leaderboard, usage rollups) change without a bump, so they get no ETag.
+VERSIONED_ENDPOINTS = {
+    'get_backends': None,
+    'get_jobs': None,
+    'api_metrics': 60  # slot width of the shortest job_stats window
+}
+
+def request_etag():
+    """ETag of a GET API request, or None if its response is not derived from versioned data"""
+    if request.method not in ('GET', 'HEAD') or request.endpoint not in VERSIONED_ENDPOINTS:
+        return None
+    # Unauthenticated requests get demo data, versioned with the default manager
+    credential = get_session_credential_key(request.remote_addr) or 'default'
+    scopes = [FLEET, credential]
+    window = VERSIONED_ENDPOINTS[request.endpoint]
+    if window:
+        scopes.append(f"window:{int(time.time() // window)}")
+    return data_versions.etag(request.full_path, scopes)
+
+@app.before_request
+def answer_not_modified():
+    """Answer a poll with 304 when the client already holds the current version"""
+    g.etag = request_etag()
+    if g.etag is None or not request.if_none_match.contains_weak(g.etag):
+        return None
+    
+    # Only trust the version while the refresh loop keeps the credential's data fresh;
+    # otherwise let the view run (and refresh) as usual
+    credential = get_session_credential_key(request.remote_addr)
+    if credential:
+        with quantum_managers_lock:
+            qm = quantum_managers.get(credential)
+        if qm is None or not qm.is_connected or qm.data_updated_at is None:
+            return None
+        if time.time() - qm.data_updated_at > 2 * refresh_scheduler.interval(credential):
+            return None
+    
+    response = app.response_class(status=304)
+    response.set_etag(g.etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.after_request
+def add_etag(response):
+    """Tag successful reads with the version they were built from; count writes as changes"""
+    etag = g.get('etag')
+    if etag is not None and response.status_code == 200:
+        # Computed before the view ran, so a refresh during the view only costs one extra 200
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'no-cache'
+    elif request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+        data_versions.bump(get_session_credential_key(request.remote_addr) or 'default')
+    return response
+
 
 
 @app.route('/api/results')
@@ -2858,14 +4415,15 @@ def get_results():
         }), 401
     
     try:
-        if not hasattr(app, 'quantum_manager') or not app.quantum_manager or not app.quantum_manager.is_connected:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum"
             }), 503
 
         # Get real measurement results from quantum jobs
-        results_data = app.quantum_manager.get_measurement_results()
+        results_data = qm.get_measurement_results()
         return jsonify(results_data)
     except Exception as e:
         print(f"Error in /api/results: {e}")
@@ -2883,14 +4441,15 @@ def get_performance():
         }), 401
     
     try:
-        if not hasattr(app, 'quantum_manager') or not app.quantum_manager or not app.quantum_manager.is_connected:
+        qm = get_quantum_manager()
+        if not qm or not qm.is_connected:
             return jsonify({
                 "error": "Not connected to IBM Quantum",
                 "message": "Please provide a valid IBM Quantum API token and ensure you are connected to IBM Quantum"
             }), 503
 
         # Get real performance data
-        performance_data = app.quantum_manager.get_performance_metrics()
+        performance_data = qm.get_performance_metrics()
         return jsonify(performance_data)
     except Exception as e:
         print(f"Error in /api/performance: {e}")
@@ -2962,19 +4521,24 @@ if __name__ == '__main__':
     # Start background thread to update data periodically
     def update_thread():
         while True:
-            try:
-                # Only update if quantum manager exists and is connected
-                qm = get_quantum_manager()
-                if qm and qm.is_connected:
-                    qm.update_data()
+            # Update every credential that is due - backend data is fetched once via the
+            # shared public cache, so each extra user only adds their own job traffic.
+            # Watched credentials are due every few seconds, idle ones on a slow heartbeat.
+            managers = {qm.credential: qm for qm in get_all_quantum_managers() if qm.is_connected}
+            for credential in refresh_scheduler.due(managers):
+                try:
+                    managers[credential].update_data()
                     print("Successfully updated quantum data")
-                # Don't print "not available" messages - just silently skip
-            except Exception as e:
-                print(f"Error in background update: {e}")
+                except Exception as e:
+                    print(f"Error in background update: {e}")
+                refresh_scheduler.mark_refreshed(credential)
                 
-            # Sleep longer to reduce server load
-            time.sleep(60)  # Update every 60 seconds instead of 30
+            # Sleep until the next credential is due, or until a client shows up
+            refresh_scheduler.wait(managers)
             
+    # Build the gzip / brotli variants of the static assets up front instead of on first request
+    threading.Thread(target=static_assets.precompress, daemon=True).start()
+    
     # Start the update thread with a 5 second delay to let app initialize
     threading.Timer(5.0, lambda: threading.Thread(
         target=update_thread, 
@@ -3029,8 +4593,8 @@ def api_metrics():
                 }
             }), 503
         
-        # Get comprehensive metrics
-        metrics = qm.get_quantum_metrics()
+        # Get comprehensive metrics (optionally for a single backend)
+        metrics = qm.get_quantum_metrics(request.args.get('backend'))
         
         return jsonify({
             "connected": True,
@@ -0,0 +1,120 @@
+"""
+Refresh Scheduler Module
+Demand-driven refresh timing for the background updater. Requests and open
+long-lived connections mark their credential as watched; watched credentials are
+refreshed on a short interval, the rest only on a slow heartbeat. A client showing
+up after an idle period wakes the updater at once instead of waiting out the heartbeat.
+"""
+
+import contextlib
+import threading
+import time
+
+ACTIVE_INTERVAL = 15  # seconds between refreshes while someone is watching
+IDLE_INTERVAL = 300  # heartbeat when nobody is
+ACTIVE_WINDOW = 90  # seconds a request keeps its client counted as active
+
+
+class RefreshScheduler:
+    """Tracks active clients per credential and decides which credentials are due"""
+
+    def __init__(self, active_interval=ACTIVE_INTERVAL, idle_interval=IDLE_INTERVAL, active_window=ACTIVE_WINDOW):
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.active_window = active_window
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._clients = {}  # client id -> (credential, last request time)
+        self._streams = {}  # (client id, credential) -> number of open streams
+        self._refreshed = {}  # credential -> last refresh time
+
+    def touch(self, client, credential=None, now=None):
+        """Record a request from a client; wakes the updater if its credential was idle"""
+        now = time.time() if now is None else now
+        with self._lock:
+            was_active = credential is not None and self._is_active(credential, now)
+            self._clients[client] = (credential, now)
+        if credential is not None and not was_active:
+            self._wake.set()
+
+    @contextlib.contextmanager
+    def watching(self, client, credential):
+        """Count a long-lived connection (stream, long poll) as an active client while open"""
+        key = (client, credential)
+        with self._lock:
+            was_active = self._is_active(credential, time.time())
+            self._streams[key] = self._streams.get(key, 0) + 1
+        if not was_active:
+            self._wake.set()
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._streams[key] <= 1:
+                    del self._streams[key]
+                else:
+                    self._streams[key] -= 1
+
+    def active_credentials(self, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            self._prune(now)
+            return ({credential for credential, _ in self._clients.values() if credential is not None} |
+                    {credential for _, credential in self._streams})
+
+    def interval(self, credential, now=None):
+        """Refresh interval currently applying to a credential"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return self.active_interval if self._is_active(credential, now) else self.idle_interval
+
+    def due(self, credentials, now=None):
+        """Get the credentials whose refresh interval has elapsed"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self._prune(now)
+            return [credential for credential in credentials
+                    if now - self._refreshed.get(credential, 0.0) >= self._interval(credential, now)]
+
+    def mark_refreshed(self, credential, now=None):
+        with self._lock:
+            self._refreshed[credential] = time.time() if now is None else now
+
+    def wait(self, credentials, now=None):
+        """
+        Sleep until the next credential is due or a new client arrives.
+
+        Returns:
+            bool: Whether the wait was cut short by a client becoming active
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            remaining = [self._refreshed.get(credential, 0.0) + self._interval(credential, now) - now
+                         for credential in credentials]
+        timeout = max(min(remaining, default=self.idle_interval), 1.0)
+        woken = self._wake.wait(timeout)
+        self._wake.clear()
+        return woken
+
+    def status(self):
+        now = time.time()
+        with self._lock:
+            self._prune(now)
+            return {
+                "active_clients": len(self._clients),
+                "open_streams": sum(self._streams.values()),
+                "active_interval": self.active_interval,
+                "idle_interval": self.idle_interval
+            }
+
+    def _interval(self, credential, now):
+        return self.active_interval if self._is_active(credential, now) else self.idle_interval
+
+    def _is_active(self, credential, now):
+        if any(key[1] == credential for key in self._streams):
+            return True
+        return any(c == credential and now - seen < self.active_window for c, seen in self._clients.values())
+
+    def _prune(self, now):
+        for client in [client for client, (_, seen) in self._clients.items() if now - seen >= self.active_window]:
+            del self._clients[client]
@@ -0,0 +1,338 @@
+"""
+Streaming Sketches Module
+Bounded-memory, mergeable summaries for high-volume job statistics: t-digests for
+duration quantiles, Count-Min sketches for heavy hitters, HyperLogLog counters
+for distinct counts and Bloom filters for "seen before" checks.
+"""
+
+import bisect
+import hashlib
+import math
+import threading
+
+import numpy as np
+
+
+class TDigest:
+    """
+    Merging t-digest for streaming quantile estimation.
+
+    Values are buffered and periodically merged into at most O(compression)
+    centroids, so memory stays bounded however many values are added. Centroids
+    near the tails are kept small, which keeps p90/p99 estimates accurate.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = []
+        self._weights = []
+        self._buffer = []
+        self._buffer_size = compression * 5
+
+    def __len__(self):
+        return self.count
+
+    def add(self, value, weight=1):
+        """Add a value (amortized O(1); centroids are merged once the buffer is full)"""
+        value = float(value)
+        self._buffer.append((value, weight))
+        self.count += weight
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= self._buffer_size:
+            self._compress()
+
+    def merge(self, other):
+        """Fold another digest into this one"""
+        other._compress()
+        if not other.count:
+            return self
+        self._buffer.extend(zip(other._means, other._weights))
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+
+    def quantile(self, q):
+        """Estimate the q-th quantile (0 <= q <= 1), or None if the digest is empty"""
+        self._compress()
+        if not self.count:
+            return None
+        if len(self._means) == 1:
+            return self._means[0]
+
+        target = min(max(q, 0.0), 1.0) * self.count
+        centers = []
+        cumulative = 0.0
+        for weight in self._weights:
+            centers.append(cumulative + weight / 2.0)
+            cumulative += weight
+
+        if target <= centers[0]:
+            return self._interpolate(target, 0.0, centers[0], self.min, self._means[0])
+        if target >= centers[-1]:
+            return self._interpolate(target, centers[-1], self.count, self._means[-1], self.max)
+
+        i = bisect.bisect_right(centers, target) - 1
+        return self._interpolate(target, centers[i], centers[i + 1], self._means[i], self._means[i + 1])
+
+    def centroids(self):
+        """Get the merged (mean, weight) centroids"""
+        self._compress()
+        return list(zip(self._means, self._weights))
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        items = sorted(list(zip(self._means, self._weights)) + self._buffer)
+        self._buffer = []
+
+        total = float(self.count)
+        means, weights = [], []
+        current_mean, current_weight = items[0]
+        weight_so_far = 0.0
+        # Each centroid may span at most one unit of the k1 scale function,
+        # which caps the digest at about `compression` centroids with small tails
+        weight_limit = total * self._q_limit(0.0)
+        for mean, weight in items[1:]:
+            proposed = current_weight + weight
+            if weight_so_far + proposed <= weight_limit:
+                current_mean += (mean - current_mean) * weight / proposed
+                current_weight = proposed
+            else:
+                means.append(current_mean)
+                weights.append(current_weight)
+                weight_so_far += current_weight
+                weight_limit = total * self._q_limit(weight_so_far / total)
+                current_mean, current_weight = mean, weight
+        means.append(current_mean)
+        weights.append(current_weight)
+
+        self._means = means
+        self._weights = weights
+
+    def _q_limit(self, q):
+        """Largest quantile reachable from q within one unit of k1(q) = d/(2pi) asin(2q - 1)"""
+        q = min(max(q, 0.0), 1.0)
+        k = self.compression / (2 * math.pi) * math.asin(2 * q - 1) + 1
+        k = min(k, self.compression / 4)
+        return (math.sin(2 * math.pi * k / self.compression) + 1) / 2
+
+    @staticmethod
+    def _interpolate(x, x0, x1, y0, y1):
+        if x1 <= x0:
+            return y0
+        return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+def _hash64(value):
+    return int.from_bytes(hashlib.blake2b(str(value).encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class CountMinSketch:
+    """Count-Min sketch: over-estimates counts by at most ~e/width of the total, w.h.p."""
+
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._table = np.zeros((depth, width), dtype=np.uint32)
+        self._rows = np.arange(depth)
+
+    def _columns(self, key):
+        # Kirsch-Mitzenmacher: depth hash functions from one 64-bit hash
+        h = _hash64(key)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        return (h1 + self._rows * h2) % self.width
+
+    def add(self, key, count=1):
+        """Add to a key's count and return its new estimate"""
+        columns = self._columns(key)
+        self._table[self._rows, columns] += count
+        self.total += count
+        return int(self._table[self._rows, columns].min())
+
+    def estimate(self, key):
+        return int(self._table[self._rows, self._columns(key)].min())
+
+    @property
+    def nbytes(self):
+        return self._table.nbytes
+
+
+class HeavyHitters:
+    """Top keys by count: a Count-Min sketch plus a fixed-size table of candidates"""
+
+    def __init__(self, capacity=50, width=2048, depth=4):
+        self.capacity = capacity
+        self.sketch = CountMinSketch(width, depth)
+        self._candidates = {}  # key -> estimated count (at most capacity entries)
+
+    def add(self, key, count=1):
+        estimate = self.sketch.add(key, count)
+        if key in self._candidates or len(self._candidates) < self.capacity:
+            self._candidates[key] = estimate
+            return
+        smallest = min(self._candidates, key=self._candidates.get)
+        if estimate > self._candidates[smallest]:
+            del self._candidates[smallest]
+            self._candidates[key] = estimate
+
+    def top(self, limit=10):
+        ranked = sorted(((self.sketch.estimate(key), key) for key in self._candidates), reverse=True)
+        return [{"key": key, "count": count} for count, key in ranked[:limit]]
+
+    @property
+    def nbytes(self):
+        return self.sketch.nbytes
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter (~1.04 / sqrt(2^precision) relative error)"""
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.m = 1 << precision
+        self._registers = np.zeros(self.m, dtype=np.uint8)
+        self._alpha = 0.7213 / (1 + 1.079 / self.m)
+
+    def add(self, value):
+        h = _hash64(value)
+        index = h & (self.m - 1)
+        rest = h >> self.precision
+        # Rank = position of the lowest set bit in the remaining 64 - p bits
+        rank = (rest & -rest).bit_length() if rest else 64 - self.precision + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self):
+        registers = self._registers.astype(np.float64)
+        estimate = self._alpha * self.m * self.m / np.sum(np.exp2(-registers))
+        zeros = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * self.m and zeros:
+            # Small-range correction: linear counting
+            estimate = self.m * np.log(self.m / zeros)
+        return int(round(estimate))
+
+    @property
+    def nbytes(self):
+        return self._registers.nbytes
+
+
+class BloomFilter:
+    """
+    Set membership with no false negatives and a bounded false-positive rate.
+
+    Two generations are kept: once the current one holds `capacity` items it becomes
+    the previous one and a fresh filter starts, so memory stays fixed and the
+    false-positive rate stays near `error_rate` however many items are added. Items
+    last added more than two generations ago are forgotten.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self._rows = np.arange(self.hashes, dtype=np.uint64)
+        self._current = np.zeros(self.size, dtype=bool)
+        self._previous = np.zeros(self.size, dtype=bool)
+        self._count = 0
+
+    def _bits(self, value):
+        h = _hash64(value)
+        h1, h2 = np.uint64(h & 0xFFFFFFFF), np.uint64((h >> 32) | 1)
+        return (h1 + self._rows * h2) % np.uint64(self.size)
+
+    def __contains__(self, value):
+        bits = self._bits(value)
+        return bool(self._current[bits].all() or self._previous[bits].all())
+
+    def add(self, value):
+        """Add a value and return whether it was (probably) already present"""
+        bits = self._bits(value)
+        if self._current[bits].all():
+            return True
+        seen = bool(self._previous[bits].all())
+        if self._count >= self.capacity:
+            self._previous, self._current = self._current, self._previous
+            self._current[:] = False
+            self._count = 0
+        self._current[bits] = True
+        self._count += 1
+        return seen
+
+    @property
+    def nbytes(self):
+        return self._current.nbytes + self._previous.nbytes
+
+
+class JobSketches:
+    """Cross-account heavy hitters and distinct counts fed from job ingestion"""
+
+    def __init__(self, capacity=50, precision=12, seen_capacity=100000):
+        self.capacity = capacity
+        self.precision = precision
+        self._lock = threading.Lock()
+        # Jobs visible to several credentials (shared instances) are counted once
+        self._seen = BloomFilter(seen_capacity)
+        self.programs = HeavyHitters(capacity)
+        self.tags = HeavyHitters(capacity)
+        self.users = HyperLogLog(precision)
+        self._backend_users = {}  # backend -> HyperLogLog of credentials (bounded by the fleet size)
+        self._backend_instances = {}  # backend -> HyperLogLog of instances
+        self.jobs = 0
+
+    def observe(self, credential, transitions):
+        """
+        Count jobs the first time any credential sees them.
+
+        Job counts, programs and tags are deduplicated on the job id across all
+        credentials (a Bloom filter, so a rare false positive skips a new job); the
+        distinct user and instance counters record every credential that sees a job.
+
+        Args:
+            credential (str): Credential key of the account that fetched the jobs
+            transitions (list): (previous job dict or None, job dict) pairs
+        """
+        with self._lock:
+            for previous, job in transitions:
+                if previous is not None:
+                    continue
+                backend = str(job.get('backend') or 'unknown')
+                self.users.add(credential)
+                if backend not in self._backend_users:
+                    self._backend_users[backend] = HyperLogLog(self.precision)
+                    self._backend_instances[backend] = HyperLogLog(self.precision)
+                self._backend_users[backend].add(credential)
+                self._backend_instances[backend].add(job.get('instance') or 'default')
+                if job.get('id') is not None and self._seen.add(job['id']):
+                    continue
+                self.jobs += 1
+                self.programs.add(str(job.get('program_id') or 'unknown'))
+                for tag in job.get('tags') or []:
+                    self.tags.add(str(tag))
+
+    def summary(self, limit=10):
+        with self._lock:
+            backends = {
+                backend: {
+                    "distinct_users": self._backend_users[backend].count(),
+                    "distinct_instances": self._backend_instances[backend].count()
+                }
+                for backend in sorted(self._backend_users)
+            }
+            memory = (self.programs.nbytes + self.tags.nbytes + self.users.nbytes + self._seen.nbytes +
+                      sum(h.nbytes for h in self._backend_users.values()) +
+                      sum(h.nbytes for h in self._backend_instances.values()))
+            return {
+                "jobs_observed": self.jobs,
+                "top_programs": self.programs.top(limit),
+                "top_tags": self.tags.top(limit),
+                "distinct_users": self.users.count(),
+                "backends": backends,
+                "sketch_bytes": memory
+            }
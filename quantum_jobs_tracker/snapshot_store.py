@@ -0,0 +1,197 @@
+"""
+Snapshot Store Module
+Point-in-time reconstruction of dashboard state. Each refresh of a stream (the public
+backend fleet, or one credential's jobs) persists only a compressed delta against the
+previous state; every N deltas a full checkpoint is written. Reading the state at a
+time seeks to the nearest earlier checkpoint and replays the few deltas after it.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+try:
+    from .data_paths import user_data_dir
+except ImportError:
+    from data_paths import user_data_dir
+
+DEFAULT_DB_PATH = os.environ.get('QUANTUM_SNAPSHOT_DB', user_data_dir('snapshots.db'))
+
+CHECKPOINT_INTERVAL = 50  # deltas between full checkpoints
+RETENTION_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    stream TEXT NOT NULL,
+    ts REAL NOT NULL,
+    checkpoint INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS snapshots_by_time ON snapshots (stream, ts);
+CREATE INDEX IF NOT EXISTS checkpoints_by_time ON snapshots (stream, ts) WHERE checkpoint = 1;
+"""
+
+
+def _encode(value):
+    return zlib.compress(json.dumps(value, separators=(',', ':'), default=str).encode('utf-8'))
+
+
+def _decode(blob):
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+
+class _Stream:
+    """Latest persisted state of one stream, kept to diff the next refresh against"""
+
+    def __init__(self, records, deltas_since_checkpoint):
+        self.records = records  # key -> record dict
+        self.fingerprints = {key: json.dumps(record, sort_keys=True, default=str) for key, record in records.items()}
+        self.deltas = deltas_since_checkpoint
+
+
+class SnapshotStore:
+    """SQLite log of state checkpoints and deltas per stream"""
+
+    def __init__(self, path=DEFAULT_DB_PATH, checkpoint_interval=CHECKPOINT_INTERVAL,
+                 retention_days=RETENTION_DAYS):
+        """
+        Args:
+            path (str): SQLite database file
+            checkpoint_interval (int): Deltas written between two full checkpoints
+            retention_days (int): Days of history kept (older checkpoints and deltas are pruned)
+        """
+        self.path = path
+        self.checkpoint_interval = checkpoint_interval
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._conn = None  # opened on first use
+        self._streams = {}  # stream -> _Stream
+
+    def _connection(self):
+        if self._conn is None:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def record(self, stream, records, replace=True, expired=None, now=None):
+        """
+        Persist the change of a stream's state since its previous refresh.
+
+        Args:
+            stream (str): Stream name, e.g. "fleet" or "jobs:<credential>"
+            records (dict): Key -> record dict for this refresh
+            replace (bool): Whether keys missing from records were removed (a full
+                            listing) or just not part of this refresh (a partial one)
+            expired (callable): record -> whether it has aged out of the state; expired
+                                records are dropped as removals, which keeps the state of
+                                partially refreshed streams bounded
+            now (float): Snapshot time (defaults to now)
+
+        Returns:
+            bool: Whether anything was written
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            conn = self._connection()
+            state = self._stream(conn, stream, now)
+
+            stale = set()
+            if expired is not None:
+                stale = {key for key, record in records.items() if expired(record)}
+                stale.update(key for key, record in state.records.items() if key not in records and expired(record))
+            fingerprints = {key: json.dumps(record, sort_keys=True, default=str)
+                            for key, record in records.items() if key not in stale}
+            upserts = {key: records[key] for key, fingerprint in fingerprints.items()
+                       if state.fingerprints.get(key) != fingerprint}
+            removed = [key for key in state.records if key in stale or (replace and key not in records)]
+            if not upserts and not removed:
+                return False
+
+            for key in removed:
+                del state.records[key]
+                del state.fingerprints[key]
+            state.records.update(upserts)
+            state.fingerprints.update((key, fingerprints[key]) for key in upserts)
+
+            with conn:
+                if state.deltas >= self.checkpoint_interval:
+                    conn.execute('INSERT INTO snapshots (stream, ts, checkpoint, payload) VALUES (?, ?, 1, ?)',
+                                 (stream, now, _encode(state.records)))
+                    state.deltas = 0
+                    self._prune(conn, stream, now)
+                else:
+                    conn.execute('INSERT INTO snapshots (stream, ts, checkpoint, payload) VALUES (?, ?, 0, ?)',
+                                 (stream, now, _encode({"upserts": upserts, "removed": removed})))
+                    state.deltas += 1
+            return True
+
+    def state_at(self, stream, at):
+        """
+        Reconstruct a stream's state as of a time.
+
+        Args:
+            stream (str): Stream name
+            at (float): Epoch seconds
+
+        Returns:
+            tuple: (key -> record dict, timestamp of the last change applied) or (None, None)
+                   if nothing was recorded before the time
+        """
+        with self._lock:
+            return self._load(self._connection(), stream, at)
+
+    def streams(self):
+        with self._lock:
+            return [row[0] for row in self._connection().execute('SELECT DISTINCT stream FROM snapshots')]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _stream(self, conn, stream, now):
+        state = self._streams.get(stream)
+        if state is None:
+            # Resume from what is on disk; a fresh stream (or restart) opens with a checkpoint
+            records, _ = self._load(conn, stream, now)
+            state = self._streams[stream] = _Stream(records or {}, self.checkpoint_interval)
+        return state
+
+    @staticmethod
+    def _load(conn, stream, at):
+        checkpoint = conn.execute(
+            """SELECT ts, payload FROM snapshots
+               WHERE stream = ? AND checkpoint = 1 AND ts <= ? ORDER BY ts DESC LIMIT 1""",
+            (stream, at)).fetchone()
+        if checkpoint is None:
+            return None, None
+        since, payload = checkpoint
+        deltas = conn.execute(
+            """SELECT ts, payload FROM snapshots
+               WHERE stream = ? AND checkpoint = 0 AND ts > ? AND ts <= ? ORDER BY ts""",
+            (stream, since, at)).fetchall()
+
+        records = _decode(payload)
+        applied = since
+        for ts, delta in deltas:
+            delta = _decode(delta)
+            for key in delta["removed"]:
+                records.pop(key, None)
+            records.update(delta["upserts"])
+            applied = ts
+        return records, applied
+
+    def _prune(self, conn, stream, now):
+        """Drop everything before the newest checkpoint that is older than the retention window"""
+        cutoff = conn.execute(
+            """SELECT MAX(ts) FROM snapshots WHERE stream = ? AND checkpoint = 1 AND ts <= ?""",
+            (stream, now - self.retention_days * 86400)).fetchone()[0]
+        if cutoff is not None:
+            conn.execute('DELETE FROM snapshots WHERE stream = ? AND ts < ?', (stream, cutoff))
@@ -20,6 +20,7 @@ class QuantumDashboard {
         this.animationId = null;
         this.circuitAnimationId = null;
         this.updateInterval = null;
+        this.eventSource = null;
 
         // Initialize with more realistic quantum states
         this.quantumStates = this.generateRealisticQuantumStates();
@@ -301,8 +302,9 @@ class QuantumDashboard {
     }
 
     // Real-time data fetching methods
-    async fetchMetrics() {
-        const data = await this.safeApiCall('/api/metrics', 'Metrics API not available');
+    async fetchMetrics(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/metrics', 'Metrics API not available');
 
         if (data === null) {
             // Use fallback data
@@ -346,8 +348,9 @@ class QuantumDashboard {
         }
     }
 
-    async fetchMeasurementResults() {
-        const data = await this.safeApiCall('/api/measurement_results', 'Measurement results API not available');
+    async fetchMeasurementResults(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/measurement_results', 'Measurement results API not available');
 
         if (data === null) {
             return false;
@@ -365,8 +368,9 @@ class QuantumDashboard {
         }
     }
 
-    async fetchEntanglementData() {
-        const data = await this.safeApiCall('/api/entanglement_data', 'Entanglement data API not available');
+    async fetchEntanglementData(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/entanglement_data', 'Entanglement data API not available');
 
         if (data === null) {
             return false;
@@ -384,8 +388,9 @@ class QuantumDashboard {
         }
     }
 
-    async fetchQuantumStateData() {
-        const data = await this.safeApiCall('/api/quantum_state_data', 'Quantum state data API not available');
+    async fetchQuantumStateData(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/quantum_state_data', 'Quantum state data API not available');
 
         if (data === null) {
             return false;
@@ -1470,8 +1475,9 @@ ${'─'.repeat(25)}\n`;
         }
     }
 
-    async fetchBackends() {
-        const data = await this.safeApiCall('/api/backends', 'Backends API not available');
+    async fetchBackends(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/backends', 'Backends API not available');
 
         if (data === null) {
             this.state.backends = [];
@@ -1504,8 +1510,9 @@ ${'─'.repeat(25)}\n`;
         }
     }
 
-    async fetchJobs() {
-        const data = await this.safeApiCall('/api/jobs', 'Jobs API not available');
+    async fetchJobs(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/jobs', 'Jobs API not available');
 
         if (data === null) {
             this.state.jobs = [];
@@ -1784,13 +1791,100 @@ ${'─'.repeat(25)}\n`;
     }
 
     startRealTimeUpdates() {
-        // Update every 30 seconds
-        this.updateInterval = setInterval(() => {
-            this.updateAllWidgets();
-        }, 30000);
+        // Deltas are pushed over Server-Sent Events; poll the bundle only without EventSource support
+        if (this.eventSource || this.updateInterval) {
+            return;
+        }
+        if (!window.EventSource) {
+            this.startPolling();
+            return;
+        }
+
+        this.eventSource = new EventSource('/api/stream');
+        this.eventSource.addEventListener('backends', (event) => {
+            // Deltas omit the visualization images, so merge into the entries we already have
+            this.state.backends = this.applyDelta(this.state.backends, JSON.parse(event.data), 'name');
+            this.updateBackendsWidget();
+        });
+        this.eventSource.addEventListener('jobs', (event) => {
+            this.state.jobs = this.applyDelta(this.state.jobs, JSON.parse(event.data), 'id');
+            this.updateJobsWidget();
+            // Metrics arrive as their own event; circuit and state widgets are reloaded only on resync
+            this.updateMetricsWidgets();
+        });
+        this.eventSource.addEventListener('metrics', (event) => {
+            const delta = JSON.parse(event.data);
+            if (delta.upserts.metrics) {
+                this.fetchMetrics({connected: true, metrics: delta.upserts.metrics});
+            }
+        });
+        this.eventSource.addEventListener('resync', () => {
+            // Missed events could not be replayed - reload everything once
+            console.log('🔄 Event stream resync requested');
+            this.updateAllWidgetsFromBundle();
+        });
+        this.eventSource.onerror = () => {
+            // EventSource reconnects by itself; a closed stream (401/503) falls back to polling
+            if (this.eventSource.readyState === EventSource.CLOSED) {
+                console.log('⚠️ Event stream closed, falling back to polling');
+                this.eventSource = null;
+                this.startPolling();
+            }
+        };
+    }
+
+    startPolling() {
+        // Update every 30 seconds with one bundled request instead of one per widget
+        if (!this.updateInterval) {
+            this.updateInterval = setInterval(() => {
+                this.updateAllWidgetsFromBundle();
+            }, 30000);
+        }
+    }
+
+    applyDelta(items, delta, key) {
+        const merged = new Map(items.map(item => [item[key], item]));
+        (delta.removed || []).forEach(id => merged.delete(id));
+        Object.entries(delta.upserts || {}).forEach(([id, item]) => {
+            merged.set(id, {...(merged.get(id) || {}), ...item});
+        });
+        return Array.from(merged.values());
+    }
+
+    async updateAllWidgetsFromBundle() {
+        const bundle = await this.safeApiCall('/api/dashboard_bundle', 'Dashboard bundle API not available');
+
+        if (bundle === null || !bundle.sections) {
+            // Older server or bundle failure - fall back to the per-widget endpoints
+            return this.updateAllWidgets();
+        }
+
+        const sections = bundle.sections;
+        // A missing section (null) takes each widget's normal "API not available" path
+        const section = (name) => sections[name] === undefined ? null : sections[name];
+        try {
+            await Promise.all([
+                this.fetchMetrics(section('metrics')),
+                this.fetchMeasurementResults(section('measurement_results')),
+                this.fetchEntanglementData(section('entanglement')),
+                this.fetchQuantumStateData(section('quantum_state')),
+                this.fetchCircuitData(section('circuit')),
+                this.fetchBackends(section('backends')),
+                this.fetchJobs(section('jobs'))
+            ]);
+            console.log(`✅ All widgets updated from dashboard bundle (${(bundle.cached_sections || []).length} cached sections)`);
+
+            this.updateMetricsWidgets();
+        } catch (error) {
+            console.error('❌ Error updating widgets from bundle:', error);
+        }
     }
 
     stopRealTimeUpdates() {
+        if (this.eventSource) {
+            this.eventSource.close();
+            this.eventSource = null;
+        }
         if (this.updateInterval) {
             clearInterval(this.updateInterval);
             this.updateInterval = null;
@@ -1798,8 +1892,9 @@ ${'─'.repeat(25)}\n`;
     }
 
     // 3D Circuit Widget Enhancement
-    async fetchCircuitData() {
-        const data = await this.safeApiCall('/api/circuit_data', 'Circuit data API not available');
+    async fetchCircuitData(prefetched) {
+        // Sections of /api/dashboard_bundle are passed in; standalone refreshes fetch their own
+        const data = prefetched !== undefined ? prefetched : await this.safeApiCall('/api/circuit_data', 'Circuit data API not available');
 
         if (data === null) {
             return false;
@@ -3601,18 +3696,6 @@ ${'─'.repeat(25)}\n`;
         return Math.abs(hash) % maxValue;
     }
 
-    startRealTimeUpdates() {
-        // Update all data every 30 seconds
-        setInterval(() => {
-            this.loadAllData();
-        }, 30000);
-
-        // Update metrics every 5 seconds
-        setInterval(() => {
-            this.updateMetrics();
-        }, 5000);
-    }
-
     handleResize() {
         // Clean up existing animations
         this.cleanupAnimations();
@@ -0,0 +1,198 @@
+"""
+Static Assets Module
+Build-free asset pipeline for the dashboard's static files. Every file gets a
+content-hash fingerprinted URL, so responses can be cached forever as immutable;
+compressible files are precompressed once per content hash into gzip (and brotli,
+when the optional `brotli` package is installed) variants on disk, so requests are
+served straight from files the server can sendfile() without compressing anything.
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import threading
+
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+    _HAS_BROTLI = True
+except ImportError:
+    _HAS_BROTLI = False
+
+try:
+    from .data_paths import user_data_dir
+except ImportError:
+    from data_paths import user_data_dir
+
+DEFAULT_CACHE_PATH = os.environ.get('QUANTUM_STATIC_CACHE', user_data_dir('static_cache'))
+
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_SIZE = 1024  # smaller files are not worth a variant
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+class Asset:
+    """One static file and its fingerprint"""
+
+    def __init__(self, name, path, stat, digest):
+        self.name = name
+        self.path = path
+        self.mtime = stat.st_mtime_ns
+        self.size = stat.st_size
+        self.digest = digest
+        self.mimetype = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+        stem, ext = os.path.splitext(name)
+        self.fingerprinted = f"{stem}.{digest}{ext}"
+
+    @property
+    def compressible(self):
+        return self.size >= MIN_COMPRESS_SIZE and self.mimetype.startswith(COMPRESSIBLE_TYPES)
+
+
+class StaticAssets:
+    """Fingerprint manifest and precompressed variants of a static folder"""
+
+    def __init__(self, static_folder, cache_path=DEFAULT_CACHE_PATH):
+        """
+        Args:
+            static_folder (str): Directory holding the source assets
+            cache_path (str): Directory for precompressed variants (keyed by content hash)
+        """
+        self.static_folder = static_folder
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._assets = {}  # name -> Asset
+        self._fingerprints = {}  # fingerprinted name -> name
+        self._build_locks = {}  # variant path -> Lock, so each variant is compressed once
+
+    def asset(self, name):
+        """
+        Get an asset by its source name, re-hashing it if the file changed on disk.
+
+        Returns:
+            Asset: The asset, or None if the file does not exist
+        """
+        path = safe_join(self.static_folder, name)
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if not os.path.isfile(path):
+            return None
+        with self._lock:
+            asset = self._assets.get(name)
+            if asset is not None and asset.mtime == stat.st_mtime_ns and asset.size == stat.st_size:
+                return asset
+        with open(path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=6).hexdigest()
+        asset = Asset(name, path, stat, digest)
+        with self._lock:
+            previous = self._assets.get(name)
+            if previous is not None:
+                self._fingerprints.pop(previous.fingerprinted, None)
+            self._assets[name] = asset
+            self._fingerprints[asset.fingerprinted] = name
+        return asset
+
+    def url_name(self, name):
+        """Fingerprinted file name of an asset (the source name if it does not exist)"""
+        asset = self.asset(name)
+        return asset.fingerprinted if asset else name
+
+    def resolve(self, fingerprinted):
+        """
+        Map a fingerprinted name back to its asset.
+
+        Returns:
+            tuple: (Asset or None, bool whether the fingerprint is the current one)
+        """
+        with self._lock:
+            name = self._fingerprints.get(fingerprinted)
+        if name is not None:
+            asset = self.asset(name)
+            return asset, asset is not None and asset.fingerprinted == fingerprinted
+        # Not hashed yet (first request after a restart) or an outdated fingerprint
+        stem, ext = os.path.splitext(fingerprinted)
+        name = os.path.splitext(stem)[0] + ext
+        if name == fingerprinted:
+            return None, False
+        asset = self.asset(name)
+        return asset, asset is not None and asset.fingerprinted == fingerprinted
+
+    def variant(self, asset, accept_encodings):
+        """
+        Pick the file to send for an asset given the client's accepted encodings.
+
+        Args:
+            asset (Asset): Asset to serve
+            accept_encodings (iterable): Content codings the client accepts
+
+        Returns:
+            tuple: (file path, content coding or None for the identity file)
+        """
+        if asset.compressible:
+            if _HAS_BROTLI and 'br' in accept_encodings:
+                path = self._variant_path(asset, 'br')
+                # Brotli at maximum quality is slow on the big bundles - only serve it once warmed
+                if os.path.exists(path):
+                    return path, 'br'
+            if 'gzip' in accept_encodings:
+                try:
+                    return self._build(asset, 'gz'), 'gzip'
+                except OSError as e:
+                    # Unwritable cache (read-only install) - the uncompressed file still works
+                    print(f"⚠️ Could not precompress {asset.name}: {e}")
+        return asset.path, None
+
+    def precompress(self):
+        """Build every variant of every compressible asset (run once in the background)"""
+        built = 0
+        for root, _, files in os.walk(self.static_folder):
+            for filename in files:
+                name = os.path.relpath(os.path.join(root, filename), self.static_folder).replace(os.sep, '/')
+                asset = self.asset(name)
+                if asset is None or not asset.compressible:
+                    continue
+                try:
+                    self._build(asset, 'gz')
+                    if _HAS_BROTLI:
+                        self._build(asset, 'br')
+                except OSError as e:
+                    print(f"⚠️ Could not precompress static assets into {self.cache_path}: {e}")
+                    return built
+                built += 1
+        return built
+
+    def _variant_path(self, asset, suffix):
+        stem, _ = os.path.splitext(os.path.basename(asset.name))
+        return os.path.join(self.cache_path, f"{stem}.{asset.digest}.{suffix}")
+
+    def _build(self, asset, suffix):
+        path = self._variant_path(asset, suffix)
+        if os.path.exists(path):
+            return path
+        with self._lock:
+            build_lock = self._build_locks.setdefault(path, threading.Lock())
+        with build_lock:
+            if os.path.exists(path):
+                return path
+            with open(asset.path, 'rb') as f:
+                content = f.read()
+            if suffix == 'br':
+                compressed = brotli.compress(content, quality=11)
+            else:
+                compressed = gzip.compress(content, compresslevel=9, mtime=0)
+            os.makedirs(self.cache_path, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a partial file
+            partial = f"{path}.{os.getpid()}.tmp"
+            with open(partial, 'wb') as f:
+                f.write(compressed)
+            os.replace(partial, path)
+            print(f"🗜️ Precompressed {asset.name} ({suffix}): {asset.size} -> {len(compressed)} bytes")
+        with self._lock:
+            self._build_locks.pop(path, None)
+        return path
@@ -0,0 +1,254 @@
+"""
+Webhooks Module
+Outbound webhook subscriptions for job state transitions. The job sync only appends
+events to bounded per-subscription queues; a background dispatcher batches them into
+JSON POSTs sent from a small worker pool, with retries and exponential backoff per
+subscription, so slow or unreachable receivers never stall ingestion or each other.
+Receiver URLs must resolve to public addresses.
+"""
+
+import collections
+import concurrent.futures
+import hashlib
+import hmac
+import ipaddress
+import json
+import socket
+import threading
+import time
+import urllib.parse
+import uuid
+
+import requests
+
+
+def validate_url(url, allow_private=False):
+    """
+    Check that a webhook URL is http(s) and resolves only to public addresses.
+
+    Args:
+        url (str): Receiver URL
+        allow_private (bool): Also accept loopback, private and link-local hosts
+
+    Raises:
+        ValueError: If the URL is not acceptable
+    """
+    parsed = urllib.parse.urlsplit(str(url))
+    if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+        raise ValueError("Webhook url must be an http(s) URL")
+    if allow_private:
+        return
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(parsed.hostname, parsed.port or 443,
+                                                               proto=socket.IPPROTO_TCP)}
+    except (socket.gaierror, UnicodeError) as e:
+        raise ValueError(f"Webhook host {parsed.hostname} cannot be resolved: {e}")
+    for address in addresses:
+        if not ipaddress.ip_address(address.split('%')[0]).is_global:
+            raise ValueError(f"Webhook host {parsed.hostname} resolves to a non-public address")
+
+
+class WebhookSubscription:
+    """A receiver URL with optional backend / status filters and its delivery state"""
+
+    def __init__(self, credential, url, backends=None, statuses=None, secret=None, max_backlog=1000):
+        self.id = uuid.uuid4().hex
+        self.credential = credential
+        self.url = url
+        self.backends = {b.lower() for b in backends} if backends else None
+        self.statuses = {s.upper() for s in statuses} if statuses else None
+        self.secret = secret
+        self.created = time.time()
+        self.queue = collections.deque(maxlen=max_backlog)
+        self.attempts = 0
+        self.next_attempt = 0.0
+        self.delivered = 0
+        self.failed = 0
+        self.dropped = 0
+        self.last_error = None
+        self.last_delivery = None
+        self.in_flight = False  # a batch is being delivered; the next waits for it (keeps order)
+
+    def matches(self, job):
+        if self.backends is not None and str(job.get('backend', '')).lower() not in self.backends:
+            return False
+        if self.statuses is not None and str(job.get('status', '')).upper() not in self.statuses:
+            return False
+        return True
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "url": self.url,
+            "backends": sorted(self.backends) if self.backends else None,
+            "statuses": sorted(self.statuses) if self.statuses else None,
+            "signed": bool(self.secret),
+            "created": self.created,
+            "pending": len(self.queue),
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "dropped": self.dropped,
+            "last_error": self.last_error,
+            "last_delivery": self.last_delivery
+        }
+
+
+class WebhookDispatcher:
+    """Subscription registry plus asynchronous, batched webhook delivery"""
+
+    def __init__(self, batch_size=20, max_backlog=1000, max_retries=5, timeout=5.0, max_backoff=300.0,
+                 workers=4, allow_private=False):
+        """
+        Args:
+            batch_size (int): Maximum events per POST
+            max_backlog (int): Events queued per subscription before the oldest are dropped
+            max_retries (int): Failed attempts before a batch is discarded
+            timeout (float): HTTP timeout per delivery in seconds
+            max_backoff (float): Upper bound of the retry delay in seconds
+            workers (int): Deliveries in flight at once (to different subscriptions)
+            allow_private (bool): Accept receivers on loopback / private networks (local testing)
+        """
+        self.batch_size = batch_size
+        self.max_backlog = max_backlog
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.workers = workers
+        self.allow_private = allow_private
+        self._lock = threading.Lock()
+        self._subscriptions = {}  # subscription id -> WebhookSubscription
+        self._wake = threading.Event()
+        self._worker = None
+        self._pool = None
+
+    def subscribe(self, credential, url, backends=None, statuses=None, secret=None):
+        """Register a receiver for the job transitions of a credential"""
+        validate_url(url, self.allow_private)
+        subscription = WebhookSubscription(credential, url, backends, statuses, secret, self.max_backlog)
+        with self._lock:
+            self._subscriptions[subscription.id] = subscription
+            self._ensure_worker()
+        return subscription
+
+    def unsubscribe(self, credential, subscription_id):
+        """Remove a subscription owned by a credential"""
+        with self._lock:
+            subscription = self._subscriptions.get(subscription_id)
+            if subscription is None or subscription.credential != credential:
+                return False
+            del self._subscriptions[subscription_id]
+            return True
+
+    def subscriptions(self, credential):
+        with self._lock:
+            return [s.to_dict() for s in self._subscriptions.values() if s.credential == credential]
+
+    def publish(self, credential, transitions):
+        """
+        Queue webhook events for observed job state changes (never blocks on delivery).
+
+        Args:
+            credential (str): Credential key the jobs belong to
+            transitions (list): (previous job dict or None, job dict) pairs
+        """
+        now = time.time()
+        queued = False
+        with self._lock:
+            subscriptions = [s for s in self._subscriptions.values() if s.credential == credential]
+            if not subscriptions:
+                return
+            for previous, job in transitions:
+                # Jobs seen for the first time (e.g. after a restart) are not transitions
+                if previous is None:
+                    continue
+                event = {
+                    "event": "job.status_changed",
+                    "job_id": job.get('id'),
+                    "backend": job.get('backend'),
+                    "status": job.get('status'),
+                    "previous_status": previous.get('status'),
+                    "job": job,
+                    "timestamp": now
+                }
+                for subscription in subscriptions:
+                    if subscription.matches(job):
+                        if len(subscription.queue) == subscription.queue.maxlen:
+                            subscription.dropped += 1
+                        subscription.queue.append(event)
+                        queued = True
+        if queued:
+            self._wake.set()
+
+    def _ensure_worker(self):
+        if self._pool is None:
+            self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers,
+                                                               thread_name_prefix='webhook-delivery')
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name='webhook-dispatch', daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(timeout=1.0)
+            self._wake.clear()
+            # Each subscription has at most one batch in flight, so a slow receiver only
+            # holds up its own queue while the pool keeps delivering to the others
+            for subscription, batch in self._due_batches():
+                self._pool.submit(self._deliver, subscription, batch)
+
+    def _due_batches(self):
+        now = time.time()
+        batches = []
+        with self._lock:
+            for subscription in self._subscriptions.values():
+                if subscription.queue and not subscription.in_flight and subscription.next_attempt <= now:
+                    count = min(self.batch_size, len(subscription.queue))
+                    subscription.in_flight = True
+                    batches.append((subscription, [subscription.queue.popleft() for _ in range(count)]))
+        return batches
+
+    def _deliver(self, subscription, batch):
+        body = json.dumps({
+            "subscription_id": subscription.id,
+            "events": batch,
+            "sent_at": time.time()
+        }, default=str).encode('utf-8')
+        headers = {"Content-Type": "application/json"}
+        if subscription.secret:
+            signature = hmac.new(subscription.secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+            headers["X-Webhook-Signature"] = f"sha256={signature}"
+
+        try:
+            # Re-checked per delivery: the host may resolve differently than at subscribe time
+            validate_url(subscription.url, self.allow_private)
+            response = requests.post(subscription.url, data=body, headers=headers, timeout=self.timeout,
+                                     allow_redirects=False)
+            response.raise_for_status()
+        except Exception as e:
+            with self._lock:
+                subscription.in_flight = False
+                subscription.attempts += 1
+                subscription.last_error = str(e)
+                if subscription.attempts > self.max_retries:
+                    print(f"⚠️ Webhook {subscription.url} failed {subscription.attempts} times, dropping {len(batch)} events")
+                    subscription.failed += len(batch)
+                    subscription.attempts = 0
+                    subscription.next_attempt = 0.0
+                else:
+                    # Put the batch back in order, unless newer events already filled the backlog
+                    room = subscription.queue.maxlen - len(subscription.queue)
+                    for event in reversed(batch[:room]):
+                        subscription.queue.appendleft(event)
+                    subscription.dropped += len(batch) - min(room, len(batch))
+                    subscription.next_attempt = time.time() + min(2 ** subscription.attempts, self.max_backoff)
+            return
+
+        with self._lock:
+            subscription.in_flight = False
+            subscription.delivered += len(batch)
+            subscription.attempts = 0
+            subscription.next_attempt = 0.0
+            subscription.last_error = None
+            subscription.last_delivery = time.time()
+            if subscription.queue:
+                self._wake.set()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Test webhook delivery against a local receiver
+"""
+
+import hashlib
+import hmac
+import json
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+sys.path.append(os.path.join(os.path.dirname(__file__), 'quantum_jobs_tracker'))
+
+from webhooks import WebhookDispatcher
+
+
+class Receiver:
+    """Local http.server that records the webhook POSTs it gets"""
+
+    def __init__(self, delay=0.0):
+        self.requests = []
+        self.delay = delay
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                time.sleep(receiver.delay)
+                receiver.requests.append((dict(self.headers), body, time.time()))
+                self.send_response(204)
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/hook"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def wait(self, count, timeout=5.0):
+        deadline = time.time() + timeout
+        while len(self.requests) < count and time.time() < deadline:
+            time.sleep(0.05)
+        return len(self.requests) >= count
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def transition(job_id, previous, status):
+    job = {"id": job_id, "backend": "ibm_brisbane", "status": status}
+    return (dict(job, status=previous), job)
+
+
+def test_rejects_private_urls():
+    print("🧪 Testing webhook URL validation...")
+    dispatcher = WebhookDispatcher()
+    for url in ['ftp://example.com/hook', 'http:///hook', 'http://127.0.0.1:8080/hook',
+                'http://localhost/hook', 'http://169.254.169.254/latest/meta-data',
+                'http://10.0.0.5/hook', 'http://[::1]/hook']:
+        try:
+            dispatcher.subscribe('cred', url)
+        except ValueError as e:
+            print(f"✅ Rejected {url}: {e}")
+        else:
+            raise AssertionError(f"{url} should have been rejected")
+    assert dispatcher.subscriptions('cred') == []
+
+
+def test_delivers_signed_batches():
+    print("🧪 Testing signed webhook delivery...")
+    receiver = Receiver()
+    try:
+        dispatcher = WebhookDispatcher(allow_private=True)
+        dispatcher.subscribe('cred', receiver.url, secret='s3cret')
+        dispatcher.publish('cred', [transition('job-1', 'QUEUED', 'RUNNING'),
+                                    (None, {"id": "job-2", "status": "QUEUED"})])
+        assert receiver.wait(1), "no webhook received"
+        headers, body, _ = receiver.requests[0]
+        payload = json.loads(body)
+        assert [e['job_id'] for e in payload['events']] == ['job-1']
+        assert payload['events'][0]['previous_status'] == 'QUEUED'
+        expected = hmac.new(b's3cret', body, hashlib.sha256).hexdigest()
+        assert headers['X-Webhook-Signature'] == f"sha256={expected}"
+        print("✅ Transition delivered with a valid signature")
+    finally:
+        receiver.close()
+
+
+def test_slow_receiver_does_not_block_others():
+    print("🧪 Testing that a slow receiver does not delay the others...")
+    slow, fast = Receiver(delay=2.0), Receiver()
+    try:
+        dispatcher = WebhookDispatcher(allow_private=True)
+        dispatcher.subscribe('cred', slow.url)
+        dispatcher.subscribe('cred', fast.url)
+        started = time.time()
+        dispatcher.publish('cred', [transition('job-1', 'QUEUED', 'RUNNING')])
+        assert fast.wait(1), "fast receiver got nothing"
+        assert fast.requests[0][2] - started < 1.5, "fast receiver waited on the slow one"
+        assert slow.wait(1), "slow receiver got nothing"
+        print("✅ Fast receiver was served while the slow one was still busy")
+    finally:
+        slow.close()
+        fast.close()
+
+
+if __name__ == '__main__':
+    try:
+        test_rejects_private_urls()
+        test_delivers_signed_batches()
+        test_slow_receiver_does_not_block_others()
+    except AssertionError as e:
+        print(f"\n❌ Webhook test failed: {e}")
+        sys.exit(1)
+    print("\n✅ WEBHOOK DELIVERY VERIFIED")